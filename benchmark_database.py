@@ -0,0 +1,155 @@
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import importlib
+import statistics
+import tempfile
+import threading
+import django
+
+# Set up Django environment
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'techblog.settings')
+django.setup()
+
+from django.contrib.auth.models import User
+from django.db import OperationalError, close_old_connections, connection, connections, transaction
+from django.test import override_settings
+from django.test.utils import setup_test_environment
+from tech.database import current_pragmas
+from tech.models import Tutorial, Article
+
+
+def seed() -> None:
+    author = User.objects.create_user(username='bench', password='bench-password')
+    Tutorial.objects.bulk_create(
+        Tutorial(title=f'Tutorial {i}', description='Benchmark tutorial', content='Some **text** ' * 50, author=author)
+        for i in range(300)
+    )
+    Article.objects.bulk_create(
+        Article(title=f'Article {i}', content='Some *text* ' * 50, author=author)
+        for i in range(300)
+    )
+
+
+def profiles() -> dict[str, tuple[dict, dict]]:
+    """Label -> (database settings, TECH_SQLITE_PRAGMAS)"""
+    os.environ.setdefault('DJANGO_SECRET_KEY', 'benchmark')
+    production = importlib.import_module('techblog.settings_production')
+    return {
+        'default': ({'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False, 'OPTIONS': {}}, {}),
+        'production': (production.DATABASES['default'], production.TECH_SQLITE_PRAGMAS),
+    }
+
+
+def read(ids: list[int]) -> None:
+    """What the tutorials list and an article detail page query"""
+    list(Tutorial.objects.defer('content', 'content_html').order_by('-created_at')[:12])
+    Article.objects.prefetch_related('tags').get(pk=random.choice(ids))
+
+
+def write(author_id: int, tutorial_ids: list[int], n: int) -> None:
+    """What add_article and edit_tutorial do"""
+    with transaction.atomic():
+        if n % 2:
+            Article.objects.create(title=f'New article {n}', content='Fresh *text*', author_id=author_id)
+        else:
+            tutorial = Tutorial.objects.get(pk=random.choice(tutorial_ids))
+            tutorial.description = f'Edited {n}'
+            tutorial.save()
+
+
+def worker(kind: str, deadline: float, results: dict, lock: threading.Lock, context: dict) -> None:
+    latencies, errors, n = [], 0, 0
+    while time.perf_counter() < deadline:
+        n += 1
+        started = time.perf_counter()
+        try:
+            if kind == 'read':
+                read(context['article_ids'])
+            else:
+                write(context['author_id'], context['tutorial_ids'], n)
+            latencies.append(time.perf_counter() - started)
+        except OperationalError:
+            errors += 1
+        # End of "request": closes the connection unless CONN_MAX_AGE keeps it
+        close_old_connections()
+    connection.close()
+    with lock:
+        results[kind]['latencies'] += latencies
+        results[kind]['errors'] += errors
+
+
+def run(seed_path: str, path: str, database: dict, pragmas: dict, readers: int, writers: int, seconds: float) -> dict:
+    shutil.copyfile(seed_path, path)
+    connections.close_all()
+    settings_dict = connections.settings['default']
+    settings_dict.update(NAME=path, CONN_MAX_AGE=database['CONN_MAX_AGE'],
+                         CONN_HEALTH_CHECKS=database['CONN_HEALTH_CHECKS'], OPTIONS=dict(database['OPTIONS']))
+    with override_settings(TECH_SQLITE_PRAGMAS=pragmas):
+        context = {
+            'author_id': User.objects.get(username='bench').pk,
+            'tutorial_ids': list(Tutorial.objects.values_list('pk', flat=True)),
+            'article_ids': list(Article.objects.values_list('pk', flat=True)),
+        }
+        in_effect = current_pragmas(connection, ['journal_mode', 'synchronous', 'cache_size', 'mmap_size'])
+        connection.close()
+        results = {kind: {'latencies': [], 'errors': 0} for kind in ('read', 'write')}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+        threads = [
+            threading.Thread(target=worker, args=(kind, deadline, results, lock, context))
+            for kind, count in (('read', readers), ('write', writers)) for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    results['pragmas'] = in_effect
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Concurrent read/write throughput on SQLite with default and production settings')
+    parser.add_argument('--readers', type=int, default=6, help='Reader threads')
+    parser.add_argument('--writers', type=int, default=2, help='Writer threads')
+    parser.add_argument('--seconds', type=float, default=5, help='Duration of each run')
+    args = parser.parse_args()
+
+    setup_test_environment()
+    directory = tempfile.mkdtemp()
+    seed_path = os.path.join(directory, 'seed.sqlite3')
+    # A file-backed throwaway test database, so db.sqlite3 is never touched
+    connections.settings['default']['TEST']['NAME'] = seed_path
+    old_name = connection.creation.create_test_db(verbosity=0)
+    totals = {}
+    try:
+        seed()
+        connections.close_all()
+        print(f'{args.readers} readers and {args.writers} writers for {args.seconds:g}s per profile')
+        print(f"\n  {'profile':<11} {'reads/s':>9} {'writes/s':>9} {'read p95 ms':>12} {'write p95 ms':>13} {'locked':>7}")
+        for label, (database, pragmas) in profiles().items():
+            results = run(seed_path, os.path.join(directory, f'{label}.sqlite3'), database, pragmas,
+                          args.readers, args.writers, args.seconds)
+            rates, p95s = {}, {}
+            for kind in ('read', 'write'):
+                latencies = results[kind]['latencies']
+                rates[kind] = len(latencies) / args.seconds
+                p95s[kind] = statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) > 1 else float('nan')
+            locked = results['read']['errors'] + results['write']['errors']
+            totals[label] = rates['read'] + rates['write']
+            print(f"  {label:<11} {rates['read']:9.0f} {rates['write']:9.0f} {p95s['read']:12.2f} {p95s['write']:13.2f} {locked:7}")
+            print(f"    {', '.join(f'{name}={value}' for name, value in results['pragmas'].items())}")
+        print(f"\n  production/default throughput: {totals['production'] / totals['default']:.2f}x")
+    finally:
+        connections.close_all()
+        connections.settings['default'].update(NAME=seed_path, CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False, OPTIONS={})
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        shutil.rmtree(directory, ignore_errors=True)
+    sys.exit(0 if totals.get('production', 0) > totals.get('default', 0) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+import os
+import sys
+import time
+import argparse
+import django
+from datetime import timedelta
+from typing import Any, Callable
+
+# Set up Django environment
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'techblog.settings')
+django.setup()
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import QuerySet
+from django.utils import timezone
+from tech.models import Tutorial, Article, Snippet
+
+LANGUAGES = [code for code, _ in Snippet.LANGUAGE_CHOICES]
+
+
+def seed(rows: int, authors: int, batch_size: int = 5000) -> User:
+    """Bulk insert ``rows`` tutorials, articles and snippets spread over ``authors`` users"""
+    users = User.objects.bulk_create([User(username=f'bench{i}') for i in range(authors)])
+    now = timezone.now()
+    for model, build in [
+        (Tutorial, lambda i, user, created: Tutorial(
+            title=f'Tutorial {i}', description='Benchmark tutorial', content='x' * 200,
+            author=user, created_at=created)),
+        (Article, lambda i, user, created: Article(
+            title=f'Article {i}', content='x' * 200, author=user, created_at=created)),
+        (Snippet, lambda i, user, created: Snippet(
+            title=f'Snippet {i}', code='print(1)', language=LANGUAGES[i % len(LANGUAGES)],
+            author=user, created_at=created)),
+    ]:
+        started = time.perf_counter()
+        for start in range(0, rows, batch_size):
+            model.objects.bulk_create([
+                build(i, users[i % authors], now - timedelta(seconds=i * 7 % (rows * 3)))
+                for i in range(start, min(start + batch_size, rows))
+            ])
+        print(f"Seeded {rows} {model._meta.verbose_name_plural.lower()} in {time.perf_counter() - started:.1f}s")
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return users[0]
+
+
+def benchmark_queries(author: User) -> dict[str, Callable[[], QuerySet[Any]]]:
+    """The list view and dashboard queries, as the views issue them"""
+    return {
+        'tutorials list': lambda: Tutorial.objects.order_by('-created_at')[:6],
+        'articles list': lambda: Article.objects.order_by('-created_at')[:5],
+        'snippets list': lambda: Snippet.objects.order_by('-created_at')[:10],
+        'snippets by language': lambda: Snippet.objects.filter(language='python').order_by('-created_at')[:10],
+        'dashboard tutorials': lambda: Tutorial.objects.filter(author=author).order_by('-created_at')[:5],
+        'dashboard articles': lambda: Article.objects.filter(author=author).order_by('-created_at')[:5],
+        'dashboard snippets': lambda: Snippet.objects.filter(author=author).order_by('-created_at')[:5],
+    }
+
+
+def run(queries: dict[str, Callable[[], QuerySet[Any]]], repeat: int) -> bool:
+    """Time each query and print its plan; returns True if none needed a sort step"""
+    ok = True
+    for label, make in queries.items():
+        plan = make().explain()
+        sorts = 'TEMP B-TREE' in plan
+        ok = ok and not sorts
+        started = time.perf_counter()
+        for _ in range(repeat):
+            list(make())
+        elapsed = (time.perf_counter() - started) / repeat * 1000
+        print(f"  {label:<22} {elapsed:8.2f} ms  {'SORT' if sorts else 'index scan'}")
+        for line in plan.splitlines():
+            print(f"      {line.strip()}")
+    return ok
+
+
+def set_indexes(enabled: bool) -> None:
+    """Drop or recreate the list indexes declared in Meta.indexes"""
+    with connection.schema_editor() as editor:
+        for model in (Tutorial, Article, Snippet):
+            for index in model._meta.indexes:
+                if enabled:
+                    editor.add_index(model, index)
+                else:
+                    editor.remove_index(model, index)
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark list and dashboard queries with and without indexes')
+    parser.add_argument('--rows', type=int, default=500_000, help='Rows to seed per model')
+    parser.add_argument('--authors', type=int, default=100, help='Number of authors to spread rows over')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per query')
+    args = parser.parse_args()
+
+    # Work on a throwaway test database so db.sqlite3 is never touched
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        author = seed(args.rows, args.authors)
+        queries = benchmark_queries(author)
+
+        set_indexes(False)
+        print("\nWithout list indexes:")
+        run(queries, args.repeat)
+
+        set_indexes(True)
+        print("\nWith list indexes:")
+        ok = run(queries, args.repeat)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    print("\nAll queries use index scans with no sort step." if ok else "\nSome queries still sort.")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
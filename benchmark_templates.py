@@ -0,0 +1,113 @@
+import os
+import sys
+import time
+import argparse
+import statistics
+import django
+
+# Set up Django environment
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'techblog.settings')
+django.setup()
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.template import engines
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+from tech.models import Tutorial, Article, Snippet
+from tech.warmup import warm_templates
+
+
+def seed() -> User:
+    """A few rows of each type so list and detail pages have something to render"""
+    author = User.objects.create_user(username='bench', password='bench-password')
+    for i in range(12):
+        Tutorial.objects.create(title=f'Tutorial {i}', description='Benchmark tutorial', content='Some **text**', author=author)
+        Article.objects.create(title=f'Article {i}', content='Some *text*', author=author)
+        Snippet.objects.create(title=f'Snippet {i}', code='print(1)', language='python', author=author)
+    return author
+
+
+def pages(author: User) -> dict[str, tuple[str, bool]]:
+    """Label -> (URL, whether it needs a logged-in author)"""
+    tutorial = Tutorial.objects.first()
+    article = Article.objects.first()
+    return {
+        'home': (reverse('home'), False),
+        'tutorials': (reverse('tutorials'), False),
+        'tutorial detail': (reverse('tutorial_detail', args=[tutorial.pk]), False),
+        'articles': (reverse('articles'), False),
+        'article detail': (reverse('article_detail', args=[article.pk]), False),
+        'snippets': (reverse('snippets'), False),
+        'contact': (reverse('contact'), False),
+        'login': (reverse('login'), False),
+        'signup': (reverse('signup'), False),
+        'dashboard': (reverse('dashboard'), True),
+        'add tutorial': (reverse('add_tutorial'), True),
+        'edit article': (reverse('edit_article', args=[article.pk]), True),
+    }
+
+
+def reset_templates() -> None:
+    """Forget every compiled template, as a freshly started worker would"""
+    for loader in engines['django'].engine.template_loaders:
+        if hasattr(loader, 'reset'):
+            loader.reset()
+
+
+def time_request(client: Client, url: str, cold: bool) -> float:
+    if cold:
+        reset_templates()
+    # Measure rendering, not the page and fragment caches
+    cache.clear()
+    started = time.perf_counter()
+    response = client.get(url)
+    elapsed = time.perf_counter() - started
+    if response.status_code != 200:
+        raise SystemExit(f'{url} returned {response.status_code}')
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare first-request (cold) and warmed template rendering per view')
+    parser.add_argument('--repeat', type=int, default=15, help='Timed requests per view and mode')
+    args = parser.parse_args()
+
+    loaders = [type(loader).__module__ for loader in engines['django'].engine.template_loaders]
+    print(f"Template loaders: {', '.join(loaders)}")
+    if 'django.template.loaders.cached' not in loaders:
+        print('The cached loader is not in use, so warming has no effect')
+
+    setup_test_environment()
+    # Work on a throwaway test database so db.sqlite3 is never touched
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        author = seed()
+        anonymous, logged_in = Client(), Client()
+        logged_in.force_login(author)
+        targets = pages(author)
+        for url, needs_login in targets.values():
+            # Import view modules, resolve URLs and open the connection once
+            (logged_in if needs_login else anonymous).get(url)
+
+        print(f"\n  {'view':<16} {'cold ms':>9} {'warm ms':>9} {'saved':>7}")
+        total_cold = total_warm = 0.0
+        for label, (url, needs_login) in targets.items():
+            client = logged_in if needs_login else anonymous
+            cold = statistics.median(time_request(client, url, cold=True) for _ in range(args.repeat))
+            reset_templates()
+            warm_templates()
+            warm = statistics.median(time_request(client, url, cold=False) for _ in range(args.repeat))
+            total_cold += cold
+            total_warm += warm
+            print(f"  {label:<16} {cold * 1000:9.2f} {warm * 1000:9.2f} {1 - warm / cold:7.0%}")
+        print(f"  {'total':<16} {total_cold * 1000:9.2f} {total_warm * 1000:9.2f} {1 - total_warm / total_cold:7.0%}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+    sys.exit(0 if total_warm < total_cold else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,6 @@
 import os
 import django
-import requests
-from io import BytesIO
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.base import ContentFile
 from django.db.models.fields.files import ImageFieldFile  # Add this import
 from typing import cast, TYPE_CHECKING, Any, Optional
 
@@ -17,30 +15,8 @@ django.setup()
 
 from django.contrib.auth.models import User
 from tech.models import Tutorial
-from django.utils import timezone
-
-def download_image(url: str) -> Optional[InMemoryUploadedFile]:
-    """Download image from URL and return as InMemoryUploadedFile"""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        # Type ignore for unknown response type
-        response: Any = requests.get(url, timeout=15, headers=headers)  # type: ignore
-        if response.status_code == 200:
-            image_io = BytesIO(response.content)
-            image_io.seek(0)
-            return InMemoryUploadedFile(
-                image_io,
-                None,
-                f"tutorial_image_{int(timezone.now().timestamp())}.jpg",
-                'image/jpeg',
-                len(response.content),
-                None
-            )
-    except Exception as e:
-        print(f"Error downloading image from {url}: {e}")
-    return None
+from tech.fetcher import Fetcher
+from tech import tasks
 
 def fix_tutorial_images() -> None:
     # Image URLs for tutorials (using different sources)
@@ -57,8 +33,14 @@ def fix_tutorial_images() -> None:
     
     # Get all tutorials - let Django handle the typing
     # Type ignore for unknown queryset type
-    tutorials = Tutorial.objects.all()  # type: ignore
+    tutorials = list(Tutorial.objects.all())  # type: ignore
     updated_count = 0
+
+    # Download the images for tutorials without one concurrently, before saving
+    with Fetcher() as fetcher:
+        downloads = fetcher.fetch_all(
+            image_urls[i % len(image_urls)] for i, tutorial in enumerate(tutorials) if not tutorial.image
+        )
     
     # For type checking purposes, we can iterate without explicit typing
     # Type ignore for unknown enumerate type
@@ -67,14 +49,16 @@ def fix_tutorial_images() -> None:
         if not tutorial.image:
             image_url = image_urls[i % len(image_urls)]
             # Type ignore for unknown title attribute
-            print(f"Downloading image for tutorial: {tutorial.title}")  # type: ignore
-            image = download_image(image_url)
-            if image and image.name:  # Check that image and image.name are not None
+            print(f"Attaching image for tutorial: {tutorial.title}")  # type: ignore
+            content = downloads.get(image_url)
+            if content is not None:
                 # Assign the image directly to the tutorial's image field
                 # This is the correct way to set an image for an existing tutorial
-                tutorial.image = image
+                tutorial.image = ContentFile(content, name='tutorial_image.jpg')
+                tutorial.image_status = Tutorial.IMAGE_PENDING
                 # Type ignore for unknown save method
                 tutorial.save()  # type: ignore
+                tasks.process_image_later(tutorial)
                 # Type ignore for unknown title attribute
                 print(f"Updated image for tutorial: {tutorial.title}")  # type: ignore
                 updated_count += 1
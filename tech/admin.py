@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import Tutorial, Article, Snippet
+from django.forms import BaseFormSet, ModelForm
+from django.http import HttpRequest
+from .models import Tutorial, Article, ArticleTag, Snippet, Tag, AuthorStats, Job
+from . import tagging
 from typing import final
 
 # Register your models here.
@@ -7,21 +10,42 @@ from typing import final
 @admin.register(Tutorial)
 @final
 class TutorialAdmin(admin.ModelAdmin):
-    list_display = ('title', 'author', 'created_at')
-    list_filter = ('created_at', 'author')
+    list_display = ('title', 'author', 'image_status', 'created_at')
+    list_filter = ('created_at', 'image_status', 'author')
     search_fields = ('title', 'description')
     date_hierarchy = 'created_at'
     ordering = ('-created_at',)
 
+@final
+class ArticleTagInline(admin.TabularInline):
+    model = ArticleTag
+    autocomplete_fields = ('tag',)
+    extra = 1
+
 @admin.register(Article)
 @final
 class ArticleAdmin(admin.ModelAdmin):
     list_display = ('title', 'author', 'created_at')
     list_filter = ('created_at', 'author')
-    search_fields = ('title', 'content', 'tags')
+    search_fields = ('title', 'content', 'tags__name')
+    inlines = (ArticleTagInline,)
     date_hierarchy = 'created_at'
     ordering = ('-created_at',)
 
+    def save_related(self, request: HttpRequest, form: ModelForm, formsets: list[BaseFormSet], change: bool) -> None:
+        super().save_related(request, form, formsets, change)
+        # The inline writes ArticleTag rows directly, which sends no m2m_changed
+        if any(formset.has_changed() for formset in formsets):
+            tagging.articles_retagged([form.instance.pk])
+
+@admin.register(Tag)
+@final
+class TagAdmin(admin.ModelAdmin):
+    list_display = ('name', 'slug')
+    search_fields = ('name',)
+    prepopulated_fields = {'slug': ('name',)}
+    ordering = ('name',)
+
 @admin.register(Snippet)
 @final
 class SnippetAdmin(admin.ModelAdmin):
@@ -29,4 +53,20 @@ class SnippetAdmin(admin.ModelAdmin):
     list_filter = ('language', 'created_at', 'author')
     search_fields = ('title', 'code')
     date_hierarchy = 'created_at'
-    ordering = ('-created_at',)
\ No newline at end of file
+    ordering = ('-created_at',)
+
+@admin.register(AuthorStats)
+@final
+class AuthorStatsAdmin(admin.ModelAdmin):
+    list_display = ('author', 'tutorial_count', 'article_count', 'snippet_count', 'last_activity_at')
+    search_fields = ('author__username',)
+    ordering = ('-last_activity_at',)
+    readonly_fields = ('author', 'tutorial_count', 'article_count', 'snippet_count', 'last_activity_at')
+
+@admin.register(Job)
+@final
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('task', 'status', 'attempts', 'max_attempts', 'run_at', 'locked_by')
+    list_filter = ('status', 'task')
+    ordering = ('run_at',)
+    readonly_fields = ('task', 'payload', 'attempts', 'locked_by', 'locked_at', 'last_error', 'created_at')
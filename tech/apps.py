@@ -4,4 +4,8 @@ from typing import Any
 
 class TechConfig(AppConfig):
     default_auto_field: Any = 'django.db.models.BigAutoField'
-    name: str = 'tech'
\ No newline at end of file
+    name: str = 'tech'
+
+    def ready(self) -> None:
+        # Connect signal receivers, register background tasks and system checks
+        from . import checks, database, signals, tasks  # noqa: F401
@@ -0,0 +1,220 @@
+"""
+Bundled, minified and precompressed static assets.
+
+``TECH_ASSET_BUNDLES`` maps a bundle name (``css/site.css``) to the static
+files it concatenates. With ``AssetStorage`` as the staticfiles storage,
+``collectstatic`` builds each bundle into ``STATIC_ROOT``, minifies it,
+gives every file a content-hashed name in ``staticfiles.json`` and writes
+``.gz`` (and ``.br`` when the brotli package is installed) siblings of the
+text files, ready to be served with far-future cache headers.
+
+Templates include a bundle with ``{% asset_bundle 'css/site.css' %}`` from
+``tech_assets``. It resolves the hashed name from the manifest the storage
+loaded into memory when the worker started, and falls back to the
+individual source files when no manifest has been built (development and
+tests), so there is no build step before ``runserver``.
+"""
+import gzip
+import re
+from typing import Any, Iterator, Optional
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+DEFAULT_BUNDLES: dict[str, list[str]] = {
+    'css/site.css': ['css/style.css', 'css/highlight.css'],
+    'js/site.js': ['js/script.js', 'js/animation-test.js'],
+}
+
+# Files worth precompressing; images and fonts are already compressed
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.svg', '.json', '.txt', '.html', '.xml', '.map', '.ico')
+
+# Smaller files gain nothing from compression once headers are counted
+MIN_COMPRESS_SIZE = 256
+
+
+def bundles() -> dict[str, list[str]]:
+    return getattr(settings, 'TECH_ASSET_BUNDLES', DEFAULT_BUNDLES)
+
+
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+CSS_STRING_RE = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')''')
+CSS_SPACE_RE = re.compile(r'\s+')
+CSS_PUNCTUATION_RE = re.compile(r'\s*([{};,>])\s*')
+CSS_COLON_SPACE_RE = re.compile(r':\s+')
+
+
+def minify_css(text: str) -> str:
+    """Drop comments and insignificant whitespace, leaving strings untouched"""
+    parts = CSS_STRING_RE.split(text)
+    out = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            out.append(part)  # a quoted string
+            continue
+        part = CSS_COMMENT_RE.sub('', part)
+        part = CSS_SPACE_RE.sub(' ', part)
+        # Only spaces after ':' go: "a :hover" and "a:hover" are different selectors
+        part = CSS_PUNCTUATION_RE.sub(r'\1', part)
+        part = CSS_COLON_SPACE_RE.sub(':', part)
+        out.append(part.replace(';}', '}'))
+    return ''.join(out).strip()
+
+
+# A '/' after one of these (or at the start) begins a regex literal, not a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^\n')
+
+
+def minify_js(text: str) -> str:
+    """Remove comments, indentation and blank lines from JavaScript
+
+    Line breaks are kept, so automatic semicolon insertion behaves exactly as
+    in the source; strings, template literals and regex literals are copied
+    verbatim.
+    """
+    out: list[str] = []
+    i, length = 0, len(text)
+    last = '\n'  # last significant character of code
+
+    def emit(chunk: str) -> None:
+        if chunk == '\n':
+            while out and out[-1] in ' \t':
+                out.pop()  # trailing whitespace
+            if not out or out[-1].endswith('\n'):
+                return  # blank line
+        elif chunk in ' \t' and (not out or out[-1].endswith(('\n', ' ', '\t'))):
+            return  # indentation or a run of spaces
+        out.append(chunk)
+
+    while i < length:
+        char = text[i]
+        pair = text[i:i + 2]
+        if pair == '//':
+            end = text.find('\n', i)
+            i = length if end == -1 else end
+            continue
+        if pair == '/*':
+            end = text.find('*/', i + 2)
+            end = length if end == -1 else end + 2
+            # A comment that spanned lines still separates statements
+            emit('\n' if '\n' in text[i:end] else ' ')
+            i = end
+            continue
+        if char in '"\'`' or (char == '/' and last in REGEX_PRECEDERS):
+            start = i
+            i += 1
+            in_class = False
+            while i < length:
+                if text[i] == '\\':
+                    i += 2
+                    continue
+                if char == '/' and text[i] in '[]':
+                    in_class = text[i] == '['
+                elif text[i] == char and not in_class:
+                    break
+                elif text[i] == '\n' and char != '`':
+                    i -= 1  # unterminated; the newline is handled as code
+                    break
+                i += 1
+            i += 1
+            out.append(text[start:i])
+            last = char
+            continue
+        if char == '\r':
+            i += 1
+            continue
+        emit(' ' if char == '\t' else char)
+        if char == '\n':
+            last = '\n' if last in REGEX_PRECEDERS else last
+        elif not char.isspace():
+            last = char
+        i += 1
+    emit('\n')
+    return ''.join(out)
+
+
+def minify(name: str, text: str) -> str:
+    if name.endswith('.css'):
+        return minify_css(text)
+    if name.endswith('.js'):
+        return minify_js(text)
+    return text
+
+
+def compress(storage: Any, name: str) -> list[str]:
+    """Write .gz and .br siblings of a stored file when they are smaller; returns their names"""
+    with storage.open(name) as f:
+        data = f.read()
+    if len(data) < MIN_COMPRESS_SIZE:
+        return []
+    variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=11)))
+    written = []
+    for suffix, compressed in variants:
+        if len(compressed) >= len(data):
+            continue
+        if storage.exists(name + suffix):
+            storage.delete(name + suffix)
+        storage._save(name + suffix, ContentFile(compressed))
+        written.append(name + suffix)
+    return written
+
+
+class AssetStorage(ManifestStaticFilesStorage):
+    """Manifest storage that builds bundles and precompresses the hashed files"""
+
+    def build_bundles(self, paths: dict[str, tuple[Any, str]]) -> list[str]:
+        """Concatenate and minify each bundle from the collected files into STATIC_ROOT"""
+        built = []
+        for name, sources in bundles().items():
+            chunks = []
+            for source in sources:
+                if source not in paths:
+                    raise ValueError(f'Bundle {name!r} lists {source!r}, which collectstatic did not find')
+                storage, path = paths[source]
+                with storage.open(path) as f:
+                    chunks.append(minify(name, f.read().decode('utf-8')))
+            # A newline between files keeps a missing trailing semicolon harmless
+            content = '\n'.join(chunks).encode('utf-8')
+            if self.exists(name):
+                self.delete(name)
+            self._save(name, ContentFile(content))
+            paths[name] = (self, name)
+            built.append(name)
+        return built
+
+    def post_process(self, paths: dict[str, tuple[Any, str]], dry_run: bool = False,
+                     **options: Any) -> Iterator[tuple[str, Optional[str], bool]]:
+        if not dry_run:
+            self.build_bundles(paths)
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        for hashed in set(self.hashed_files.values()):
+            if hashed.endswith(COMPRESSIBLE_EXTENSIONS):
+                compress(self, hashed)
+
+
+def bundle_urls(name: str) -> list[str]:
+    """URLs to include for a bundle: the built, hashed file or its sources"""
+    if name in getattr(staticfiles_storage, 'hashed_files', {}):
+        return [staticfiles_storage.url(name)]
+    return [staticfiles_storage.url(source) for source in bundles()[name]]
+
+
+def static_version() -> str:
+    """Hash of the loaded manifest; changes whenever collectstatic changes a file"""
+    return getattr(staticfiles_storage, 'manifest_hash', '')
+
+
+def load_manifest() -> None:
+    """Create the staticfiles storage now, which reads the manifest into memory"""
+    # Any attribute access sets up the lazy storage object
+    getattr(staticfiles_storage, 'base_location', None)
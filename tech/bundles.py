@@ -0,0 +1,402 @@
+"""
+Reading and bulk-importing content bundles.
+
+A bundle is a set of records, one per tutorial, article or snippet, keyed by
+their ``type`` and either an ``id`` (the primary key the row had in the
+database that exported it) or, without one, their ``title``. Bundles can be
+written as:
+
+* JSON or YAML: ``{"tutorials": [...], "articles": [...], "snippets": [...]}``
+  or a list of records that each carry a ``type``;
+* newline-delimited JSON (``.ndjson``/``.jsonl``, optionally gzipped), one
+  record per line;
+* Markdown: front matter between ``---`` lines holds the fields and the text
+  after it is the body (``content``, or ``code`` for snippets). A directory
+  is read recursively.
+
+``import_records`` resolves the existing rows of each batch in one query and
+writes with ``bulk_create``/``bulk_update``. Those skip model signals, so the
+derived HTML, search index, author counters and page cache versions are
+brought up to date here instead, and a related items rebuild is queued. ``export_records`` streams rows back out as
+records, so an NDJSON export can be imported again. Article tags travel as
+space-separated text and are written with one bulk insert per batch.
+"""
+import gzip
+import json
+import os
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from . import caching, jobs, search, stats, tagging
+from .highlighting import highlight_code
+from .models import Article, ArticleTag, Snippet, Tutorial
+from .rendering import render_content
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None
+
+
+@dataclass(frozen=True)
+class Kind:
+    model: Any
+    fields: tuple[str, ...]
+    body_field: str
+    tagged: bool = False
+
+
+# Record type -> model, importable text fields, the Markdown body field and
+# whether records carry ``tags``
+KINDS: dict[str, Kind] = {
+    'tutorial': Kind(Tutorial, ('title', 'description', 'content'), 'content'),
+    'article': Kind(Article, ('title', 'content'), 'content', tagged=True),
+    'snippet': Kind(Snippet, ('title', 'code', 'language'), 'code'),
+}
+
+# Plural section names accepted in JSON and YAML bundles
+SECTIONS: dict[str, str] = {f'{name}s': name for name in KINDS}
+
+BUNDLE_EXTENSIONS = ('.json', '.ndjson', '.jsonl', '.yaml', '.yml', '.md', '.markdown')
+
+
+class BundleError(ValueError):
+    """A bundle file or record that can't be imported"""
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return self.created + self.updated + self.unchanged
+
+
+def _records_from_data(data: Any, source: str) -> Iterator[dict[str, Any]]:
+    if isinstance(data, dict):
+        for section, items in data.items():
+            if section not in SECTIONS:
+                raise BundleError(f'{source}: unknown section {section!r}')
+            for item in items or []:
+                yield {'type': SECTIONS[section], **item}
+    elif isinstance(data, list):
+        yield from data
+    else:
+        raise BundleError(f'{source}: expected a mapping of sections or a list of records')
+
+
+def _parse_front_matter(text: str) -> dict[str, Any]:
+    if yaml is not None:
+        return yaml.safe_load(text) or {}
+    # Without PyYAML, accept flat ``key: value`` lines with optional JSON quoting
+    values: dict[str, Any] = {}
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        key, _, value = line.partition(':')
+        value = value.strip()
+        values[key.strip()] = json.loads(value) if value.startswith('"') else value
+    return values
+
+
+def read_markdown(text: str, source: str) -> dict[str, Any]:
+    """One record from a Markdown document with front matter"""
+    text = text.replace('\r\n', '\n')
+    if not text.startswith('---\n'):
+        raise BundleError(f'{source}: missing front matter')
+    front, separator, body = text[4:].partition('\n---\n')
+    if not separator:
+        raise BundleError(f'{source}: unterminated front matter')
+    record = _parse_front_matter(front)
+    kind = KINDS.get(record.get('type', ''))
+    if kind is None:
+        raise BundleError(f'{source}: unknown type {record.get("type")!r}')
+    record.setdefault(kind.body_field, body.strip('\n'))
+    return record
+
+
+def read_bundle(path: str) -> Iterator[dict[str, Any]]:
+    """Yield the records in a bundle file or directory"""
+    if os.path.isdir(path):
+        for directory, _, filenames in sorted(os.walk(path)):
+            for filename in sorted(filenames):
+                if filename.endswith(BUNDLE_EXTENSIONS) or filename.endswith(tuple(f'{e}.gz' for e in BUNDLE_EXTENSIONS)):
+                    yield from read_bundle(os.path.join(directory, filename))
+        return
+    name = path[:-3] if path.endswith('.gz') else path
+    opener: Any = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        if name.endswith(('.ndjson', '.jsonl')):
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError as e:
+                        raise BundleError(f'{path}:{number}: {e}') from e
+        elif name.endswith('.json'):
+            yield from _records_from_data(json.load(f), path)
+        elif name.endswith(('.yaml', '.yml')):
+            if yaml is None:
+                raise BundleError(f'{path}: reading YAML bundles needs PyYAML')
+            yield from _records_from_data(yaml.safe_load(f), path)
+        elif name.endswith(('.md', '.markdown')):
+            yield read_markdown(f.read(), path)
+        else:
+            raise BundleError(f'{path}: unsupported bundle format')
+
+
+def _resolve_authors(usernames: set[str]) -> tuple[dict[str, int], list[str]]:
+    """Primary keys for every username, creating the missing users without a password"""
+    authors = dict(User.objects.filter(username__in=usernames).values_list('username', 'pk'))
+    missing = sorted(usernames - set(authors))
+    if missing:
+        new_users = [User(username=name) for name in missing]
+        for user in new_users:
+            user.set_unusable_password()
+        User.objects.bulk_create(new_users)
+        authors.update(User.objects.filter(username__in=missing).values_list('username', 'pk'))
+    return authors, missing
+
+
+def _default_author(username: Optional[str]) -> Callable[[], Optional[int]]:
+    """Look up the fallback author the first time a new record needs one
+
+    Unlike the authors records name, it is never created: a mistyped or
+    missing account should stop the import rather than own its rows.
+    """
+    found: list[Optional[int]] = []
+
+    def resolve() -> Optional[int]:
+        if not username:
+            return None
+        if not found:
+            found.append(User.objects.filter(username=username).values_list('pk', flat=True).first())
+        if found[0] is None:
+            raise BundleError(f'Default author {username!r} does not exist')
+        return found[0]
+    return resolve
+
+
+def _render(kind: Kind, instance: Any) -> None:
+    if kind.model is Snippet:
+        instance.code_html = highlight_code(instance.code, instance.language)
+    else:
+        instance.content_html = render_content(instance.content)
+
+
+def _parse_created_at(value: Any) -> Any:
+    if isinstance(value, str):
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise BundleError(f'Invalid created_at {value!r}')
+        value = parsed
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def _record_tags(value: Any) -> list[str]:
+    """Tag names from a record's ``tags``, given as text or a list"""
+    if isinstance(value, (list, tuple)):
+        value = ' '.join(str(name) for name in value)
+    return tagging.parse_tags(value or '')
+
+
+def _tags_by_article(article_ids: Iterable[int]) -> dict[int, list[str]]:
+    """Tag names of many articles, in one query"""
+    tags: dict[int, list[str]] = {}
+    rows = ArticleTag.objects.filter(article_id__in=list(article_ids)).order_by('tag__name')
+    for article_id, name in rows.values_list('article_id', 'tag__name'):
+        tags.setdefault(article_id, []).append(name)
+    return tags
+
+
+def _import_batch(kind: Kind, records: list[dict[str, Any]], authors: dict[str, int],
+                  default_author_id: Callable[[], Optional[int]], result: ImportResult) -> tuple[list[Any], set[int]]:
+    """Create or update one batch of records of a single type
+
+    Returns the written instances and the authors whose counts may have changed.
+    """
+    model = kind.model
+    now = timezone.now()
+    columns = ('pk', 'author_id', 'created_at', *kind.fields)
+    by_id = {row['pk']: row for row in model.objects.filter(
+        pk__in=[r['id'] for r in records if 'id' in r]
+    ).values(*columns)}
+    by_title: dict[str, dict[str, Any]] = {}
+    # Lowest primary key wins when titles are duplicated in the table
+    rows = model.objects.filter(title__in=[r['title'] for r in records if 'id' not in r]).order_by('-pk')
+    for row in rows.values(*columns):
+        by_title[row['title']] = row
+    matched = [*by_id.values(), *by_title.values()]
+    current_tags = _tags_by_article(row['pk'] for row in matched) if kind.tagged else {}
+
+    to_create: list[Any] = []
+    to_update: list[Any] = []
+    # Instances whose tags are replaced once they have primary keys
+    retagged: list[tuple[Any, list[str]]] = []
+    touched_authors: set[int] = set()
+    for record in records:
+        tags = _record_tags(record['tags']) if kind.tagged and 'tags' in record else None
+        values = {name: record[name] for name in kind.fields if name in record}
+        if record.get('author'):
+            values['author_id'] = authors[record['author']]
+        if record.get('created_at'):
+            values['created_at'] = _parse_created_at(record['created_at'])
+        # A record whose id is gone is created afresh rather than matched by title
+        current = by_id.get(record['id']) if 'id' in record else by_title.get(record['title'])
+        if current is None:
+            instance = model(**{name: '' for name in kind.fields}, created_at=now)
+            for name, value in values.items():
+                setattr(instance, name, value)
+            if instance.author_id is None:
+                instance.author_id = default_author_id()
+            to_create.append(instance)
+            if tags:
+                retagged.append((instance, tags))
+            continue
+        tags_changed = tags is not None and set(tags) != set(current_tags.get(current['pk'], []))
+        if not tags_changed and all(current[name] == value for name, value in values.items()):
+            result.unchanged += 1
+            continue
+        instance = model(**{**current, **values})
+        to_update.append(instance)
+        if tags_changed:
+            retagged.append((instance, tags))
+        touched_authors.add(current['author_id'])
+
+    for instance in to_create + to_update:
+        if instance.author_id is None:
+            raise BundleError(f'{instance.title!r} has no author and no default author was given')
+        if kind.model is Snippet and instance.language not in dict(Snippet.LANGUAGE_CHOICES):
+            raise BundleError(f'Snippet {instance.title!r} has unknown language {instance.language!r}')
+        _render(kind, instance)
+        if hasattr(instance, 'updated_at'):
+            instance.updated_at = now
+
+    model.objects.bulk_create(to_create)
+    if to_update:
+        update_fields = [*kind.fields, 'author', 'created_at', 'code_html' if model is Snippet else 'content_html']
+        if hasattr(model, 'updated_at'):
+            update_fields.append('updated_at')
+        model.objects.bulk_update(to_update, update_fields)
+    tagging.set_tags_in_bulk({instance.pk: tags for instance, tags in retagged})
+    result.created += len(to_create)
+    result.updated += len(to_update)
+    written = to_create + to_update
+    if kind.tagged:
+        # Loaded for the search index in one query rather than one per article
+        prefetch_related_objects(written, 'tags')
+    return written, touched_authors | {instance.author_id for instance in written}
+
+
+def import_records(records: Iterable[dict[str, Any]], default_author: Optional[str] = None,
+                   batch_size: int = 1000) -> tuple[dict[str, ImportResult], list[str]]:
+    """Create or update rows from bundle records, matching existing rows by id or title
+
+    Records with an ``id`` update the row with that primary key, or create a
+    new row if it no longer exists; the others match by title, and titles
+    repeated among them are an error rather than silently merged.
+
+    Records without an ``author`` belong to ``default_author`` when they are
+    created and keep their author when they update an existing row; that
+    user must exist if any new record needs it. Authors named by records are
+    created when missing. Returns an ``ImportResult`` per record type and
+    the usernames of created authors.
+    """
+    grouped: dict[str, dict[Any, dict[str, Any]]] = {name: {} for name in KINDS}
+    duplicates: set[tuple[str, str]] = set()
+    usernames: set[str] = set()
+    for record in records:
+        kind = record.get('type')
+        if kind not in KINDS:
+            raise BundleError(f'Unknown record type {kind!r}')
+        if not record.get('title'):
+            raise BundleError(f'A {kind} record has no title')
+        if record.get('author'):
+            usernames.add(record['author'])
+        if 'id' in record:
+            try:
+                record['id'] = int(record['id'])
+            except (TypeError, ValueError) as e:
+                raise BundleError(f'{kind.capitalize()} {record["title"]!r} has invalid id {record["id"]!r}') from e
+            # The last record for an id wins
+            key: Any = record['id']
+        else:
+            key = record['title']
+            if key in grouped[kind]:
+                duplicates.add((kind, key))
+        grouped[kind][key] = record
+    if duplicates:
+        raise BundleError('Records without an id share a title: ' + ', '.join(
+            f'{kind} {title!r}' for kind, title in sorted(duplicates)
+        ))
+
+    authors, created_authors = _resolve_authors(usernames) if usernames else ({}, [])
+    default_author_id = _default_author(default_author)
+    results = {name: ImportResult() for name in KINDS}
+    touched_authors: set[int] = set()
+    for name, by_key in grouped.items():
+        kind = KINDS[name]
+        result = results[name]
+        started = time.perf_counter()
+        batch_records = list(by_key.values())
+        for start in range(0, len(batch_records), batch_size):
+            with transaction.atomic():
+                written, author_ids = _import_batch(
+                    kind, batch_records[start:start + batch_size], authors, default_author_id, result
+                )
+                if kind.model in search.searchable_models():
+                    search.get_backend().index_many(kind.model, written)
+            touched_authors |= author_ids
+        result.seconds = time.perf_counter() - started
+        if result.created or result.updated:
+            caching.bump_version(kind.model._meta.model_name)
+            if kind.model in search.searchable_models():
+                # Bulk writes skip the signals that refresh related items one by one
+                jobs.enqueue('rebuild_related', model=kind.model._meta.model_name)
+    if touched_authors:
+        stats.reconcile(touched_authors)
+    return results, created_authors
+
+
+def export_records(kinds: Optional[Iterable[str]] = None, author: Optional[str] = None,
+                   since: Optional[Any] = None, until: Optional[Any] = None,
+                   chunk_size: int = 2000) -> Iterator[dict[str, Any]]:
+    """Yield bundle records for existing rows, oldest first within each type
+
+    Rows are streamed with a server-side cursor in chunks of ``chunk_size``,
+    so memory use does not grow with the table. ``since`` is inclusive and
+    ``until`` exclusive, both compared with ``created_at``.
+    """
+    for name in kinds or KINDS:
+        kind = KINDS[name]
+        queryset = kind.model.objects.order_by('created_at', 'pk')
+        if author:
+            queryset = queryset.filter(author__username=author)
+        if since:
+            queryset = queryset.filter(created_at__gte=since)
+        if until:
+            queryset = queryset.filter(created_at__lt=until)
+        rows = queryset.values('pk', *kind.fields, 'created_at', 'author__username').iterator(chunk_size=chunk_size)
+        while chunk := list(islice(rows, chunk_size)):
+            tags = _tags_by_article(row['pk'] for row in chunk) if kind.tagged else {}
+            for row in chunk:
+                record = {'type': name, 'id': row['pk'], **{field: row[field] for field in kind.fields}}
+                if kind.tagged:
+                    record['tags'] = ' '.join(tags.get(row['pk'], []))
+                record['author'] = row['author__username']
+                record['created_at'] = row['created_at'].isoformat()
+                yield record
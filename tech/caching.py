@@ -0,0 +1,239 @@
+"""
+Response caching for the public list and detail pages.
+
+Pages are cached per path and query string for anonymous visitors only;
+logged-in users see personalised chrome and always get a fresh render. Each
+content model has a version counter in the cache that is part of every page
+key, and the post_save/post_delete receivers in ``tech.signals`` bump it, so
+editing a tutorial makes every cached page that lists tutorials unreachable
+without having to find and delete them.
+
+Detail pages also answer conditional requests: ``conditional_on_updated_at``
+derives an ETag and Last-Modified from the row's ``updated_at`` (and
+``related_updated_at``, since the pages list related items) so repeat
+visitors and the CDN can revalidate with a 304.
+
+Pages rendered from a read replica (see ``tech.routing``) may predate the
+write that bumped the version they are stored under, so they are kept for
+at most ``TECH_REPLICA_PAGE_CACHE_TIMEOUT`` seconds.
+
+Logged-in visitors and page cache misses still reuse rendered fragments:
+the ``{% fragment %}`` tag in ``tech_cache`` caches the site chrome and each
+listing card, keyed by the fragment's own template source and the values it
+varies on, and counts hits and misses per fragment name for tuning.
+"""
+import functools
+import hashlib
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.http import condition
+
+from . import routing
+
+
+def page_cache_enabled() -> bool:
+    return bool(getattr(settings, 'TECH_PAGE_CACHE_ENABLED', True))
+
+
+def page_cache_timeout() -> int:
+    return int(getattr(settings, 'TECH_PAGE_CACHE_TIMEOUT', 600))
+
+
+def fragment_cache_timeout() -> int:
+    return int(getattr(settings, 'TECH_FRAGMENT_CACHE_TIMEOUT', 3600))
+
+
+def fragment_stats_enabled() -> bool:
+    return bool(getattr(settings, 'TECH_FRAGMENT_CACHE_STATS', True))
+
+
+def stored_timeout(timeout: int) -> int:
+    """Timeout for caching something rendered in this request, capped when it came from a replica"""
+    if routing.reading_from_replica():
+        return min(timeout, routing.replica_page_cache_timeout())
+    return timeout
+
+
+def version_key(name: str) -> str:
+    return f'tech:version:{name}'
+
+
+def get_versions(*names: str) -> dict[str, int]:
+    """Current version counter for each named model"""
+    keys = {version_key(name): name for name in names}
+    found: dict[str, int] = cache.get_many(list(keys))
+    versions: dict[str, int] = {}
+    for key, name in keys.items():
+        if key not in found:
+            # Seed evicted or new counters from the clock so they never
+            # repeat a value that older cached pages were stored under.
+            cache.add(key, time.time_ns() // 1000, None)
+            found[key] = cache.get(key)
+        versions[name] = found[key]
+    return versions
+
+
+def _bump(name: str) -> None:
+    key = version_key(name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns() // 1000, None)
+
+
+def bump_version(name: str) -> None:
+    """Invalidate every cached page that depends on ``name``
+
+    The counter is bumped immediately and again once the surrounding
+    transaction commits, so a page rendered from pre-commit data in between
+    can't outlive the change.
+    """
+    _bump(name)
+    transaction.on_commit(lambda: _bump(name))
+
+
+def page_cache_key(request: HttpRequest, versions: dict[str, int]) -> str:
+    """Cache key for a page: path, normalized query string and model versions"""
+    query = sorted((key, value) for key in request.GET for value in request.GET.getlist(key))
+    version_part = ','.join(f'{name}={versions[name]}' for name in sorted(versions))
+    raw = f'{request.method}|{request.path}|{query}|{version_part}'
+    return 'tech:page:' + hashlib.md5(raw.encode()).hexdigest()
+
+
+def _cacheable_request(request: HttpRequest) -> bool:
+    if not page_cache_enabled() or request.method not in ('GET', 'HEAD'):
+        return False
+    if request.user.is_authenticated:
+        return False
+    # One-off flash messages must not be baked into a shared page
+    return len(get_messages(request)) == 0
+
+
+def _cacheable_response(response: HttpResponse) -> bool:
+    return (
+        response.status_code == 200
+        and not getattr(response, 'streaming', False)
+        and not response.cookies
+        and 'private' not in response.get('Cache-Control', '')
+    )
+
+
+def cache_public_page(*model_names: str, timeout: Optional[int] = None) -> Callable[..., Any]:
+    """Cache a view's response for anonymous visitors
+
+    ``model_names`` are the content models the page is built from; saving or
+    deleting any of them invalidates the cached copies.
+    """
+    def decorator(view: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+        @functools.wraps(view)
+        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            if not _cacheable_request(request):
+                return view(request, *args, **kwargs)
+            key = page_cache_key(request, get_versions(*model_names))
+            response: Optional[HttpResponse] = cache.get(key)
+            if response is not None:
+                response['X-Page-Cache'] = 'hit'
+                return response
+            response = view(request, *args, **kwargs)
+            if _cacheable_response(response):
+                cache.set(key, response, stored_timeout(page_cache_timeout() if timeout is None else timeout))
+                response['X-Page-Cache'] = 'miss'
+            return response
+        return wrapper
+    return decorator
+
+
+def conditional_on_updated_at(model: Any, pk_kwarg: str, *also: str) -> Callable[..., Any]:
+    """Answer If-None-Match/If-Modified-Since for a detail view
+
+    The validators come from one primary key lookup of ``updated_at`` and the
+    author's username, without loading the body. ``also`` names further
+    nullable timestamp fields of the row that change what the page shows,
+    e.g. ``related_updated_at``; the ETag and Last-Modified cover them too.
+    The ETag also varies on the requesting user, whose login state changes
+    the page chrome.
+    """
+    def validators(request: HttpRequest, **kwargs: Any) -> Optional[tuple[Any, ...]]:
+        # condition() asks for the ETag and Last-Modified separately; look up once
+        cached = getattr(request, '_tech_validators', None)
+        if cached is None:
+            cached = (
+                model.objects.filter(pk=kwargs[pk_kwarg])
+                .values_list('updated_at', 'author__username', *also)
+                .first(),
+            )
+            request._tech_validators = cached  # type: ignore[attr-defined]
+        return cached[0]
+
+    def etag(request: HttpRequest, **kwargs: Any) -> Optional[str]:
+        row = validators(request, **kwargs)
+        if row is None:
+            return None
+        updated_at, username, *timestamps = row
+        viewer = request.user.pk if request.user.is_authenticated else 0
+        changed = '|'.join(t.isoformat() if t else '' for t in timestamps)
+        raw = f'{model._meta.label}|{kwargs[pk_kwarg]}|{updated_at.isoformat()}|{username}|{viewer}|{changed}'
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    def last_modified(request: HttpRequest, **kwargs: Any) -> Optional[Any]:
+        row = validators(request, **kwargs)
+        if row is None:
+            return None
+        updated_at, _, *timestamps = row
+        return max([updated_at, *(t for t in timestamps if t)])
+
+    return condition(etag_func=etag, last_modified_func=last_modified)
+
+
+FRAGMENT_NAMES_KEY = 'tech:fragment-names'
+
+
+def fragment_key(name: str, source_hash: str, vary_on: Iterable[Any]) -> str:
+    """Cache key for a rendered fragment"""
+    raw = '|'.join([source_hash, *(str(value) for value in vary_on)])
+    return f'tech:fragment:{name}:' + hashlib.md5(raw.encode()).hexdigest()
+
+
+def _stats_key(name: str, outcome: str) -> str:
+    return f'tech:fragment-stats:{name}:{outcome}'
+
+
+def register_fragment(name: str) -> None:
+    """Remember a fragment name so ``fragment_stats`` can report it"""
+    names: set[str] = cache.get(FRAGMENT_NAMES_KEY) or set()
+    if name not in names:
+        cache.set(FRAGMENT_NAMES_KEY, names | {name}, None)
+
+
+def record_fragment(name: str, hit: bool) -> None:
+    """Count a fragment cache hit or miss; totals span workers only with a shared cache backend"""
+    if not fragment_stats_enabled():
+        return
+    key = _stats_key(name, 'hits' if hit else 'misses')
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def fragment_stats() -> dict[str, dict[str, int]]:
+    """Hits and misses per fragment name"""
+    names = sorted(cache.get(FRAGMENT_NAMES_KEY) or ())
+    keys = [_stats_key(name, outcome) for name in names for outcome in ('hits', 'misses')]
+    counts = cache.get_many(keys)
+    return {
+        name: {outcome: counts.get(_stats_key(name, outcome), 0) for outcome in ('hits', 'misses')}
+        for name in names
+    }
+
+
+def reset_fragment_stats() -> None:
+    names = cache.get(FRAGMENT_NAMES_KEY) or ()
+    cache.delete_many([_stats_key(name, outcome) for name in names for outcome in ('hits', 'misses')])
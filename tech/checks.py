@@ -0,0 +1,32 @@
+"""
+System checks for settings that only matter in production.
+
+Run with ``python manage.py check --deploy``.
+"""
+from typing import Any
+
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# Cache backends whose contents are private to one process
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs: Any = None, **kwargs: Any) -> list[Error]:
+    """The page cache needs a cache every worker and the job runner share"""
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    if not getattr(settings, 'TECH_PAGE_CACHE_ENABLED', True) or backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [Error(
+        f'The page cache is enabled but the default cache ({backend}) is private to each process.',
+        hint=(
+            'Version bumps made by one worker or by run_jobs would not reach the others, so they '
+            'keep serving stale pages. Set TECHBLOG_CACHE_BACKEND to file or redis, or turn '
+            'TECH_PAGE_CACHE_ENABLED off.'
+        ),
+        id='tech.E001',
+    )]
@@ -0,0 +1,54 @@
+"""
+Per-connection SQLite tuning.
+
+``TECH_SQLITE_PRAGMAS`` maps pragma names to values that are applied to
+every new SQLite connection through the ``connection_created`` signal; the
+production profile turns on write-ahead logging so readers no longer wait
+for a writer, relaxes ``synchronous`` to what WAL needs for durability on
+commit, and enlarges the page cache and memory map. Pragmas that are
+persistent in the database file (``journal_mode``) are simply re-asserted.
+"""
+import re
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+PRAGMA_NAME_RE = re.compile(r'[a-z_]+')
+PRAGMA_VALUE_RE = re.compile(r'-?\w+')
+
+
+def sqlite_pragmas() -> dict[str, Any]:
+    pragmas = getattr(settings, 'TECH_SQLITE_PRAGMAS', {})
+    for name, value in pragmas.items():
+        # Pragmas cannot be parameterized, so only plain names and numbers are allowed
+        if not PRAGMA_NAME_RE.fullmatch(name) or not PRAGMA_VALUE_RE.fullmatch(str(value)):
+            raise ImproperlyConfigured(f'TECH_SQLITE_PRAGMAS has an invalid entry: {name!r}: {value!r}')
+    return pragmas
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """Run the configured PRAGMA statements on a new SQLite connection"""
+    if connection.vendor != 'sqlite':
+        return
+    pragmas = sqlite_pragmas()
+    if not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+
+
+def current_pragmas(connection: Any, names: Any) -> dict[str, Any]:
+    """The values of ``names`` on an open SQLite connection, for checks and benchmarks"""
+    values = {}
+    with connection.cursor() as cursor:
+        for name in names:
+            if not PRAGMA_NAME_RE.fullmatch(name):
+                raise ValueError(name)
+            cursor.execute(f'PRAGMA {name}')
+            values[name] = cursor.fetchone()[0]
+    return values
@@ -0,0 +1,235 @@
+"""
+Concurrent HTTP downloads for the seeding and maintenance scripts.
+
+``Fetcher.fetch_all`` downloads a batch of URLs on a bounded thread pool.
+Connections are kept alive and reused per host, failed requests are retried
+with exponential backoff, and successful bodies are cached on disk under the
+SHA-256 of their URL so re-running a script does not download anything twice.
+
+The network layer is a pluggable transport: ``RequestsTransport`` when
+requests is installed, otherwise ``HTTPClientTransport`` built on
+``http.client``. Tests pass their own transport or point the fetcher at a
+local HTTP server.
+"""
+import hashlib
+import http.client
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional, Protocol
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # pragma: no cover - optional dependency
+    requests = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.environ.get('TECHBLOG_FETCH_CACHE', '/var/tmp/techblog_downloads')
+
+DEFAULT_HEADERS: dict[str, str] = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+}
+
+# Statuses worth another attempt; anything else non-200 fails immediately
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+MAX_REDIRECTS = 5
+
+
+@dataclass
+class Response:
+    url: str
+    status: int
+    content: bytes = b''
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class Transport(Protocol):
+    def get(self, url: str, headers: dict[str, str], timeout: float) -> Response: ...
+
+    def close(self) -> None: ...
+
+
+class HTTPClientTransport:
+    """Keep-alive transport on http.client with one connection per host per thread"""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all: list[http.client.HTTPConnection] = []
+        self.connections_opened = 0
+
+    def _connection(self, scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+        pool: dict[tuple[str, str], http.client.HTTPConnection] = self._local.__dict__.setdefault('pool', {})
+        conn = pool.get((scheme, netloc))
+        if conn is None:
+            cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            conn = cls(netloc, timeout=timeout)
+            pool[(scheme, netloc)] = conn
+            with self._lock:
+                self._all.append(conn)
+                self.connections_opened += 1
+        return conn
+
+    def _drop(self, scheme: str, netloc: str) -> None:
+        conn = self._local.__dict__.get('pool', {}).pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def _request(self, url: str, headers: dict[str, str], timeout: float) -> tuple[int, bytes, dict[str, str]]:
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        for attempt in range(2):
+            conn = self._connection(parts.scheme, parts.netloc, timeout)
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server closed an idle keep-alive connection; retry once on a fresh one
+                self._drop(parts.scheme, parts.netloc)
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                self._drop(parts.scheme, parts.netloc)
+                raise
+            if response.will_close:
+                self._drop(parts.scheme, parts.netloc)
+            return response.status, body, {k.lower(): v for k, v in response.getheaders()}
+        raise AssertionError('unreachable')
+
+    def get(self, url: str, headers: dict[str, str], timeout: float) -> Response:
+        for _ in range(MAX_REDIRECTS + 1):
+            status, body, response_headers = self._request(url, headers, timeout)
+            if status in (301, 302, 303, 307, 308) and 'location' in response_headers:
+                url = urljoin(url, response_headers['location'])
+                continue
+            return Response(url, status, body, response_headers)
+        raise http.client.HTTPException(f'Too many redirects for {url}')
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+
+
+class RequestsTransport:
+    """Transport on a shared requests Session with a pool sized for the workers"""
+
+    def __init__(self, pool_size: int = 8) -> None:
+        if requests is None:
+            raise ImportError('RequestsTransport needs the requests package')
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url: str, headers: dict[str, str], timeout: float) -> Response:
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        return Response(response.url, response.status_code, response.content, dict(response.headers))
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def default_transport(pool_size: int) -> Transport:
+    return RequestsTransport(pool_size) if requests is not None else HTTPClientTransport()
+
+
+class Fetcher:
+    """Download URLs concurrently with retries and an on-disk cache
+
+    Use as a context manager so pooled connections are closed afterwards.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        workers: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 15,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        headers: Optional[dict[str, str]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.transport = transport or default_transport(workers)
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.sleep = sleep
+
+    def __enter__(self) -> 'Fetcher':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def cache_path(self, url: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest)
+
+    def _read_cache(self, url: str) -> Optional[bytes]:
+        path = self.cache_path(url)
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _write_cache(self, url: str, content: bytes) -> None:
+        path = self.cache_path(url)
+        if path is None:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+    def fetch(self, url: str) -> Optional[bytes]:
+        """Body of ``url``, or None once every attempt has failed"""
+        cached = self._read_cache(url)
+        if cached is not None:
+            return cached
+        error = ''
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                response = self.transport.get(url, self.headers, self.timeout)
+            except Exception as e:  # OSError, HTTPException or requests' own errors
+                error = str(e)
+                continue
+            if response.status == 200:
+                self._write_cache(url, response.content)
+                return response.content
+            error = f'HTTP {response.status}'
+            if response.status not in RETRY_STATUSES:
+                break
+        logger.warning('Error downloading %s: %s', url, error)
+        return None
+
+    def fetch_all(self, urls: Iterable[str]) -> dict[str, Optional[bytes]]:
+        """Fetch every distinct URL on the thread pool; maps each URL to its body or None"""
+        unique = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(unique) or 1))) as pool:
+            return dict(zip(unique, pool.map(self.fetch, unique)))
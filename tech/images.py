@@ -0,0 +1,148 @@
+"""
+Responsive image renditions for tutorial images.
+
+Every uploaded image is resized into a few fixed renditions (a dashboard
+thumbnail, a listing card and a full-width version), each encoded as JPEG
+plus WebP and, when Pillow supports it, AVIF. The generated file names are
+recorded on ``Tutorial.image_renditions`` so templates can build ``srcset``
+attributes without touching storage.
+"""
+import io
+import os
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from PIL import Image, ImageOps, features
+
+
+@dataclass(frozen=True)
+class Rendition:
+    width: int
+    height: Optional[int] = None  # None keeps the aspect ratio
+
+    @property
+    def crop(self) -> bool:
+        return self.height is not None
+
+
+RENDITIONS: dict[str, Rendition] = {
+    'thumb': Rendition(80, 80),     # 40x40 dashboard avatar at 2x
+    'card': Rendition(600, 400),    # listing card
+    'full': Rendition(1200),        # detail page
+}
+
+# (extension, MIME type, Pillow format, save options)
+FORMATS: list[tuple[str, str, str, dict[str, Any]]] = [
+    ('jpg', 'image/jpeg', 'JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+    ('webp', 'image/webp', 'WEBP', {'quality': 80, 'method': 6}),
+]
+if features.check('avif'):
+    FORMATS.append(('avif', 'image/avif', 'AVIF', {'quality': 60}))
+
+MIME_TYPES: dict[str, str] = {ext: mime for ext, mime, _, _ in FORMATS}
+
+
+def rendition_name(source_name: str, rendition: str, ext: str) -> str:
+    """Storage name of one rendition of ``source_name``
+
+    ``tutorials/photo.jpg`` becomes ``tutorials/renditions/photo-card.webp``.
+    """
+    directory, filename = os.path.split(source_name)
+    top, _, rest = directory.partition('/')
+    stem = os.path.splitext(filename)[0]
+    return '/'.join(part for part in (top, 'renditions', rest, f'{stem}-{rendition}.{ext}') if part)
+
+
+def _resize(image: Image.Image, rendition: Rendition) -> Image.Image:
+    if rendition.height is not None:
+        return ImageOps.fit(image, (rendition.width, rendition.height), Image.Resampling.LANCZOS)
+    if image.width <= rendition.width:
+        return image
+    height = round(image.height * rendition.width / image.width)
+    return image.resize((rendition.width, height), Image.Resampling.LANCZOS)
+
+
+def existing_renditions(source_name: str) -> Optional[dict[str, dict[str, str]]]:
+    """Names of a complete, already generated set of renditions, if there is one"""
+    names = {
+        key: {ext: rendition_name(source_name, key, ext) for ext, _, _, _ in FORMATS}
+        for key in RENDITIONS
+    }
+    if all(default_storage.exists(name) for formats in names.values() for name in formats.values()):
+        return names
+    return None
+
+
+def generate_renditions(field_file: Any, force: bool = False) -> dict[str, dict[str, str]]:
+    """Render every rendition of an image file and return their storage names
+
+    Renditions always go to the default storage so their names stay a pure
+    function of the source name. Content-addressed sources never change under
+    the same name, so their existing renditions are reused unless ``force``.
+    """
+    if not force and getattr(field_file.storage, 'content_addressed', False):
+        existing = existing_renditions(field_file.name)
+        if existing is not None:
+            return existing
+    with field_file.open('rb') as source:
+        image = Image.open(source)
+        image = ImageOps.exif_transpose(image)
+        image = image.convert('RGB')
+
+    names: dict[str, dict[str, str]] = {}
+    for key, rendition in RENDITIONS.items():
+        resized = _resize(image, rendition)
+        names[key] = {}
+        for ext, _, pillow_format, options in FORMATS:
+            buffer = io.BytesIO()
+            resized.save(buffer, pillow_format, **options)
+            name = rendition_name(field_file.name, key, ext)
+            if default_storage.exists(name):
+                default_storage.delete(name)
+            names[key][ext] = default_storage.save(name, ContentFile(buffer.getvalue()))
+    return names
+
+
+def delete_renditions(renditions: dict[str, dict[str, str]], keep: Optional[dict[str, dict[str, str]]] = None) -> None:
+    """Remove rendition files that are not also listed in ``keep``"""
+    kept = {name for formats in (keep or {}).values() for name in formats.values()}
+    for formats in renditions.values():
+        for name in formats.values():
+            if name not in kept and default_storage.exists(name):
+                default_storage.delete(name)
+
+
+def refresh_tutorial_image(tutorial: Any, force: bool = False) -> dict[str, dict[str, str]]:
+    """Regenerate a tutorial's renditions and record them without a full save
+
+    Runs in the background via ``tech.tasks.process_tutorial_image``.
+
+    Renditions of a replaced image are cleaned up by the receivers in
+    ``tech.signals`` once nothing references that image any more.
+    """
+    renditions = generate_renditions(tutorial.image, force=force) if tutorial.image else {}
+    status = tutorial.IMAGE_READY if tutorial.image else tutorial.IMAGE_NONE
+    # updated_at changes too, so cached cards and ETags pick up the new renditions
+    type(tutorial).objects.filter(pk=tutorial.pk).update(
+        image_renditions=renditions, image_status=status, updated_at=timezone.now()
+    )
+    tutorial.image_renditions = renditions
+    tutorial.image_status = status
+    return renditions
+
+
+def url(name: str) -> str:
+    return default_storage.url(name)
+
+
+def srcset(renditions: dict[str, dict[str, str]], ext: str, keys: tuple[str, ...] = ('card', 'full')) -> str:
+    """``srcset`` value listing the given renditions in one format"""
+    candidates = []
+    for key in keys:
+        name = renditions.get(key, {}).get(ext)
+        if name:
+            candidates.append(f'{url(name)} {RENDITIONS[key].width}w')
+    return ', '.join(candidates)
@@ -0,0 +1,142 @@
+"""
+A small database-backed job queue.
+
+Work that should not hold up a request is registered as a task with the
+``task`` decorator and queued with ``enqueue``, which only inserts a ``Job``
+row, so it commits or rolls back together with the request's own writes.
+``python manage.py run_jobs`` claims due jobs with a compare-and-swap UPDATE,
+so several workers can share the table without a broker. Failed jobs are
+retried with exponential backoff and kept with their traceback once they run
+out of attempts; finished jobs are deleted.
+"""
+import os
+import socket
+import time
+import traceback
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job
+
+
+@dataclass(frozen=True)
+class Task:
+    func: Callable[..., Any]
+    on_failure: Optional[Callable[..., Any]] = None
+
+
+TASKS: dict[str, Task] = {}
+
+
+def max_attempts() -> int:
+    return int(getattr(settings, 'TECH_JOBS_MAX_ATTEMPTS', 3))
+
+
+def retry_delay() -> int:
+    return int(getattr(settings, 'TECH_JOBS_RETRY_DELAY', 30))
+
+
+def lock_timeout() -> int:
+    return int(getattr(settings, 'TECH_JOBS_LOCK_TIMEOUT', 600))
+
+
+def task(name: str, on_failure: Optional[Callable[..., Any]] = None) -> Callable[..., Any]:
+    """Register a function as a task
+
+    ``on_failure`` is called with the job's payload once its last attempt fails.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        TASKS[name] = Task(func, on_failure)
+        return func
+    return decorator
+
+
+def enqueue(name: str, run_at: Optional[Any] = None, attempts: Optional[int] = None, **payload: Any) -> Job:
+    """Queue a task with JSON-serializable keyword arguments"""
+    if name not in TASKS:
+        raise LookupError(f'Unknown task {name!r}')
+    return Job.objects.create(
+        task=name,
+        payload=payload,
+        run_at=run_at or timezone.now(),
+        max_attempts=attempts or max_attempts(),
+    )
+
+
+def worker_name() -> str:
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def _claimable(now: Any) -> Q:
+    stale = now - timedelta(seconds=lock_timeout())
+    return Q(status=Job.PENDING, run_at__lte=now) | Q(status=Job.RUNNING, locked_at__lt=stale)
+
+
+def claim(worker: str) -> Optional[Job]:
+    """Lock the next due job for ``worker``, or return None if nothing is due
+
+    Jobs whose worker died mid-run are picked up again after the lock timeout.
+    """
+    now = timezone.now()
+    candidates = Job.objects.filter(_claimable(now)).order_by('run_at', 'pk').values_list('pk', flat=True)
+    for pk in candidates[:10]:
+        # Only one worker's UPDATE can match while the job is still claimable
+        claimed = Job.objects.filter(_claimable(now), pk=pk).update(
+            status=Job.RUNNING, locked_by=worker, locked_at=now, attempts=F('attempts') + 1
+        )
+        if claimed:
+            return Job.objects.get(pk=pk)
+    return None
+
+
+def run(job: Job) -> bool:
+    """Run a claimed job; returns True if it succeeded"""
+    registered = TASKS.get(job.task)
+    try:
+        if registered is None:
+            raise LookupError(f'Unknown task {job.task!r}')
+        registered.func(**job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        jobs = Job.objects.filter(pk=job.pk)
+        if job.attempts < job.max_attempts:
+            delay = retry_delay() * 2 ** (job.attempts - 1)
+            jobs.update(
+                status=Job.PENDING, run_at=timezone.now() + timedelta(seconds=delay),
+                locked_by='', locked_at=None, last_error=error,
+            )
+        else:
+            jobs.update(status=Job.FAILED, locked_by='', locked_at=None, last_error=error)
+            if registered is not None and registered.on_failure is not None:
+                registered.on_failure(**job.payload)
+        return False
+    Job.objects.filter(pk=job.pk).delete()
+    return True
+
+
+def work(worker: Optional[str] = None, burst: bool = False, max_jobs: Optional[int] = None,
+         sleep: float = 1.0) -> tuple[int, int]:
+    """Claim and run jobs until stopped
+
+    With ``burst`` the loop ends once no job is due. Returns the number of
+    jobs that succeeded and failed.
+    """
+    worker = worker or worker_name()
+    succeeded = failed = 0
+    while max_jobs is None or succeeded + failed < max_jobs:
+        job = claim(worker)
+        if job is None:
+            if burst:
+                break
+            time.sleep(sleep)
+            continue
+        if run(job):
+            succeeded += 1
+        else:
+            failed += 1
+    return succeeded, failed
@@ -0,0 +1,137 @@
+import os
+import time
+from collections import defaultdict
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.utils import timezone
+
+from tech import caching, images
+from tech.models import MediaBlob, Tutorial
+from tech.storage import HASHED_BASENAME, file_digest, hashed_name
+
+
+def target_name(names: list[str], digest: str) -> str:
+    """The content-addressed name a group of identical files should share"""
+    for name in names:
+        if os.path.splitext(os.path.basename(name))[0] == digest:
+            return name
+    return hashed_name(names[0], digest)
+
+
+def orphaned_names(storage: Any, directory: str, referenced: set[str], max_age: float) -> Iterator[str]:
+    """Content-addressed files under ``directory`` that no row references
+
+    Files modified within ``max_age`` seconds are skipped: their upload may
+    still be in a transaction that has not committed.
+    """
+    root = storage.path(directory)
+    cutoff = time.time() - max_age
+    for path, _, filenames in os.walk(root):
+        for filename in sorted(filenames):
+            # Legacy names are left to the merge above; .upload files are interrupted writes
+            if not (HASHED_BASENAME.match(filename) or filename.endswith('.upload')):
+                continue
+            full_path = os.path.join(path, filename)
+            name = os.path.relpath(full_path, storage.location).replace(os.sep, '/')
+            if name not in referenced and os.path.getmtime(full_path) < cutoff:
+                yield name
+
+
+class Command(BaseCommand):
+    help = 'Move tutorial images to content-addressed names and delete duplicate and orphaned copies'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be reclaimed without changing anything')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        storage = Tutorial._meta.get_field('image').storage
+        if not getattr(storage, 'content_addressed', False):
+            raise CommandError('Tutorial.image does not use a content-addressed storage')
+        dry_run = options['dry_run']
+
+        # Group every stored image name still referenced by a tutorial by content
+        rows: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        queryset = Tutorial.objects.exclude(image='').exclude(image__isnull=True)
+        for name, renditions in queryset.values_list('image', 'image_renditions').iterator():
+            rows[name].append(renditions or {})
+
+        by_digest: dict[str, list[str]] = defaultdict(list)
+        for name in rows:
+            if not storage.exists(name):
+                self.stderr.write(f'Missing file: {name}')
+                continue
+            with storage.open(name, 'rb') as f:
+                by_digest[file_digest(f)].append(name)
+
+        targets: dict[str, str] = {}
+        moved = removed = reclaimed = 0
+        for digest, names in by_digest.items():
+            target = target_name(names, digest)
+            targets[target] = digest
+            legacy = [name for name in names if name != target]
+            if not legacy:
+                continue
+            size = storage.size(names[0])
+            copies = len(legacy) - (0 if target in names else 1)
+            reclaimed += size * copies
+            removed += copies
+            moved += 1
+            self.stdout.write(f'{", ".join(legacy)} -> {target}')
+            if dry_run:
+                continue
+            if not storage.exists(target):
+                os.makedirs(os.path.dirname(storage.path(target)), exist_ok=True)
+                os.replace(storage.path(legacy[0]), storage.path(target))
+            # updated_at changes too, so cached cards and ETags stop naming the deleted files
+            Tutorial.objects.filter(image__in=legacy).update(
+                image=target, image_renditions={}, updated_at=timezone.now()
+            )
+            for name in legacy:
+                for renditions in rows[name]:
+                    images.delete_renditions(renditions)
+                if storage.exists(name):
+                    os.remove(storage.path(name))
+
+        # Uploads whose transaction rolled back leave files that no row names
+        referenced = set(queryset.values_list('image', flat=True))
+        max_age = float(getattr(settings, 'TECH_MEDIA_ORPHAN_AGE', 3600))
+        directory = Tutorial._meta.get_field('image').upload_to
+        orphans = list(orphaned_names(storage, directory, referenced, max_age))
+        for name in orphans:
+            reclaimed += storage.size(name)
+            self.stdout.write(f'Orphaned: {name}')
+            if not dry_run:
+                os.remove(storage.path(name))
+                MediaBlob.objects.filter(name=name).delete()
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f'Would merge {moved} images, removing {removed} copies and {len(orphans)} orphans '
+                f'({reclaimed} bytes)'
+            ))
+            return
+
+        # Reference counts follow the rows that now point at each hashed name
+        counts: dict[str, int] = defaultdict(int)
+        for name in queryset.values_list('image', flat=True):
+            counts[name] += 1
+        with transaction.atomic():
+            for name, count in counts.items():
+                digest = targets.get(name)
+                if digest is None:
+                    continue
+                MediaBlob.objects.update_or_create(
+                    name=name,
+                    defaults={'digest': digest, 'size': storage.size(name), 'ref_count': count},
+                )
+            MediaBlob.objects.exclude(name__in=list(counts)).update(ref_count=0)
+        if moved:
+            caching.bump_version('tutorial')
+        self.stdout.write(self.style.SUCCESS(
+            f'Merged {moved} images, removed {removed} copies and {len(orphans)} orphans, '
+            f'and reclaimed {reclaimed} bytes; '
+            f'run generate_renditions to rebuild their renditions'
+        ))
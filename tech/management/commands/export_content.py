@@ -0,0 +1,66 @@
+import gzip
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from tech import bundles
+
+
+def parse_moment(value: str, end_of_day: bool = False) -> datetime:
+    """Parse an ISO date or datetime; a bare date means its midnight (or the next one)"""
+    moment = parse_datetime(value)
+    if moment is None:
+        date = parse_date(value)
+        if date is None:
+            raise CommandError(f'Invalid date {value!r}; use YYYY-MM-DD or an ISO datetime')
+        moment = datetime.combine(date + timedelta(days=1) if end_of_day else date, datetime.min.time())
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+class Command(BaseCommand):
+    help = 'Stream tutorials, articles and snippets to NDJSON (gzipped for .gz paths) for import_content'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('output', help='Output file, e.g. backup.ndjson.gz, or - for plain NDJSON on stdout')
+        parser.add_argument('--type', action='append', choices=list(bundles.KINDS), dest='types',
+                            help='Only export this type (repeatable); default is every type')
+        parser.add_argument('--author', help='Only export rows by this username')
+        parser.add_argument('--since', help='Only rows created on or after this date or datetime')
+        parser.add_argument('--until', help='Only rows created up to this date (inclusive) or before this datetime')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows fetched per database round trip')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        since: Optional[datetime] = parse_moment(options['since']) if options['since'] else None
+        until: Optional[datetime] = parse_moment(options['until'], end_of_day=True) if options['until'] else None
+        records = bundles.export_records(
+            options['types'], author=options['author'], since=since, until=until, chunk_size=options['chunk_size']
+        )
+
+        started = time.perf_counter()
+        path: str = options['output']
+        if path == '-':
+            count = self.write(records, self.stdout)
+        else:
+            opener: Any = gzip.open if path.endswith('.gz') else open
+            with opener(path, 'wt', encoding='utf-8') as f:
+                count = self.write(records, f)
+        elapsed = time.perf_counter() - started
+        if path != '-':
+            self.stdout.write(self.style.SUCCESS(
+                f'Exported {count} records to {path} in {elapsed:.2f}s '
+                f'({count / elapsed if elapsed else 0:,.0f} records/s)'
+            ))
+
+    def write(self, records: Any, f: Any) -> int:
+        count = 0
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            count += 1
+        return count
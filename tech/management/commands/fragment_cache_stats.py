@@ -0,0 +1,24 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from tech import caching
+
+
+class Command(BaseCommand):
+    help = 'Show template fragment cache hits and misses per fragment'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--reset', action='store_true', help='Zero the counters after reporting them')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        stats = caching.fragment_stats()
+        if not stats:
+            self.stdout.write('No fragments rendered yet')
+        for name, counts in stats.items():
+            total = counts['hits'] + counts['misses']
+            ratio = counts['hits'] / total if total else 0.0
+            self.stdout.write(f"{name:<20} {counts['hits']:>8} hits {counts['misses']:>8} misses {ratio:>7.1%}")
+        if options['reset']:
+            caching.reset_fragment_stats()
+            self.stdout.write(self.style.SUCCESS('Counters reset'))
@@ -0,0 +1,28 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from tech import images
+from tech.models import Tutorial
+
+
+class Command(BaseCommand):
+    help = 'Generate thumbnail, card and full-width renditions for tutorial images'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--force', action='store_true', help='Regenerate renditions that already exist')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        queryset = Tutorial.objects.exclude(image='').exclude(image__isnull=True).only('pk', 'image', 'image_renditions')
+        if not options['force']:
+            queryset = queryset.filter(image_renditions={})
+        generated = failed = 0
+        for tutorial in queryset.order_by('pk').iterator(chunk_size=100):
+            try:
+                images.refresh_tutorial_image(tutorial, force=options['force'])
+            except (OSError, ValueError) as e:
+                failed += 1
+                self.stderr.write(f'Tutorial {tutorial.pk} ({tutorial.image.name}): {e}')
+                continue
+            generated += 1
+        self.stdout.write(self.style.SUCCESS(f'Generated renditions for {generated} tutorials ({failed} failed)'))
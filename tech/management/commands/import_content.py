@@ -0,0 +1,42 @@
+import itertools
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from tech import bundles
+
+
+class Command(BaseCommand):
+    help = 'Create or update tutorials, articles and snippets from JSON, YAML, NDJSON or Markdown bundles'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('paths', nargs='+', help='Bundle files or directories of Markdown files')
+        parser.add_argument('--author', default='admin', help='Existing user who authors new rows whose record names none')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows written per transaction')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        started = time.perf_counter()
+        records = itertools.chain.from_iterable(bundles.read_bundle(path) for path in options['paths'])
+        try:
+            results, created_authors = bundles.import_records(
+                records, default_author=options['author'], batch_size=options['batch_size']
+            )
+        except (bundles.BundleError, OSError) as e:
+            raise CommandError(str(e)) from e
+        elapsed = time.perf_counter() - started
+
+        if created_authors:
+            self.stdout.write(f'Created authors: {", ".join(created_authors)}')
+        for name, result in results.items():
+            if not result.total:
+                continue
+            rate = result.total / result.seconds if result.seconds else 0
+            self.stdout.write(
+                f'{name.capitalize()}s: {result.created} created, {result.updated} updated, '
+                f'{result.unchanged} unchanged in {result.seconds:.2f}s ({rate:,.0f} rows/s)'
+            )
+        total = sum(result.total for result in results.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {total} records in {elapsed:.2f}s ({total / elapsed if elapsed else 0:,.0f} records/s)'
+        ))
@@ -0,0 +1,21 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from tech import related
+
+
+class Command(BaseCommand):
+    help = 'Recompute the related tutorials and articles shown on detail pages'
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        backend = 'NumPy' if related.np is not None else 'pure Python'
+        self.stdout.write(f'Using {backend} similarity sums')
+        for model in related.RELATED_MODELS:
+            started = time.perf_counter()
+            count = related.rebuild(model)
+            self.stdout.write(self.style.SUCCESS(
+                f'Stored {count} related {model._meta.verbose_name_plural.lower()} '
+                f'in {time.perf_counter() - started:.2f}s'
+            ))
@@ -0,0 +1,23 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from tech import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for tutorials and articles'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='Database alias to rebuild')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Rows fetched per query')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        backend = search.get_backend(options['database'])
+        self.stdout.write(f'Using {type(backend).__name__}')
+        for model in search.searchable_models():
+            with transaction.atomic(using=options['database']):
+                backend.install(model)
+                count = backend.rebuild(model, chunk_size=options['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(f'Indexed {count} {model._meta.verbose_name_plural.lower()}'))
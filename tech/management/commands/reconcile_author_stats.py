@@ -0,0 +1,17 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from tech import stats
+
+
+class Command(BaseCommand):
+    help = 'Recompute per-author content counters from the tutorial, article and snippet tables'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('authors', nargs='*', type=int, help='User ids to reconcile (default: everyone)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Authors recomputed per query')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        drifted = stats.reconcile(options['authors'] or None, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Reconciled author stats ({drifted} rows corrected)'))
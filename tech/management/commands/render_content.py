@@ -0,0 +1,48 @@
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from tech.highlighting import highlight_code
+from tech.models import Article, Snippet, Tutorial
+from tech.rendering import render_content
+
+# (model, fields to load, stored HTML field, renderer)
+TARGETS: list[tuple[Any, tuple[str, ...], str, Callable[[Any], str]]] = [
+    (Tutorial, ('content',), 'content_html', lambda row: render_content(row.content)),
+    (Article, ('content',), 'content_html', lambda row: render_content(row.content)),
+    (Snippet, ('code', 'language'), 'code_html', lambda row: highlight_code(row.code, row.language)),
+]
+
+
+class Command(BaseCommand):
+    help = 'Backfill the pre-rendered HTML of tutorial and article bodies and highlighted snippets'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--all', action='store_true', help='Re-render every row, not just rows without HTML')
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows written per UPDATE batch')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size: int = options['batch_size']
+        for model, sources, target, render in TARGETS:
+            queryset = model.objects.only('pk', *sources).order_by('pk')
+            if not options['all']:
+                queryset = queryset.filter(**{target: ''})
+            rendered = 0
+            batch = []
+            for instance in queryset.iterator(chunk_size=batch_size):
+                setattr(instance, target, render(instance))
+                batch.append(instance)
+                if len(batch) >= batch_size:
+                    rendered += self.flush(model, batch, target)
+            rendered += self.flush(model, batch, target)
+            self.stdout.write(self.style.SUCCESS(f'Rendered {rendered} {model._meta.verbose_name_plural.lower()}'))
+
+    def flush(self, model: Any, batch: list[Any], target: str) -> int:
+        """Write a batch of rendered rows without touching updated_at"""
+        count = len(batch)
+        if batch:
+            with transaction.atomic():
+                model.objects.bulk_update(batch, [target])
+            batch.clear()
+        return count
@@ -0,0 +1,26 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from tech import jobs
+
+
+class Command(BaseCommand):
+    help = 'Run queued background jobs such as image processing'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--burst', action='store_true', help='Exit once no job is due instead of waiting for more')
+        parser.add_argument('--max-jobs', type=int, default=None, help='Exit after running this many jobs')
+        parser.add_argument('--sleep', type=float, default=1.0, help='Seconds to wait between polls of an empty queue')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        worker = jobs.worker_name()
+        if options['verbosity'] > 1:
+            self.stdout.write(f'Worker {worker} started')
+        try:
+            succeeded, failed = jobs.work(
+                worker, burst=options['burst'], max_jobs=options['max_jobs'], sleep=options['sleep']
+            )
+        except KeyboardInterrupt:
+            return
+        self.stdout.write(self.style.SUCCESS(f'Ran {succeeded} jobs ({failed} failed)'))
@@ -0,0 +1,39 @@
+import os
+import sqlite3
+import tempfile
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from tech import routing
+
+
+class Command(BaseCommand):
+    help = 'Copy the primary SQLite database into each SQLite replica file, to try replica routing locally'
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        primary = connections[DEFAULT_DB_ALIAS]
+        if primary.vendor != 'sqlite':
+            raise CommandError('The primary database is not SQLite')
+        aliases = routing.replica_aliases()
+        if not aliases:
+            raise CommandError('No replicas are configured; set TECHBLOG_SQLITE_REPLICAS')
+        primary.ensure_connection()
+        for alias in aliases:
+            replica = connections[alias]
+            if replica.vendor != 'sqlite':
+                self.stdout.write(self.style.WARNING(f'Skipping {alias}: not SQLite'))
+                continue
+            name = str(replica.settings_dict['NAME'])
+            replica.close()
+            # Copy into a temporary file and swap it in, so readers never see a partial copy
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(name) or '.', suffix='.sqlite3')
+            os.close(fd)
+            target = sqlite3.connect(temp_path)
+            try:
+                primary.connection.backup(target)
+            finally:
+                target.close()
+            os.replace(temp_path, name)
+            self.stdout.write(self.style.SUCCESS(f'Copied {primary.settings_dict["NAME"]} to {alias} ({name})'))
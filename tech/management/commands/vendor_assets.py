@@ -0,0 +1,30 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from tech import vendor
+from tech.fetcher import Fetcher
+
+
+class Command(BaseCommand):
+    help = 'Copy the pinned Bootstrap, Font Awesome and clipboard.js releases into static/vendor/, trimmed to what the site uses'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--update', action='store_true',
+                            help='Accept upstream files that no longer match vendor.lock.json')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if vendor.font_subset is None:
+            self.stdout.write(self.style.WARNING('fontTools is not installed; icon fonts are copied whole'))
+        try:
+            with Fetcher(workers=4) as fetcher:
+                report = vendor.vendor_assets(fetcher, update=options['update'])
+        except ValueError as e:
+            raise CommandError(str(e))
+        for path, original, size in report:
+            self.stdout.write(f'{path:<48} {original / 1024:8.1f} KB -> {size / 1024:7.1f} KB')
+        original = sum(row[1] for row in report)
+        size = sum(row[2] for row in report)
+        self.stdout.write(self.style.SUCCESS(
+            f'Vendored {len(report)} files: {original / 1024:.1f} KB -> {size / 1024:.1f} KB'
+        ))
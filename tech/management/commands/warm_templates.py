@@ -0,0 +1,20 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from tech.warmup import warm_templates
+
+
+class Command(BaseCommand):
+    help = 'Compile every template under templates/tech/ and report how long each took'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--prefix', default='tech', help='Template folder to compile')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        timings = warm_templates(options['prefix'])
+        for name, seconds in timings.items():
+            self.stdout.write(f'{name:<32} {seconds * 1000:8.2f} ms')
+        self.stdout.write(self.style.SUCCESS(
+            f'Compiled {len(timings)} templates in {sum(timings.values()) * 1000:.1f} ms'
+        ))
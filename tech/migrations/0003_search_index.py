@@ -0,0 +1,28 @@
+from django.db import migrations
+
+from tech import search
+
+
+def create_search_index(apps, schema_editor):
+    backend = search.get_backend(schema_editor.connection.alias)
+    for name in ('Tutorial', 'Article'):
+        model = apps.get_model('tech', name)
+        backend.install(model)
+        backend.rebuild(model)
+
+
+def drop_search_index(apps, schema_editor):
+    backend = search.get_backend(schema_editor.connection.alias)
+    for name in ('Tutorial', 'Article'):
+        backend.uninstall(apps.get_model('tech', name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0002_remove_quiz_author_remove_userquizattempt_quiz_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0003_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-created_at'], name='tech_article_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', '-created_at'], name='tech_article_author_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='snippet',
+            index=models.Index(fields=['-created_at'], name='tech_snippet_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='snippet',
+            index=models.Index(fields=['author', '-created_at'], name='tech_snippet_author_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='snippet',
+            index=models.Index(fields=['language', '-created_at'], name='tech_snippet_language_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tutorial',
+            index=models.Index(fields=['-created_at'], name='tech_tutorial_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tutorial',
+            index=models.Index(fields=['author', '-created_at'], name='tech_tutorial_author_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def backfill_author_stats(apps, schema_editor):
+    AuthorStats = apps.get_model('tech', 'AuthorStats')
+    rows = {}
+    for name, field, activity in (
+        ('Tutorial', 'tutorial_count', 'updated_at'),
+        ('Article', 'article_count', 'updated_at'),
+        ('Snippet', 'snippet_count', 'created_at'),
+    ):
+        model = apps.get_model('tech', name)
+        totals = model.objects.order_by().values('author_id').annotate(total=Count('pk'), latest=Max(activity))
+        for row in totals:
+            stats = rows.setdefault(row['author_id'], AuthorStats(author_id=row['author_id']))
+            setattr(stats, field, row['total'])
+            if stats.last_activity_at is None or row['latest'] > stats.last_activity_at:
+                stats.last_activity_at = row['latest']
+    AuthorStats.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('tech', '0004_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthorStats',
+            fields=[
+                ('author', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='content_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('tutorial_count', models.IntegerField(default=0)),
+                ('article_count', models.IntegerField(default=0)),
+                ('snippet_count', models.IntegerField(default=0)),
+                ('last_activity_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Author stats',
+                'verbose_name_plural': 'Author stats',
+            },
+        ),
+        migrations.RunPython(backfill_author_stats, migrations.RunPython.noop),
+    ]
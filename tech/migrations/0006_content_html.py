@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0005_author_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='tutorial',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
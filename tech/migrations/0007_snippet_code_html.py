@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0006_content_html'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='snippet',
+            name='code_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0007_snippet_code_html'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tutorial',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
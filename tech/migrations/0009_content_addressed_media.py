@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:28
+
+import django.utils.timezone
+import tech.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0008_tutorial_image_renditions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('digest', models.CharField(db_index=True, max_length=64)),
+                ('size', models.BigIntegerField()),
+                ('ref_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Media blob',
+                'verbose_name_plural': 'Media blobs',
+            },
+        ),
+        migrations.AlterField(
+            model_name='tutorial',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=tech.storage.get_image_storage, upload_to='tutorials/'),
+        ),
+    ]
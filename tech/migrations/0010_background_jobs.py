@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:32
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def backfill_image_status(apps, schema_editor):
+    Tutorial = apps.get_model('tech', 'Tutorial')
+    Job = apps.get_model('tech', 'Job')
+    with_image = Tutorial.objects.exclude(image='').exclude(image__isnull=True)
+    with_image.exclude(image_renditions={}).update(image_status='ready')
+    # Images uploaded without renditions are queued for the worker
+    pending = with_image.filter(image_renditions={})
+    Job.objects.bulk_create(
+        [
+            Job(task='process_tutorial_image', payload={'tutorial_id': pk, 'image': image})
+            for pk, image in pending.values_list('pk', 'image')
+        ],
+        batch_size=1000,
+    )
+    pending.update(image_status='pending')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0009_content_addressed_media'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tutorial',
+            name='image_status',
+            field=models.CharField(choices=[('none', 'No image'), ('pending', 'Pending'), ('processing', 'Processing'), ('ready', 'Ready'), ('failed', 'Failed')], default='none', editable=False, max_length=20),
+        ),
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task', models.CharField(max_length=100)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('max_attempts', models.IntegerField(default=3)),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_by', models.CharField(blank=True, max_length=100)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Job',
+                'verbose_name_plural': 'Jobs',
+                'indexes': [models.Index(fields=['status', 'run_at'], name='tech_job_due_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_image_status, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0010_background_jobs'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['title'], name='tech_article_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='snippet',
+            index=models.Index(fields=['title'], name='tech_snippet_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tutorial',
+            index=models.Index(fields=['title'], name='tech_tutorial_title_idx'),
+        ),
+    ]
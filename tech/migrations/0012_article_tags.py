@@ -0,0 +1,95 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:41
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def split_tags(text):
+    names = []
+    for raw in re.split(r'[\s,]+', text or ''):
+        name = raw.strip('#').lower()[:50]
+        if name and slugify(name) and name not in names:
+            names.append(name)
+    return names
+
+
+def tags_from_text(apps, schema_editor):
+    Article = apps.get_model('tech', 'Article')
+    Tag = apps.get_model('tech', 'Tag')
+    ArticleTag = apps.get_model('tech', 'ArticleTag')
+    tags = {}
+    links = []
+    for article_id, text in Article.objects.values_list('pk', 'tags').iterator():
+        for name in split_tags(text):
+            slug = slugify(name)
+            if slug not in tags:
+                tags[slug] = Tag.objects.get_or_create(slug=slug, defaults={'name': name})[0]
+            links.append(ArticleTag(article_id=article_id, tag=tags[slug]))
+    ArticleTag.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+
+
+def tags_to_text(apps, schema_editor):
+    Article = apps.get_model('tech', 'Article')
+    ArticleTag = apps.get_model('tech', 'ArticleTag')
+    names = {}
+    for article_id, name in ArticleTag.objects.order_by('pk').values_list('article_id', 'tag__name'):
+        names.setdefault(article_id, []).append(name)
+    for article_id, article_names in names.items():
+        Article.objects.filter(pk=article_id).update(tags=' '.join(article_names)[:200])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0011_title_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('slug', models.SlugField(max_length=60, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Tag',
+                'verbose_name_plural': 'Tags',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArticleTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='article_tags', to='tech.article')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='article_tags', to='tech.tag')),
+            ],
+            options={
+                'verbose_name': 'Article tag',
+                'verbose_name_plural': 'Article tags',
+            },
+        ),
+        # The unique constraint must exist before tags_from_text relies on ignore_conflicts
+        migrations.AddConstraint(
+            model_name='articletag',
+            constraint=models.UniqueConstraint(fields=('article', 'tag'), name='tech_articletag_unique'),
+        ),
+        migrations.RunPython(tags_from_text, tags_to_text),
+        migrations.RemoveField(
+            model_name='article',
+            name='tags',
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='tags',
+            field=models.ManyToManyField(blank=True, related_name='articles', through='tech.ArticleTag', to='tech.tag'),
+        ),
+        migrations.AddIndex(
+            model_name='articletag',
+            index=models.Index(fields=['tag', 'article'], name='tech_articletag_tag_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0012_article_tags'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('score', models.FloatField()),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_items', to='tech.article')),
+                ('target', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_to', to='tech.article')),
+            ],
+            options={
+                'verbose_name': 'Related article',
+                'verbose_name_plural': 'Related articles',
+                'indexes': [models.Index(fields=['source', 'rank'], name='tech_relatedarticle_src_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='RelatedTutorial',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('score', models.FloatField()),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_items', to='tech.tutorial')),
+                ('target', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_to', to='tech.tutorial')),
+            ],
+            options={
+                'verbose_name': 'Related tutorial',
+                'verbose_name_plural': 'Related tutorials',
+                'indexes': [models.Index(fields=['source', 'rank'], name='tech_relatedtutorial_src_idx')],
+            },
+        ),
+    ]
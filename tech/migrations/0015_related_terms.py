@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0014_snippet_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.FloatField()),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_terms', to='tech.article')),
+            ],
+            options={
+                'verbose_name': 'Article term',
+                'verbose_name_plural': 'Article terms',
+                'indexes': [models.Index(fields=['term'], name='tech_articleterm_term_idx')],
+                'constraints': [models.UniqueConstraint(fields=('item', 'term'), name='tech_articleterm_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TutorialTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.FloatField()),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_terms', to='tech.tutorial')),
+            ],
+            options={
+                'verbose_name': 'Tutorial term',
+                'verbose_name_plural': 'Tutorial terms',
+                'indexes': [models.Index(fields=['term'], name='tech_tutorialterm_term_idx')],
+                'constraints': [models.UniqueConstraint(fields=('item', 'term'), name='tech_tutorialterm_unique')],
+            },
+        ),
+    ]
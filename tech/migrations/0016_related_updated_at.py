@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tech', '0015_related_terms'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='related_updated_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='tutorial',
+            name='related_updated_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -4,35 +4,100 @@ from django.utils import timezone
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from . import images
+from .storage import get_image_storage
+
 if TYPE_CHECKING:
-    from django.db.models.fields import CharField, TextField, DateTimeField
+    from django.db.models.fields import BigIntegerField, CharField, FloatField, SlugField, TextField, DateTimeField, IntegerField
+    from django.db.models.fields.json import JSONField
     from django.db.models.fields.files import ImageFieldFile, ImageField
-    from django.db.models.fields.related import ForeignKey
+    from django.db.models.fields.related import ForeignKey, ManyToManyField, OneToOneField
     from django.db.models.fields.files import ImageField as ImageFieldType
 
 class Tutorial(models.Model):
+    IMAGE_NONE = 'none'
+    IMAGE_PENDING = 'pending'
+    IMAGE_PROCESSING = 'processing'
+    IMAGE_READY = 'ready'
+    IMAGE_FAILED = 'failed'
+    IMAGE_STATUS_CHOICES = [
+        (IMAGE_NONE, 'No image'),
+        (IMAGE_PENDING, 'Pending'),
+        (IMAGE_PROCESSING, 'Processing'),
+        (IMAGE_READY, 'Ready'),
+        (IMAGE_FAILED, 'Failed'),
+    ]
+
     title: 'CharField[str, str]' = models.CharField(max_length=200)
     description: 'TextField[str, str]' = models.TextField()
     content: 'TextField[str, str]' = models.TextField()
-    image: 'ImageField | None' = models.ImageField(upload_to='tutorials/', blank=True, null=True)
+    content_html: 'TextField[str, str]' = models.TextField(blank=True, editable=False)
+    image: 'ImageField | None' = models.ImageField(upload_to='tutorials/', storage=get_image_storage, blank=True, null=True)
+    image_renditions: 'JSONField[dict, dict]' = models.JSONField(default=dict, blank=True, editable=False)
+    image_status: 'CharField[str, str]' = models.CharField(
+        max_length=20, choices=IMAGE_STATUS_CHOICES, default=IMAGE_NONE, editable=False
+    )
     created_at: 'DateTimeField[datetime, datetime]' = models.DateTimeField(default=timezone.now)
     updated_at: 'DateTimeField[datetime, datetime]' = models.DateTimeField(auto_now=True)
+    # When tech.related last changed this tutorial's related items
+    related_updated_at: 'DateTimeField[datetime | None, datetime | None]' = models.DateTimeField(null=True, blank=True, editable=False)
     author: 'ForeignKey[User, User]' = models.ForeignKey(User, on_delete=models.CASCADE)
     
     def __str__(self):
         return self.title
     
+    def _rendition_url(self, rendition: str) -> str:
+        name = (self.image_renditions or {}).get(rendition, {}).get('jpg')
+        if name:
+            return images.url(name)
+        return self.image.url if self.image else ''
+    
+    @property
+    def thumbnail_url(self) -> str:
+        """Small square rendition, falling back to the original image"""
+        return self._rendition_url('thumb')
+    
+    @property
+    def card_url(self) -> str:
+        """Listing card rendition, falling back to the original image"""
+        return self._rendition_url('card')
+    
+    @property
+    def image_srcset(self) -> str:
+        """JPEG srcset of the card and full-width renditions"""
+        return images.srcset(self.image_renditions or {}, 'jpg')
+    
+    @property
+    def image_sources(self) -> list[dict[str, str]]:
+        """<source> type/srcset pairs for the modern formats, best first"""
+        sources = []
+        for ext in ('avif', 'webp'):
+            srcset = images.srcset(self.image_renditions or {}, ext)
+            if srcset:
+                sources.append({'type': images.MIME_TYPES[ext], 'srcset': srcset})
+        return sources
+    
     class Meta:
         verbose_name = 'Tutorial'
         verbose_name_plural = 'Tutorials'
+        indexes = [
+            models.Index(fields=['-created_at'], name='tech_tutorial_created_idx'),
+            models.Index(fields=['author', '-created_at'], name='tech_tutorial_author_idx'),
+            models.Index(fields=['title'], name='tech_tutorial_title_idx'),
+        ]
 
 class Article(models.Model):
     title: 'CharField[str, str]' = models.CharField(max_length=200)
     content: 'TextField[str, str]' = models.TextField()
+    content_html: 'TextField[str, str]' = models.TextField(blank=True, editable=False)
     author: 'ForeignKey[User, User]' = models.ForeignKey(User, on_delete=models.CASCADE)
     created_at: 'DateTimeField[datetime, datetime]' = models.DateTimeField(default=timezone.now)
     updated_at: 'DateTimeField[datetime, datetime]' = models.DateTimeField(auto_now=True)
-    tags: 'CharField[str, str]' = models.CharField(max_length=200, blank=True)
+    # When tech.related last changed this article's related items
+    related_updated_at: 'DateTimeField[datetime | None, datetime | None]' = models.DateTimeField(null=True, blank=True, editable=False)
+    tags: 'ManyToManyField[Tag, ArticleTag]' = models.ManyToManyField(
+        'Tag', through='ArticleTag', related_name='articles', blank=True
+    )
     
     def __str__(self):
         return self.title
@@ -40,6 +105,112 @@ class Article(models.Model):
     class Meta:
         verbose_name = 'Article'
         verbose_name_plural = 'Articles'
+        indexes = [
+            models.Index(fields=['-created_at'], name='tech_article_created_idx'),
+            models.Index(fields=['author', '-created_at'], name='tech_article_author_idx'),
+            models.Index(fields=['title'], name='tech_article_title_idx'),
+        ]
+
+class Tag(models.Model):
+    """A normalized article tag; ``slug`` is what tag URLs and lookups use"""
+    name: 'CharField[str, str]' = models.CharField(max_length=50, unique=True)
+    slug: 'SlugField[str, str]' = models.SlugField(max_length=60, unique=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        verbose_name = 'Tag'
+        verbose_name_plural = 'Tags'
+        ordering = ['name']
+
+class ArticleTag(models.Model):
+    """Through table for Article.tags, indexed in both directions"""
+    article: 'ForeignKey[Article, Article]' = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='article_tags')
+    tag: 'ForeignKey[Tag, Tag]' = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='article_tags')
+
+    def __str__(self):
+        return f'{self.article_id}: {self.tag_id}'
+
+    class Meta:
+        verbose_name = 'Article tag'
+        verbose_name_plural = 'Article tags'
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'tag'], name='tech_articletag_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['tag', 'article'], name='tech_articletag_tag_idx'),
+        ]
+
+class RelatedItem(models.Model):
+    """One precomputed "related content" entry, refreshed by tech.related"""
+    rank: 'IntegerField[int, int]' = models.PositiveSmallIntegerField()
+    score: 'FloatField[float, float]' = models.FloatField()
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return f'{self.source_id} -> {self.target_id} (#{self.rank})'
+
+class RelatedTutorial(RelatedItem):
+    source: 'ForeignKey[Tutorial, Tutorial]' = models.ForeignKey(Tutorial, on_delete=models.CASCADE, related_name='related_items')
+    target: 'ForeignKey[Tutorial, Tutorial]' = models.ForeignKey(Tutorial, on_delete=models.CASCADE, related_name='related_to')
+
+    class Meta:
+        verbose_name = 'Related tutorial'
+        verbose_name_plural = 'Related tutorials'
+        indexes = [
+            models.Index(fields=['source', 'rank'], name='tech_relatedtutorial_src_idx'),
+        ]
+
+class RelatedArticle(RelatedItem):
+    source: 'ForeignKey[Article, Article]' = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='related_items')
+    target: 'ForeignKey[Article, Article]' = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='related_to')
+
+    class Meta:
+        verbose_name = 'Related article'
+        verbose_name_plural = 'Related articles'
+        indexes = [
+            models.Index(fields=['source', 'rank'], name='tech_relatedarticle_src_idx'),
+        ]
+
+class RelatedTerm(models.Model):
+    """One weighted term of an item's TF-IDF vector, kept by tech.related for incremental refreshes"""
+    term: 'CharField[str, str]' = models.CharField(max_length=64)
+    weight: 'FloatField[float, float]' = models.FloatField()
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return f'{self.item_id}: {self.term} ({self.weight:.3f})'
+
+class TutorialTerm(RelatedTerm):
+    item: 'ForeignKey[Tutorial, Tutorial]' = models.ForeignKey(Tutorial, on_delete=models.CASCADE, related_name='related_terms')
+
+    class Meta:
+        verbose_name = 'Tutorial term'
+        verbose_name_plural = 'Tutorial terms'
+        constraints = [
+            models.UniqueConstraint(fields=['item', 'term'], name='tech_tutorialterm_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['term'], name='tech_tutorialterm_term_idx'),
+        ]
+
+class ArticleTerm(RelatedTerm):
+    item: 'ForeignKey[Article, Article]' = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='related_terms')
+
+    class Meta:
+        verbose_name = 'Article term'
+        verbose_name_plural = 'Article terms'
+        constraints = [
+            models.UniqueConstraint(fields=['item', 'term'], name='tech_articleterm_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['term'], name='tech_articleterm_term_idx'),
+        ]
 
 class Snippet(models.Model):
     LANGUAGE_CHOICES = [
@@ -52,8 +223,10 @@ class Snippet(models.Model):
     
     title: 'CharField[str, str]' = models.CharField(max_length=200)
     code: 'TextField[str, str]' = models.TextField()
+    code_html: 'TextField[str, str]' = models.TextField(blank=True, editable=False)
     language: 'CharField[str, str]' = models.CharField(max_length=20, choices=LANGUAGE_CHOICES)
     created_at: 'DateTimeField[datetime, datetime]' = models.DateTimeField(default=timezone.now)
+    updated_at: 'DateTimeField[datetime, datetime]' = models.DateTimeField(auto_now=True)
     author: 'ForeignKey[User, User]' = models.ForeignKey(User, on_delete=models.CASCADE)
     
     def __str__(self):
@@ -61,4 +234,76 @@ class Snippet(models.Model):
     
     class Meta:
         verbose_name = 'Snippet'
-        verbose_name_plural = 'Snippets'
\ No newline at end of file
+        verbose_name_plural = 'Snippets'
+        indexes = [
+            models.Index(fields=['-created_at'], name='tech_snippet_created_idx'),
+            models.Index(fields=['author', '-created_at'], name='tech_snippet_author_idx'),
+            models.Index(fields=['title'], name='tech_snippet_title_idx'),
+            models.Index(fields=['language', '-created_at'], name='tech_snippet_language_idx'),
+        ]
+
+class AuthorStats(models.Model):
+    """Denormalized per-author content counters, maintained by tech.signals"""
+    author: 'OneToOneField[User, User]' = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name='content_stats'
+    )
+    tutorial_count: 'IntegerField[int, int]' = models.IntegerField(default=0)
+    article_count: 'IntegerField[int, int]' = models.IntegerField(default=0)
+    snippet_count: 'IntegerField[int, int]' = models.IntegerField(default=0)
+    last_activity_at: 'DateTimeField[datetime | None, datetime | None]' = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f'Stats for {self.author}'
+
+    class Meta:
+        verbose_name = 'Author stats'
+        verbose_name_plural = 'Author stats'
+
+
+class MediaBlob(models.Model):
+    """A content-addressed media file and how many rows reference it"""
+    name: 'CharField[str, str]' = models.CharField(max_length=255, unique=True)
+    digest: 'CharField[str, str]' = models.CharField(max_length=64, db_index=True)
+    size: 'BigIntegerField[int, int]' = models.BigIntegerField()
+    ref_count: 'IntegerField[int, int]' = models.IntegerField(default=0)
+    created_at: 'DateTimeField[datetime, datetime]' = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        verbose_name = 'Media blob'
+        verbose_name_plural = 'Media blobs'
+
+
+class Job(models.Model):
+    """A unit of background work, run by the ``run_jobs`` worker (see tech.jobs)"""
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (FAILED, 'Failed'),
+    ]
+
+    task: 'CharField[str, str]' = models.CharField(max_length=100)
+    payload: 'JSONField[dict, dict]' = models.JSONField(default=dict, blank=True)
+    status: 'CharField[str, str]' = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    attempts: 'IntegerField[int, int]' = models.IntegerField(default=0)
+    max_attempts: 'IntegerField[int, int]' = models.IntegerField(default=3)
+    run_at: 'DateTimeField[datetime, datetime]' = models.DateTimeField(default=timezone.now)
+    locked_by: 'CharField[str, str]' = models.CharField(max_length=100, blank=True)
+    locked_at: 'DateTimeField[datetime | None, datetime | None]' = models.DateTimeField(null=True, blank=True)
+    last_error: 'TextField[str, str]' = models.TextField(blank=True)
+    created_at: 'DateTimeField[datetime, datetime]' = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f'{self.task} #{self.pk} ({self.status})'
+
+    class Meta:
+        verbose_name = 'Job'
+        verbose_name_plural = 'Jobs'
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='tech_job_due_idx'),
+        ]
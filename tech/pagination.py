@@ -0,0 +1,146 @@
+"""
+Keyset (cursor) pagination for the public list views.
+
+``CursorPaginator`` walks a queryset ordered newest first by
+``(created_at, id)`` and seeks straight to a page with a WHERE clause instead
+of an OFFSET, so deep pages cost the same as the first one. The page object
+mirrors the parts of Django's ``Page`` API that the list templates use; the
+"page numbers" it hands out are opaque cursor tokens.
+"""
+import base64
+import binascii
+import hashlib
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db.models import Q, QuerySet
+from django.http import HttpRequest
+
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+def encode_cursor(created_at: datetime, pk: int, direction: str) -> str:
+    """Pack a position in the listing into a URL-safe token"""
+    payload = json.dumps([created_at.isoformat(), pk, direction], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str) -> Optional[tuple[datetime, int, str]]:
+    """Unpack a token produced by ``encode_cursor``; None if it is not valid"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        created_at, pk, direction = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if direction not in (NEXT, PREVIOUS):
+            return None
+        return datetime.fromisoformat(created_at), int(pk), direction
+    except (binascii.Error, ValueError, TypeError, UnicodeDecodeError):
+        return None
+
+
+class CursorPage(Sequence):
+    """One page of results from a ``CursorPaginator``"""
+
+    def __init__(self, object_list: list[Any], paginator: 'CursorPaginator',
+                 has_next: bool, has_previous: bool) -> None:
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+        # Cursor pages have no position; templates compare this against page_range
+        self.number = None
+
+    def __repr__(self) -> str:
+        return f'<CursorPage of {len(self.object_list)} items>'
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self._has_next or self._has_previous
+
+    def next_page_number(self) -> str:
+        last = self.object_list[-1]
+        return encode_cursor(last.created_at, last.pk, NEXT)
+
+    def previous_page_number(self) -> str:
+        first = self.object_list[0]
+        return encode_cursor(first.created_at, first.pk, PREVIOUS)
+
+
+class CursorPaginator:
+    """Seek-method paginator over a queryset listed newest first"""
+
+    def __init__(self, object_list: QuerySet[Any], per_page: int) -> None:
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        # No numbered links: only previous/next are rendered
+        self.page_range: list[int] = []
+
+    @property
+    def count(self) -> int:
+        """Total number of rows, cached so listings don't COUNT(*) per request"""
+        sql, params = self.object_list.values('pk').query.sql_with_params()
+        digest = hashlib.md5(f'{sql}|{params}'.encode()).hexdigest()
+        key = f'tech:pagination:count:{digest}'
+        total: Optional[int] = cache.get(key)
+        if total is None:
+            total = self.object_list.count()
+            cache.set(key, total, getattr(settings, 'TECH_PAGINATION_COUNT_TIMEOUT', 300))
+        return total
+
+    def get_page(self, token: Optional[str]) -> CursorPage:
+        """Return the page a token points at, or the first page for a missing or bad token"""
+        cursor = decode_cursor(token) if token else None
+        queryset = self.object_list
+        if cursor is None:
+            rows = list(queryset.order_by('-created_at', '-id')[:self.per_page + 1])
+            return CursorPage(rows[:self.per_page], self, len(rows) > self.per_page, False)
+
+        created_at, pk, direction = cursor
+        if direction == NEXT:
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            ).order_by('-created_at', '-id')
+            rows = list(queryset[:self.per_page + 1])
+            return CursorPage(rows[:self.per_page], self, len(rows) > self.per_page, True)
+
+        queryset = queryset.filter(
+            Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+        ).order_by('created_at', 'id')
+        rows = list(queryset[:self.per_page + 1])
+        has_previous = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        rows.reverse()
+        return CursorPage(rows, self, True, has_previous)
+
+
+def cursor_pagination_enabled() -> bool:
+    return bool(getattr(settings, 'TECH_CURSOR_PAGINATION', False))
+
+
+def paginate(request: HttpRequest, queryset: QuerySet[Any], per_page: int,
+             keyset: bool = True) -> 'Page[Any] | CursorPage':
+    """Paginate a list view, using cursors when enabled and the listing allows it
+
+    Pass ``keyset=False`` for listings that are not ordered by creation date,
+    such as ranked search results.
+    """
+    page = request.GET.get('page')
+    if keyset and cursor_pagination_enabled():
+        return CursorPaginator(queryset, per_page).get_page(page)
+    return Paginator(queryset, per_page).get_page(page)
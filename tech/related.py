@@ -0,0 +1,334 @@
+"""
+Related tutorials and articles.
+
+Every tutorial and article is turned into a TF-IDF vector over its title,
+body and tags, and the ``related_count()`` most similar items of the same
+type (by cosine similarity) are stored in ``RelatedTutorial`` /
+``RelatedArticle`` rows, so a detail page needs one indexed join to show
+them.
+
+Each item's vector is also stored term by term in ``TutorialTerm`` /
+``ArticleTerm``, an inverted index whose per-term row counts are the
+document frequencies. Saving an item queues ``refresh`` on the job queue
+(see ``tech.tasks``), which re-tokenizes only the saved items, scores them
+against the stored vectors of the items sharing a term with them, and
+rewrites the lists they enter or leave, so an edit costs nothing per
+untouched row. Stored vectors keep the document frequencies of when they
+were computed, so ``python manage.py rebuild_related`` recomputes
+everything from scratch now and then. The rebuild sums use NumPy when it is
+installed and plain dictionaries otherwise; both give the same rankings.
+"""
+import heapq
+import math
+from collections import Counter
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from . import caching, search
+from .models import Article, ArticleTerm, RelatedArticle, RelatedTutorial, Tutorial, TutorialTerm
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Model -> table of its precomputed related items
+RELATED_MODELS: dict[Any, Any] = {
+    Tutorial: RelatedTutorial,
+    Article: RelatedArticle,
+}
+
+# Model -> table of its stored term vectors
+TERM_MODELS: dict[Any, Any] = {
+    Tutorial: TutorialTerm,
+    Article: ArticleTerm,
+}
+
+# Term count multipliers for the (title, body, tags) text
+FIELD_WEIGHTS: tuple[int, int, int] = (3, 1, 2)
+
+# Items less similar than this are never listed as related
+MIN_SCORE = 0.05
+
+# Longer tokens (hashes, base64) are not useful terms and do not fit the term column
+MAX_TERM_LENGTH = 64
+
+# Values per IN (...) lookup, well under SQLite's bound parameter limit
+CHUNK_SIZE = 500
+
+STOP_WORDS = frozenset('''
+    a about an and are as at be but by can do for from has have how if in into is it its
+    more not of on or our so than that the their then there these this to use used using
+    was we what when which will with you your
+'''.split())
+
+
+def related_count() -> int:
+    """How many related items are kept per tutorial or article"""
+    return int(getattr(settings, 'TECH_RELATED_COUNT', 4))
+
+
+def terms_for(instance: Any) -> Counter[str]:
+    """Weighted term counts for a tutorial or article"""
+    counts: Counter[str] = Counter()
+    for text, weight in zip(search.document_for(instance), FIELD_WEIGHTS):
+        for token in search.tokenize(text):
+            if 1 < len(token) <= MAX_TERM_LENGTH and token not in STOP_WORDS and not token.isdigit():
+                counts[token] += weight
+    return counts
+
+
+def weigh(counts: Counter[str], document_frequency: Any, total: int) -> dict[str, float]:
+    """Unit-length TF-IDF weights: sublinear term frequency times smoothed IDF"""
+    weights = {
+        term: (1 + math.log(count)) * (math.log((1 + total) / (1 + document_frequency[term])) + 1)
+        for term, count in counts.items()
+    }
+    norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+    return {term: w / norm for term, w in weights.items()}
+
+
+def _top(scores: dict[int, float], count: int) -> list[tuple[int, float]]:
+    # Ties go to the newer item, which has the higher primary key
+    return heapq.nlargest(count, scores.items(), key=lambda item: (round(item[1], 9), item[0]))
+
+
+class Corpus:
+    """Unit-length TF-IDF vectors for every row of a model"""
+
+    def __init__(self, ids: list[int], documents: list[Counter[str]]) -> None:
+        self.ids = ids
+        self.position = {pk: i for i, pk in enumerate(ids)}
+        document_frequency: Counter[str] = Counter()
+        for counts in documents:
+            document_frequency.update(counts.keys())
+        total = len(documents)
+        self.terms = sorted(document_frequency)
+        vocabulary = {term: i for i, term in enumerate(self.terms)}
+        # Per document: term ids and weights
+        self.vectors: list[dict[int, float]] = [
+            {vocabulary[t]: w for t, w in weigh(counts, document_frequency, total).items()}
+            for counts in documents
+        ]
+        # Inverted index: term id -> (document positions, weights)
+        postings: dict[int, tuple[list[int], list[float]]] = {}
+        for position, vector in enumerate(self.vectors):
+            for term, weight in vector.items():
+                rows, values = postings.setdefault(term, ([], []))
+                rows.append(position)
+                values.append(weight)
+        self.use_numpy = np is not None
+        if self.use_numpy:
+            self.postings: dict[int, Any] = {
+                term: (np.array(rows, dtype=np.intp), np.array(values))
+                for term, (rows, values) in postings.items()
+            }
+        else:
+            self.postings = postings
+
+    @classmethod
+    def load(cls, model: Any) -> 'Corpus':
+        """Build the corpus for every row of ``model`` in one or two queries"""
+        ids, documents = [], []
+        for instance in _documents(model):
+            ids.append(instance.pk)
+            documents.append(terms_for(instance))
+        return cls(ids, documents)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def scores(self, pk: int) -> dict[int, float]:
+        """Cosine similarity of ``pk`` with every other item that shares a term"""
+        position = self.position[pk]
+        vector = self.vectors[position]
+        if self.use_numpy:
+            rows = [self.postings[term][0] for term in vector]
+            values = [self.postings[term][1] * weight for term, weight in vector.items()]
+            if not rows:
+                return {}
+            totals = np.bincount(np.concatenate(rows), weights=np.concatenate(values), minlength=len(self.ids))
+            totals[position] = 0.0
+            hits = np.flatnonzero(totals >= MIN_SCORE)
+            return {self.ids[i]: float(totals[i]) for i in hits}
+        sums: dict[int, float] = {}
+        for term, weight in vector.items():
+            rows, values = self.postings[term]
+            for row, value in zip(rows, values):
+                sums[row] = sums.get(row, 0.0) + weight * value
+        sums.pop(position, None)
+        return {self.ids[i]: total for i, total in sums.items() if total >= MIN_SCORE}
+
+    def top(self, pk: int, count: int, scores: Optional[dict[int, float]] = None) -> list[tuple[int, float]]:
+        """The ``count`` items most similar to ``pk`` as (pk, score), best first"""
+        return _top(self.scores(pk) if scores is None else scores, count)
+
+
+def _documents(model: Any) -> Any:
+    """Rows of ``model`` with what ``terms_for`` reads"""
+    queryset = model.objects.defer('content_html').order_by('pk')
+    if model is Article:
+        queryset = queryset.prefetch_related('tags')
+    return queryset
+
+
+def _chunks(values: Iterable[Any]) -> Iterable[list[Any]]:
+    values = list(values)
+    for start in range(0, len(values), CHUNK_SIZE):
+        yield values[start:start + CHUNK_SIZE]
+
+
+def _postings(model: Any, terms: Iterable[str], exclude: Iterable[int] = ()) -> dict[str, list[tuple[int, float]]]:
+    """Stored (item, weight) pairs of every item that has one of ``terms``"""
+    postings: dict[str, list[tuple[int, float]]] = {}
+    table = TERM_MODELS[model]
+    for chunk in _chunks(terms):
+        rows = table.objects.filter(term__in=chunk).exclude(item_id__in=list(exclude))
+        for term, item, weight in rows.values_list('term', 'item_id', 'weight'):
+            postings.setdefault(term, []).append((item, weight))
+    return postings
+
+
+def _similar(pk: int, vector: dict[str, float], postings: dict[str, list[tuple[int, float]]]) -> dict[int, float]:
+    """Cosine similarity of a vector with every item in ``postings`` that shares a term"""
+    sums: dict[int, float] = {}
+    for term, weight in vector.items():
+        for item, value in postings.get(term, ()):
+            sums[item] = sums.get(item, 0.0) + weight * value
+    sums.pop(pk, None)
+    return {item: total for item, total in sums.items() if total >= MIN_SCORE}
+
+
+def _recompute(model: Any, pks: set[int], count: int) -> dict[int, list[tuple[int, float]]]:
+    """Full related lists of ``pks`` from their stored vectors"""
+    vectors: dict[int, dict[str, float]] = {pk: {} for pk in pks}
+    table = TERM_MODELS[model]
+    for chunk in _chunks(pks):
+        for item, term, weight in table.objects.filter(item_id__in=chunk).values_list('item_id', 'term', 'weight'):
+            vectors[item][term] = weight
+    postings = _postings(model, {term for vector in vectors.values() for term in vector})
+    return {pk: _top(_similar(pk, vector, postings), count) for pk, vector in vectors.items()}
+
+
+def _write(model: Any, lists: dict[int, list[tuple[int, float]]]) -> int:
+    """Replace the stored related items of the sources in ``lists``; returns rows written"""
+    table = RELATED_MODELS[model]
+    rows = [
+        table(source_id=source, target_id=target, rank=rank, score=score)
+        for source, items in lists.items()
+        for rank, (target, score) in enumerate(items)
+    ]
+    with transaction.atomic():
+        table.objects.filter(source_id__in=list(lists)).delete()
+        table.objects.bulk_create(rows, batch_size=1000)
+        touch(model, lists)
+    return len(rows)
+
+
+def touch(model: Any, pks: Iterable[int]) -> None:
+    """Record that the related items of ``pks`` changed; detail page validators include it"""
+    now = timezone.now()
+    for chunk in _chunks(pks):
+        model.objects.filter(pk__in=chunk).update(related_updated_at=now)
+
+
+def _stored(model: Any, sources: Iterable[int]) -> dict[int, list[tuple[int, float]]]:
+    stored: dict[int, list[tuple[int, float]]] = {}
+    table = RELATED_MODELS[model]
+    for chunk in _chunks(sources):
+        rows = table.objects.filter(source_id__in=chunk).order_by('source_id', 'rank')
+        for source, target, score in rows.values_list('source_id', 'target_id', 'score'):
+            stored.setdefault(source, []).append((target, score))
+    return stored
+
+
+def _same(items: list[tuple[int, float]], stored: list[tuple[int, float]]) -> bool:
+    return len(items) == len(stored) and all(
+        target == stored_target and abs(score - stored_score) < 1e-9
+        for (target, score), (stored_target, stored_score) in zip(items, stored)
+    )
+
+
+def rebuild(model: Any) -> int:
+    """Recompute the related items of every row of ``model``; returns rows written"""
+    corpus = Corpus.load(model)
+    count = related_count()
+    lists = {pk: corpus.top(pk, count) for pk in corpus.ids}
+    table = RELATED_MODELS[model]
+    terms = TERM_MODELS[model]
+    with transaction.atomic():
+        table.objects.all().delete()
+        written = _write(model, lists)
+        terms.objects.all().delete()
+        terms.objects.bulk_create(
+            (terms(item_id=pk, term=corpus.terms[term], weight=weight)
+             for pk, vector in zip(corpus.ids, corpus.vectors) for term, weight in vector.items()),
+            batch_size=1000,
+        )
+    caching.bump_version(model._meta.model_name)
+    return written
+
+
+def refresh(model: Any, pks: Iterable[int]) -> int:
+    """Recompute the related items of ``pks`` and of the items whose lists they change
+
+    Only ``pks`` are re-tokenized; other items are scored from their stored
+    vectors. An item that lists one of ``pks`` gets its whole list
+    recomputed, one that does not only gains the ``pks`` that now beat its
+    weakest entry. Returns the number of lists rewritten.
+    """
+    terms = TERM_MODELS[model]
+    if not terms.objects.exists():
+        # No stored vectors yet, e.g. right after upgrading
+        rebuild(model)
+        return model.objects.count()
+    count = related_count()
+    pks = set(pks)
+    counts = {instance.pk: terms_for(instance) for instance in _documents(model).filter(pk__in=pks)}
+
+    # Document frequencies of the saved items' terms, then their fresh vectors
+    postings = _postings(model, {term for c in counts.values() for term in c}, exclude=pks)
+    frequency: Counter[str] = Counter({term: len(items) for term, items in postings.items()})
+    for c in counts.values():
+        frequency.update(c.keys())
+    vectors = {pk: weigh(c, frequency, model.objects.count()) for pk, c in counts.items()}
+    for pk, vector in vectors.items():
+        for term, weight in vector.items():
+            postings.setdefault(term, []).append((pk, weight))
+    with transaction.atomic():
+        terms.objects.filter(item_id__in=pks).delete()
+        terms.objects.bulk_create(
+            (terms(item_id=pk, term=term, weight=weight) for pk, vector in vectors.items() for term, weight in vector.items()),
+            batch_size=1000,
+        )
+
+    scores = {pk: _similar(pk, vector, postings) for pk, vector in vectors.items()}
+    listing = set(RELATED_MODELS[model].objects.filter(target_id__in=pks).values_list('source_id', flat=True)) - pks
+    gaining = {other for items in scores.values() for other in items} - pks - listing
+    stored = _stored(model, pks | listing | gaining)
+    lists = {pk: _top(items, count) for pk, items in scores.items()}
+    lists.update(_recompute(model, listing, count))
+    for other in gaining:
+        # Its current entries are unchanged, so the saved items can only push the weakest out
+        candidates = dict(stored.get(other, []))
+        candidates.update((pk, items[other]) for pk, items in scores.items() if other in items)
+        lists[other] = _top(candidates, count)
+    changed = {source: items for source, items in lists.items() if not _same(items, stored.get(source, []))}
+    if changed:
+        _write(model, changed)
+        caching.bump_version(model._meta.model_name)
+    return len(changed)
+
+
+def related_items(instance: Any, count: Optional[int] = None) -> Any:
+    """The stored related items of a tutorial or article, in rank order, as one query"""
+    model = type(instance)
+    queryset = (
+        model.objects.filter(related_to__source_id=instance.pk)
+        .defer('content', 'content_html')
+        .order_by('related_to__rank')
+    )
+    return queryset[:count or related_count()]
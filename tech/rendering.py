@@ -0,0 +1,32 @@
+"""
+Write-time rendering of tutorial and article bodies to HTML.
+
+Bodies are plain text with blank-line separated paragraphs (the same rules as
+the ``linebreaks`` template filter) plus ``` fenced code blocks, which are
+highlighted by ``tech.highlighting`` instead of being wrapped in paragraphs.
+"""
+import re
+
+from django.utils.html import linebreaks
+
+from .highlighting import highlight_code
+
+# ```lang ... ``` on their own lines; the language tag is optional
+FENCE_RE = re.compile(r'^```[ \t]*([\w+#.-]*)[^\n]*\n(.*?)^```[ \t]*$', re.MULTILINE | re.DOTALL)
+
+
+def render_content(text: str) -> str:
+    """Render a tutorial or article body to HTML"""
+    text = (text or '').replace('\r\n', '\n')
+    parts: list[str] = []
+    position = 0
+    for match in FENCE_RE.finditer(text):
+        prose = text[position:match.start()]
+        if prose.strip():
+            parts.append(linebreaks(prose.strip(), autoescape=True))
+        parts.append(highlight_code(match.group(2), match.group(1).lower()))
+        position = match.end()
+    prose = text[position:]
+    if prose.strip():
+        parts.append(linebreaks(prose.strip(), autoescape=True))
+    return '\n\n'.join(parts)
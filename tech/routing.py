@@ -0,0 +1,161 @@
+"""
+Read-replica routing for the public pages.
+
+Views decorated with ``read_from_replica`` run their queries against one of
+the ``TECH_DATABASE_REPLICAS`` aliases; everything else, and every write,
+uses ``default``. ``ReplicaRoutingMiddleware`` tracks each request:
+
+* a request that writes anything sets a short-lived cookie, and while it is
+  present that browser reads from the primary too, so an author sees the
+  tutorial they just added instead of a replica that has not caught up;
+* a replica that cannot be connected to (for SQLite, one whose file is
+  missing) is skipped for ``TECH_REPLICA_RETRY_SECONDS`` and its reads go to
+  the primary.
+
+Outside a request, e.g. in management commands and jobs, all queries use
+``default``. ``python manage.py sync_sqlite_replicas`` copies the primary
+into SQLite replica files to try the setup locally.
+"""
+import contextvars
+import functools
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.http import HttpRequest, HttpResponse
+
+
+@dataclass
+class RoutingState:
+    pinned: bool = False            # the browser wrote recently; read from the primary
+    use_replica: bool = False       # inside a read_from_replica view
+    replica: Optional[str] = None   # the replica chosen for this request
+    wrote: bool = False
+
+
+_state: contextvars.ContextVar[Optional[RoutingState]] = contextvars.ContextVar('tech_routing_state', default=None)
+
+# Replica alias -> time.monotonic() until which it is not retried
+_unavailable: dict[str, float] = {}
+
+
+def replica_aliases() -> list[str]:
+    return list(getattr(settings, 'TECH_DATABASE_REPLICAS', []))
+
+
+def pin_seconds() -> int:
+    """How long a browser reads from the primary after it wrote something"""
+    return int(getattr(settings, 'TECH_REPLICA_PIN_SECONDS', 10))
+
+
+def retry_seconds() -> int:
+    return int(getattr(settings, 'TECH_REPLICA_RETRY_SECONDS', 30))
+
+
+def pin_cookie_name() -> str:
+    return getattr(settings, 'TECH_REPLICA_PIN_COOKIE', 'read_primary_until')
+
+
+def replica_page_cache_timeout() -> int:
+    """Longest a page rendered from a replica is cached, since it may predate the latest write"""
+    return int(getattr(settings, 'TECH_REPLICA_PAGE_CACHE_TIMEOUT', 60))
+
+
+def replica_available(alias: str) -> bool:
+    """Whether ``alias`` can be connected to; failures are remembered for a while"""
+    if _unavailable.get(alias, 0) > time.monotonic():
+        return False
+    connection = connections[alias]
+    try:
+        name = str(connection.settings_dict['NAME'])
+        # Connecting to a missing SQLite file would create an empty database
+        if connection.vendor == 'sqlite' and not connection.is_in_memory_db() and not os.path.exists(name):
+            raise DatabaseError(f'{name} does not exist')
+        connection.ensure_connection()
+    except DatabaseError:
+        _unavailable[alias] = time.monotonic() + retry_seconds()
+        return False
+    _unavailable.pop(alias, None)
+    return True
+
+
+def _choose_replica(state: RoutingState) -> Optional[str]:
+    if state.replica is None:
+        candidates = replica_aliases()
+        random.shuffle(candidates)
+        state.replica = next((alias for alias in candidates if replica_available(alias)), DEFAULT_DB_ALIAS)
+    return None if state.replica == DEFAULT_DB_ALIAS else state.replica
+
+
+def reading_from_replica() -> bool:
+    """Whether the current request's reads go to a replica"""
+    state = _state.get()
+    return bool(state and state.use_replica and not state.pinned and _choose_replica(state))
+
+
+class ReplicaRouter:
+    """Database router: replicas for marked read-only views, the primary for everything else"""
+
+    def db_for_read(self, model: Any, **hints: Any) -> Optional[str]:
+        state = _state.get()
+        if state is None or not state.use_replica or state.pinned:
+            return None
+        return _choose_replica(state)
+
+    def db_for_write(self, model: Any, **hints: Any) -> Optional[str]:
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> Optional[bool]:
+        # Replicas hold the same rows as the primary
+        aliases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """Set up routing state per request and pin browsers to the primary after a write"""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        token = _state.set(RoutingState(pinned=self.pinned(request)))
+        try:
+            response = self.get_response(request)
+            if _state.get().wrote:  # type: ignore[union-attr]
+                seconds = pin_seconds()
+                response.set_cookie(pin_cookie_name(), str(int(time.time()) + seconds),
+                                    max_age=seconds, httponly=True, samesite='Lax')
+        finally:
+            _state.reset(token)
+        return response
+
+    @staticmethod
+    def pinned(request: HttpRequest) -> bool:
+        try:
+            return float(request.COOKIES.get(pin_cookie_name(), 0)) > time.time()
+        except ValueError:
+            return False
+
+
+def read_from_replica(view: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+    """Let a read-only view query a replica for GET and HEAD requests"""
+    @functools.wraps(view)
+    def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        state = _state.get()
+        if state is None or request.method not in ('GET', 'HEAD') or not replica_aliases():
+            return view(request, *args, **kwargs)
+        state.use_replica = True
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            state.use_replica = False
+    return wrapper
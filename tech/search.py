@@ -0,0 +1,280 @@
+"""
+Full-text search for tutorials and articles.
+
+Each searchable model gets a side index that is kept in sync from the
+post_save/post_delete receivers in ``tech.signals``. SQLite databases use an
+FTS5 virtual table ranked with BM25, PostgreSQL databases use a tsvector table
+with a GIN index, and any other backend falls back to ``icontains`` filters.
+"""
+import re
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Case, IntegerField, Model, Q, QuerySet, When
+from django.utils.module_loading import import_string
+
+# Per-column weights used for ranking (title, body, tags)
+TITLE_WEIGHT: float = 10.0
+BODY_WEIGHT: float = 1.0
+TAGS_WEIGHT: float = 5.0
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def max_results() -> int:
+    """Upper bound on ranked hits returned for a single query"""
+    return int(getattr(settings, 'TECH_SEARCH_MAX_RESULTS', 500))
+
+
+def tokenize(query: str) -> list[str]:
+    """Split a user query into lowercase search terms"""
+    return TOKEN_RE.findall(query.lower())
+
+
+def index_table(model: Any) -> str:
+    """Name of the search index table that backs ``model``"""
+    return f'{model._meta.db_table}_search'
+
+
+def document_for(instance: Any) -> tuple[str, str, str]:
+    """Return the (title, body, tags) text indexed for a tutorial or article"""
+    title: str = instance.title or ''
+    if hasattr(instance, 'description'):
+        body = f"{instance.description or ''}\n{instance.content or ''}"
+    else:
+        body = instance.content or ''
+    tags: Any = getattr(instance, 'tags', '') or ''
+    if not isinstance(tags, str):
+        # Tag relation; uses prefetched tags when the caller loaded them
+        tags = ' '.join(tag.name for tag in tags.all()) if instance.pk else ''
+    return title, body, tags
+
+
+def searchable_models() -> list[type[Model]]:
+    """Models that have a search index"""
+    from .models import Article, Tutorial
+    return [Tutorial, Article]
+
+
+class BaseSearchBackend:
+    """Interface shared by all search backends"""
+
+    def __init__(self, alias: str = 'default') -> None:
+        self.alias = alias
+
+    @property
+    def connection(self) -> Any:
+        return connections[self.alias]
+
+    def install(self, model: Any) -> None:
+        """Create the index storage for ``model``"""
+
+    def uninstall(self, model: Any) -> None:
+        """Drop the index storage for ``model``"""
+
+    def index(self, instance: Any) -> None:
+        """Add or refresh a single row in the index"""
+
+    def remove(self, instance: Any) -> None:
+        """Remove a single row from the index"""
+
+    def index_many(self, model: Any, instances: Iterable[Any]) -> int:
+        """Index a batch of rows, returning how many were written"""
+        count = 0
+        for instance in instances:
+            self.index(instance)
+            count += 1
+        return count
+
+    def clear(self, model: Any) -> None:
+        """Remove every row for ``model`` from the index"""
+
+    def rebuild(self, model: Any, chunk_size: int = 1000) -> int:
+        """Repopulate the index for ``model`` from scratch"""
+        self.clear(model)
+        queryset = model._default_manager.using(self.alias).order_by('pk')
+        if any(field.name == 'tags' and field.many_to_many for field in model._meta.get_fields()):
+            queryset = queryset.prefetch_related('tags')
+        return self.index_many(model, queryset.iterator(chunk_size=chunk_size))
+
+    def search_ids(self, model: Any, query: str, limit: int) -> list[int]:
+        """Primary keys matching ``query``, best match first"""
+        raise NotImplementedError
+
+    def search(self, queryset: QuerySet[Any], query: str) -> QuerySet[Any]:
+        """Filter ``queryset`` to rows matching ``query``, ordered by rank"""
+        ids = self.search_ids(queryset.model, query, max_results())
+        if not ids:
+            return queryset.none()
+        ranking = Case(
+            *[When(pk=pk, then=position) for position, pk in enumerate(ids)],
+            output_field=IntegerField(),
+        )
+        return queryset.filter(pk__in=ids).order_by(ranking)
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    """FTS5 virtual table per model, keyed by rowid and ranked with bm25()"""
+
+    def install(self, model: Any) -> None:
+        table = index_table(model)
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS "{table}" USING fts5('
+                "title, body, tags, tokenize='porter unicode61', prefix='2 3')"
+            )
+
+    def uninstall(self, model: Any) -> None:
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS "{index_table(model)}"')
+
+    def index(self, instance: Any) -> None:
+        self.index_many(type(instance), [instance])
+
+    def index_many(self, model: Any, instances: Iterable[Any]) -> int:
+        table = index_table(model)
+        rows = [(instance.pk, *document_for(instance)) for instance in instances]
+        if not rows:
+            return 0
+        with self.connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM "{table}" WHERE rowid = %s', [(row[0],) for row in rows])
+            cursor.executemany(
+                f'INSERT INTO "{table}" (rowid, title, body, tags) VALUES (%s, %s, %s, %s)',
+                rows,
+            )
+        return len(rows)
+
+    def remove(self, instance: Any) -> None:
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM "{index_table(type(instance))}" WHERE rowid = %s', [instance.pk])
+
+    def clear(self, model: Any) -> None:
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM "{index_table(model)}"')
+
+    def search_ids(self, model: Any, query: str, limit: int) -> list[int]:
+        terms = tokenize(query)
+        if not terms:
+            return []
+        # Quote every term so FTS5 operators in user input are treated as text,
+        # and make each one a prefix match for search-as-you-type.
+        match = ' '.join('"%s"*' % term for term in terms)
+        table = index_table(model)
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM "{table}" WHERE "{table}" MATCH %s '
+                f'ORDER BY bm25("{table}", %s, %s, %s) LIMIT %s',
+                [match, TITLE_WEIGHT, BODY_WEIGHT, TAGS_WEIGHT, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """Weighted tsvector table per model with a GIN index, ranked with ts_rank_cd()"""
+
+    config: str = 'english'
+
+    def install(self, model: Any) -> None:
+        table = index_table(model)
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TABLE IF NOT EXISTS "{table}" ('
+                'object_id bigint PRIMARY KEY, document tsvector NOT NULL)'
+            )
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS "{table}_gin" ON "{table}" USING gin (document)')
+
+    def uninstall(self, model: Any) -> None:
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS "{index_table(model)}"')
+
+    def index(self, instance: Any) -> None:
+        self.index_many(type(instance), [instance])
+
+    def index_many(self, model: Any, instances: Iterable[Any]) -> int:
+        table = index_table(model)
+        rows = []
+        for instance in instances:
+            title, body, tags = document_for(instance)
+            rows.append((instance.pk, self.config, title, self.config, tags, self.config, body))
+        if not rows:
+            return 0
+        with self.connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO "{table}" (object_id, document) VALUES (%s, '
+                "setweight(to_tsvector(%s::regconfig, %s), 'A') || "
+                "setweight(to_tsvector(%s::regconfig, %s), 'B') || "
+                "setweight(to_tsvector(%s::regconfig, %s), 'D')) "
+                'ON CONFLICT (object_id) DO UPDATE SET document = EXCLUDED.document',
+                rows,
+            )
+        return len(rows)
+
+    def remove(self, instance: Any) -> None:
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM "{index_table(type(instance))}" WHERE object_id = %s', [instance.pk])
+
+    def clear(self, model: Any) -> None:
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'TRUNCATE "{index_table(model)}"')
+
+    def search_ids(self, model: Any, query: str, limit: int) -> list[int]:
+        terms = tokenize(query)
+        if not terms:
+            return []
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        table = index_table(model)
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT object_id FROM "{table}", to_tsquery(%s::regconfig, %s) query '
+                'WHERE document @@ query ORDER BY ts_rank_cd(document, query) DESC LIMIT %s',
+                [self.config, tsquery, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class IcontainsSearchBackend(BaseSearchBackend):
+    """Unindexed fallback for databases without a native full-text engine"""
+
+    def search(self, queryset: QuerySet[Any], query: str) -> QuerySet[Any]:
+        condition = Q(title__icontains=query)
+        for field in ('description', 'content'):
+            try:
+                queryset.model._meta.get_field(field)
+            except Exception:
+                continue
+            condition |= Q(**{f'{field}__icontains': query})
+        try:
+            queryset.model._meta.get_field('tags')
+        except Exception:
+            return queryset.filter(condition)
+        # Tags match whole names only, so "go" doesn't find "django"
+        tagged = queryset.model.objects.filter(tags__name__in=tokenize(query)).values('pk')
+        return queryset.filter(condition | Q(pk__in=tagged))
+
+
+VENDOR_BACKENDS: dict[str, type[BaseSearchBackend]] = {
+    'sqlite': SQLiteFTSBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_backend(alias: Optional[str] = None) -> BaseSearchBackend:
+    """Return the search backend for a database alias
+
+    ``TECH_SEARCH_BACKEND`` may name a backend class to use everywhere;
+    otherwise one is picked from the database vendor.
+    """
+    alias = alias or 'default'
+    backend_path: Optional[str] = getattr(settings, 'TECH_SEARCH_BACKEND', None)
+    if backend_path:
+        backend_class: type[BaseSearchBackend] = import_string(backend_path)
+    else:
+        vendor: str = connections[alias].vendor
+        backend_class = VENDOR_BACKENDS.get(vendor, IcontainsSearchBackend)
+    return backend_class(alias)
+
+
+def search(queryset: QuerySet[Any], query: str) -> QuerySet[Any]:
+    """Filter a Tutorial or Article queryset by a full-text query"""
+    return get_backend(queryset.db).search(queryset, query)
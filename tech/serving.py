@@ -0,0 +1,256 @@
+"""
+Serving static and media files from the WSGI process.
+
+``FileServer`` wraps the Django application and answers GET and HEAD
+requests under ``STATIC_URL`` and ``MEDIA_URL`` straight from
+``STATIC_ROOT`` and ``MEDIA_ROOT``, so a single-box deployment needs no
+separate web server for assets. Anything it does not find falls through to
+Django.
+
+Responses go out through the server's ``wsgi.file_wrapper`` (sendfile under
+gunicorn) and carry validators for conditional requests. The ``.br`` or
+``.gz`` sibling written by collectstatic (see ``tech.assets``) is sent when
+the client accepts it, and single byte ranges are honoured. Content-hashed
+names, from the static manifest or the content-addressed media storage,
+never change, so they are cached for a year as immutable; other files get
+``TECH_FILE_MAX_AGE`` seconds. ``techblog.wsgi`` installs it when
+``TECH_SERVE_FILES`` is on.
+"""
+import mimetypes
+import os
+import re
+import stat
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.utils.http import http_date, parse_http_date_safe
+
+# Encodings in order of preference, with the suffix of their precompressed file
+ENCODINGS: tuple[tuple[str, str], ...] = (('br', '.br'), ('gzip', '.gz'))
+
+# "site.3f2a1b4c5d6e.css" from ManifestStaticFilesStorage, "<sha256>.jpg" from ContentAddressedStorage
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}\.[^/.]+$|/[0-9a-f]{64}\.[^/.]+$')
+
+# Types the mimetypes module may not know on every platform
+CONTENT_TYPES: dict[str, str] = {
+    '.avif': 'image/avif',
+    '.js': 'text/javascript',
+    '.svg': 'image/svg+xml',
+    '.webp': 'image/webp',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+}
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+BLOCK_SIZE = 64 * 1024
+
+StartResponse = Callable[..., Any]
+
+
+def serve_files() -> bool:
+    return bool(getattr(settings, 'TECH_SERVE_FILES', False))
+
+
+def file_max_age() -> int:
+    """Cache lifetime of static and media files without a content hash in their name"""
+    return int(getattr(settings, 'TECH_FILE_MAX_AGE', 3600))
+
+
+def default_mounts() -> list[tuple[str, str]]:
+    """(URL prefix, directory) pairs for the static and media files"""
+    mounts = []
+    for url, root in ((settings.STATIC_URL, settings.STATIC_ROOT), (settings.MEDIA_URL, settings.MEDIA_ROOT)):
+        if url and root and url.startswith('/'):
+            mounts.append((url, str(root)))
+    return mounts
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """Content codings an Accept-Encoding header allows (those without q=0)"""
+    accepted = set()
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding.strip():
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def parse_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """(start, end) inclusive for a single byte range; None for anything else
+
+    Raises ValueError when the range lies entirely past the end of the file.
+    """
+    match = RANGE_RE.match(header.replace(' ', ''))
+    if not match or match.group(1) == match.group(2) == '':
+        return None  # malformed or multiple ranges: send the whole file
+    first, last = match.groups()
+    if first == '':
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError(header)
+    return start, end
+
+
+def etag(stat_result: os.stat_result) -> str:
+    return f'"{int(stat_result.st_mtime):x}-{stat_result.st_size:x}"'
+
+
+def read_range(f: Any, length: int) -> Iterator[bytes]:
+    try:
+        while length > 0:
+            chunk = f.read(min(BLOCK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        f.close()
+
+
+class FileServer:
+    """WSGI middleware serving files under the static and media URLs"""
+
+    def __init__(self, application: Callable[..., Iterable[bytes]],
+                 mounts: Optional[list[tuple[str, str]]] = None) -> None:
+        self.application = application
+        self.mounts = default_mounts() if mounts is None else mounts
+        self.max_age = file_max_age()
+
+    def __call__(self, environ: dict[str, Any], start_response: StartResponse) -> Iterable[bytes]:
+        path = environ.get('PATH_INFO', '')
+        for prefix, root in self.mounts:
+            if path.startswith(prefix):
+                full_path = self.find(root, path[len(prefix):])
+                if full_path is not None:
+                    return self.serve(environ, start_response, full_path)
+        return self.application(environ, start_response)
+
+    def find(self, root: str, relative: str) -> Optional[str]:
+        """Absolute path of a regular file under ``root``, refusing anything that escapes it"""
+        # PEP 3333 hands the path over as latin-1 decoded bytes
+        try:
+            relative = relative.encode('latin-1').decode('utf-8')
+        except UnicodeError:
+            return None
+        parts = relative.split('/')
+        if any(part in ('..', '.') or '\\' in part or '\0' in part for part in parts):
+            return None
+        full_path = os.path.join(root, *[part for part in parts if part])
+        try:
+            if not stat.S_ISREG(os.stat(full_path).st_mode):
+                return None
+        except (OSError, ValueError):
+            return None
+        return full_path
+
+    def cache_control(self, full_path: str) -> str:
+        if HASHED_NAME_RE.search(full_path.replace(os.sep, '/')):
+            return IMMUTABLE_CACHE_CONTROL
+        return f'public, max-age={self.max_age}'
+
+    def serve(self, environ: dict[str, Any], start_response: StartResponse, full_path: str) -> Iterable[bytes]:
+        method = environ.get('REQUEST_METHOD', 'GET')
+        if method not in ('GET', 'HEAD'):
+            start_response('405 Method Not Allowed', [('Allow', 'GET, HEAD'), ('Content-Length', '0')])
+            return []
+
+        extension = os.path.splitext(full_path)[1].lower()
+        content_type = CONTENT_TYPES.get(extension) or mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type == 'application/json':
+            content_type += '; charset=utf-8'
+        headers = [('Content-Type', content_type), ('Cache-Control', self.cache_control(full_path))]
+
+        # Pick the representation: a precompressed sibling, unless a range was asked for
+        variants = [(coding, full_path + suffix) for coding, suffix in ENCODINGS if os.path.isfile(full_path + suffix)]
+        if variants:
+            headers.append(('Vary', 'Accept-Encoding'))
+        range_header = environ.get('HTTP_RANGE', '')
+        accepted = accepted_encodings(environ.get('HTTP_ACCEPT_ENCODING', ''))
+        chosen, coding = full_path, None
+        if not range_header:
+            for variant_coding, variant_path in variants:
+                if variant_coding in accepted:
+                    chosen, coding = variant_path, variant_coding
+                    break
+        if coding:
+            headers.append(('Content-Encoding', coding))
+
+        stat_result = os.stat(chosen)
+        size = stat_result.st_size
+        tag = etag(stat_result) if coding is None else etag(stat_result)[:-1] + f'-{coding}"'
+        headers += [
+            ('ETag', tag),
+            ('Last-Modified', http_date(stat_result.st_mtime)),
+            ('Accept-Ranges', 'bytes'),
+        ]
+
+        if self.not_modified(environ, tag, stat_result.st_mtime):
+            start_response('304 Not Modified', headers)
+            return []
+
+        byte_range = None
+        if range_header and self.range_applies(environ, tag, stat_result.st_mtime):
+            try:
+                byte_range = parse_range(range_header, size)
+            except ValueError:
+                start_response('416 Range Not Satisfiable', [
+                    *headers, ('Content-Range', f'bytes */{size}'), ('Content-Length', '0'),
+                ])
+                return []
+
+        if byte_range is None:
+            status, start, length = '200 OK', 0, size
+        else:
+            start, end = byte_range
+            status, length = '206 Partial Content', end - start + 1
+            headers.append(('Content-Range', f'bytes {start}-{end}/{size}'))
+        headers.append(('Content-Length', str(length)))
+        start_response(status, headers)
+        if method == 'HEAD':
+            return []
+
+        f = open(chosen, 'rb')
+        if start + length < size:
+            f.seek(start)
+            return read_range(f, length)
+        # The whole file, or its tail: the server may send it with sendfile()
+        f.seek(start)
+        file_wrapper = environ.get('wsgi.file_wrapper')
+        if file_wrapper is not None:
+            return file_wrapper(f, BLOCK_SIZE)
+        return read_range(f, length)
+
+    @staticmethod
+    def not_modified(environ: dict[str, Any], tag: str, mtime: float) -> bool:
+        if_none_match = environ.get('HTTP_IF_NONE_MATCH')
+        if if_none_match is not None:
+            tags = [t.strip().removeprefix('W/') for t in if_none_match.split(',')]
+            return '*' in tags or tag in tags
+        since = parse_http_date_safe(environ.get('HTTP_IF_MODIFIED_SINCE', ''))
+        return since is not None and int(mtime) <= since
+
+    @staticmethod
+    def range_applies(environ: dict[str, Any], tag: str, mtime: float) -> bool:
+        """Whether If-Range (when sent) still names the current file"""
+        if_range = environ.get('HTTP_IF_RANGE')
+        if not if_range:
+            return True
+        if if_range.startswith(('"', 'W/')):
+            return if_range == tag
+        since = parse_http_date_safe(if_range)
+        return since is not None and int(mtime) <= since
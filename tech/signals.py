@@ -0,0 +1,175 @@
+"""
+Signal receivers that keep derived data in sync with tech models.
+"""
+from typing import Any, Optional
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from . import caching, highlighting, images, related, rendering, search, stats, tagging, tasks
+from .models import Article, ArticleTag, Snippet, Tag, Tutorial
+
+
+@receiver(pre_save, sender=Tutorial)
+@receiver(pre_save, sender=Article)
+def render_content_html(sender: Any, instance: Any, raw: bool = False, **kwargs: Any) -> None:
+    """Pre-render the body so detail pages can emit stored HTML"""
+    if raw:
+        return
+    instance.content_html = rendering.render_content(instance.content)
+
+
+@receiver(pre_save, sender=Snippet)
+def highlight_snippet(sender: Any, instance: Any, raw: bool = False, **kwargs: Any) -> None:
+    """Pre-render the highlighted code for a snippet"""
+    if raw:
+        return
+    instance.code_html = highlighting.highlight_code(instance.code, instance.language)
+
+
+@receiver(post_save, sender=Tutorial)
+@receiver(post_save, sender=Article)
+def update_search_index(sender: Any, instance: Any, raw: bool = False, **kwargs: Any) -> None:
+    """Refresh the search index row for a saved tutorial or article"""
+    if raw:
+        return
+    search.get_backend(instance._state.db).index(instance)
+
+
+@receiver(post_delete, sender=Tutorial)
+@receiver(post_delete, sender=Article)
+def remove_from_search_index(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Drop the search index row for a deleted tutorial or article"""
+    search.get_backend(instance._state.db).remove(instance)
+
+
+@receiver(post_save, sender=Tutorial)
+@receiver(post_save, sender=Article)
+@receiver(post_save, sender=Snippet)
+def update_author_stats(sender: Any, instance: Any, created: bool, raw: bool = False, **kwargs: Any) -> None:
+    """Bump the author's content counters"""
+    if raw:
+        return
+    stats.record_saved(instance, created)
+
+
+@receiver(post_delete, sender=Tutorial)
+@receiver(post_delete, sender=Article)
+@receiver(post_delete, sender=Snippet)
+def decrement_author_stats(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Decrement the author's content counters"""
+    stats.record_deleted(instance)
+
+
+@receiver(post_save, sender=Tutorial)
+@receiver(post_save, sender=Article)
+@receiver(post_save, sender=Snippet)
+@receiver(post_delete, sender=Tutorial)
+@receiver(post_delete, sender=Article)
+@receiver(post_delete, sender=Snippet)
+def invalidate_page_cache(sender: Any, **kwargs: Any) -> None:
+    """Expire cached pages built from the changed model"""
+    caching.bump_version(sender._meta.model_name)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def article_tags_changed(sender: Any, instance: Any, action: str, reverse: bool,
+                         pk_set: Optional[set[int]] = None, **kwargs: Any) -> None:
+    """Reindex retagged articles and expire pages that show their tags"""
+    if action == 'pre_clear' and reverse:
+        # tag.articles.clear() gives no pk_set, so note the articles first
+        instance._cleared_articles = list(
+            ArticleTag.objects.filter(tag=instance).values_list('article_id', flat=True)
+        )
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        pks = {instance.pk}
+    elif action == 'post_clear':
+        pks = set(instance.__dict__.pop('_cleared_articles', ()))
+    else:
+        pks = pk_set or set()
+    tagging.articles_retagged(pks, instance._state.db)
+
+
+@receiver(post_save, sender=Tag)
+def tag_saved(sender: Any, instance: Any, created: bool, raw: bool = False, **kwargs: Any) -> None:
+    """A renamed tag changes the search index, pages and tag cloud of its articles"""
+    if raw or created:
+        return
+    tagging.articles_retagged(
+        ArticleTag.objects.filter(tag=instance).values_list('article_id', flat=True), instance._state.db
+    )
+
+
+@receiver(pre_delete, sender=Tag)
+def remember_tagged_articles(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Note the tag's articles; their ArticleTag rows cascade without an m2m_changed"""
+    instance._tagged_articles = list(ArticleTag.objects.filter(tag=instance).values_list('article_id', flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+def tag_deleted(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Reindex the articles that lost a deleted tag"""
+    tagging.articles_retagged(getattr(instance, '_tagged_articles', ()), instance._state.db)
+
+
+@receiver(post_save, sender=Tutorial)
+@receiver(post_save, sender=Article)
+def refresh_related_items(sender: Any, instance: Any, raw: bool = False, **kwargs: Any) -> None:
+    """Queue a refresh of the saved item's related items and its neighbours'"""
+    if raw:
+        return
+    tasks.refresh_related_later(sender, [instance.pk])
+
+
+@receiver(pre_delete, sender=Tutorial)
+@receiver(pre_delete, sender=Article)
+def refill_related_items(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Queue a refresh of the items that list a deleted item, which lose an entry"""
+    sources = list(instance.related_to.values_list('source_id', flat=True))
+    if sources:
+        # Their lists shrink as soon as the rows cascade, before the refresh runs
+        related.touch(sender, sources)
+        tasks.refresh_related_later(sender, sources)
+
+
+def _release_image(storage: Any, name: str, renditions: dict[str, Any]) -> None:
+    """Drop a reference to an image file and its renditions once it is gone"""
+    storage.delete(name)
+    if not storage.exists(name):
+        images.delete_renditions(renditions)
+
+
+@receiver(pre_save, sender=Tutorial)
+def remember_previous_image(sender: Any, instance: Any, raw: bool = False, **kwargs: Any) -> None:
+    """Note the stored image so post_save can release it if it was replaced"""
+    instance._previous_image = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_image = (
+        sender.objects.filter(pk=instance.pk).values_list('image', 'image_renditions').first()
+    )
+
+
+@receiver(post_save, sender=Tutorial)
+def release_replaced_image(sender: Any, instance: Any, raw: bool = False, **kwargs: Any) -> None:
+    """Release the previous image file after a tutorial's image changes"""
+    previous = getattr(instance, '_previous_image', None)
+    if raw or not previous or not previous[0] or previous[0] == instance.image.name:
+        return
+    storage = instance.image.storage
+    name, renditions = previous
+    transaction.on_commit(lambda: _release_image(storage, name, renditions or {}))
+
+
+@receiver(post_delete, sender=Tutorial)
+def release_deleted_image(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Release a deleted tutorial's image file"""
+    if not instance.image:
+        return
+    storage = instance.image.storage
+    name, renditions = instance.image.name, instance.image_renditions or {}
+    transaction.on_commit(lambda: _release_image(storage, name, renditions))
@@ -0,0 +1,167 @@
+"""
+Per-author content statistics for the dashboard.
+
+Counts are read from ``AuthorStats`` rows that the post_save/post_delete
+receivers in ``tech.signals`` keep up to date with F() expressions, so a
+dashboard hit costs a primary key lookup instead of three COUNT(*) scans.
+``reconcile`` recomputes the rows in bulk to repair any drift.
+"""
+from typing import Any, Iterable, Optional
+
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Article, AuthorStats, Snippet, Tutorial
+
+# AuthorStats counter for each kind of content
+COUNTER_FIELDS: dict[type, str] = {
+    Tutorial: 'tutorial_count',
+    Article: 'article_count',
+    Snippet: 'snippet_count',
+}
+
+# Most rows of each kind loaded for the dashboard tables and "View All" dialogs;
+# the dialogs say "latest N of M" when an author has more
+DASHBOARD_ITEM_LIMIT = 50
+
+# Rows shown in the dashboard tabs
+RECENT_ITEM_LIMIT = 5
+
+
+def _count_for(model: Any) -> Coalesce:
+    """Correlated COUNT(*) of ``model`` rows written by the outer user"""
+    counts = (
+        model.objects.filter(author=OuterRef('pk'))
+        .order_by()
+        .values('author')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def count_content(author_id: int) -> dict[str, int]:
+    """Compute tutorial, article and snippet counts for an author in one query"""
+    return User.objects.filter(pk=author_id).values(
+        tutorial_count=_count_for(Tutorial),
+        article_count=_count_for(Article),
+        snippet_count=_count_for(Snippet),
+    ).get()
+
+
+def author_counts(user: Any) -> dict[str, int]:
+    """Return tutorial, article and snippet counts for ``user``"""
+    counts: Optional[dict[str, int]] = (
+        AuthorStats.objects.filter(author_id=user.pk)
+        .values('tutorial_count', 'article_count', 'snippet_count')
+        .first()
+    )
+    if counts is None:
+        # No counter row until the author's first save; it is cheap to compute then
+        counts = count_content(user.pk)
+    return counts
+
+
+def record_saved(instance: Any, created: bool) -> None:
+    """Update the author's counters after a tutorial, article or snippet is saved"""
+    now = getattr(instance, 'updated_at', None) or timezone.now()
+    stats = AuthorStats.objects.filter(author_id=instance.author_id)
+    if not created:
+        stats.update(last_activity_at=now)
+        return
+    field = COUNTER_FIELDS[type(instance)]
+    if stats.update(**{field: F(field) + 1, 'last_activity_at': now}):
+        return
+    # First counter update for this author: seed the row from the tables,
+    # which already include the new instance.
+    try:
+        with transaction.atomic():
+            AuthorStats.objects.create(
+                author_id=instance.author_id, last_activity_at=now, **count_content(instance.author_id)
+            )
+    except IntegrityError:
+        # A concurrent save created the row first
+        stats.update(**{field: F(field) + 1, 'last_activity_at': now})
+
+
+def record_deleted(instance: Any) -> None:
+    """Update the author's counters after a tutorial, article or snippet is deleted"""
+    field = COUNTER_FIELDS[type(instance)]
+    AuthorStats.objects.filter(author_id=instance.author_id).update(**{field: F(field) - 1})
+
+
+def reconcile(author_ids: Optional[Iterable[int]] = None, batch_size: int = 1000) -> int:
+    """Recompute AuthorStats rows from the content tables
+
+    Recomputes every author when ``author_ids`` is None. Returns the number of
+    rows whose stored counts differed from the recomputed ones.
+    """
+    users = User.objects.order_by('pk')
+    if author_ids is not None:
+        users = users.filter(pk__in=list(author_ids))
+    drifted = 0
+    ids = list(users.values_list('pk', flat=True))
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        rows = {pk: AuthorStats(author_id=pk) for pk in batch}
+        for model, field in COUNTER_FIELDS.items():
+            activity = 'updated_at' if hasattr(model, 'updated_at') else 'created_at'
+            totals = (
+                model.objects.filter(author_id__in=batch)
+                .order_by()
+                .values('author_id')
+                .annotate(total=Count('pk'), latest=Max(activity))
+            )
+            for row in totals:
+                stats = rows[row['author_id']]
+                setattr(stats, field, row['total'])
+                if stats.last_activity_at is None or row['latest'] > stats.last_activity_at:
+                    stats.last_activity_at = row['latest']
+        existing = {
+            row['author_id']: row
+            for row in AuthorStats.objects.filter(author_id__in=batch).values()
+        }
+        for pk, stats in rows.items():
+            stored = existing.get(pk)
+            if stored is None or any(
+                stored[field] != getattr(stats, field) for field in COUNTER_FIELDS.values()
+            ):
+                drifted += 1
+        with transaction.atomic():
+            AuthorStats.objects.bulk_create(
+                rows.values(),
+                update_conflicts=True,
+                unique_fields=['author'],
+                update_fields=[*COUNTER_FIELDS.values(), 'last_activity_at'],
+            )
+    return drifted
+
+
+def dashboard_content(user: Any) -> dict[str, Any]:
+    """Counts plus bounded lists of an author's newest content"""
+    tutorials = list(
+        Tutorial.objects.filter(author=user)
+        .only('id', 'title', 'description', 'image', 'image_renditions', 'image_status', 'created_at')
+        .order_by('-created_at')[:DASHBOARD_ITEM_LIMIT]
+    )
+    articles = list(
+        Article.objects.filter(author=user)
+        .only('id', 'title', 'created_at')
+        .order_by('-created_at')[:DASHBOARD_ITEM_LIMIT]
+    )
+    snippets = list(
+        Snippet.objects.filter(author=user)
+        .only('id', 'title', 'language', 'created_at')
+        .order_by('-created_at')[:RECENT_ITEM_LIMIT]
+    )
+    return {
+        **author_counts(user),
+        'user_tutorials': tutorials,
+        'user_articles': articles,
+        'recent_tutorials': tutorials[:RECENT_ITEM_LIMIT],
+        'recent_articles': articles[:RECENT_ITEM_LIMIT],
+        'recent_snippets': snippets,
+    }
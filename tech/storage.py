@@ -0,0 +1,126 @@
+"""
+Content-addressed, deduplicating file storage for uploaded images.
+
+Files are stored under the SHA-256 of their bytes
+(``tutorials/ab/ab12...ef.jpg``), so uploading the same image twice stores
+it once and returns the existing name. Each stored name has a ``MediaBlob``
+row counting the model rows that reference it; ``delete()`` only removes the
+file when the last reference is released.
+
+The file is written before the transaction holding its reference commits, so
+a rollback can leave a file no row uses; ``dedupe_media`` sweeps those up once
+they are older than ``TECH_MEDIA_ORPHAN_AGE``.
+"""
+import re
+import hashlib
+import os
+import tempfile
+from typing import Any, Optional
+
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils.deconstruct import deconstructible
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Base name of a content-addressed file: the SHA-256 hex digest and extension
+HASHED_BASENAME = re.compile(r'^[0-9a-f]{64}(\.[^./]+)?$')
+
+
+def file_digest(content: Any) -> str:
+    """SHA-256 hex digest of a Django File or any binary file object"""
+    digest = hashlib.sha256()
+    if hasattr(content, 'chunks'):
+        content.seek(0)
+        for chunk in content.chunks(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    else:
+        for chunk in iter(lambda: content.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hashed_name(name: str, digest: str) -> str:
+    """Content-addressed name in the same upload directory as ``name``"""
+    directory = os.path.dirname(name)
+    ext = os.path.splitext(name)[1].lower()
+    return '/'.join(part for part in (directory, digest[:2], f'{digest}{ext}') if part)
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """FileSystemStorage that names files by content hash and reference-counts them"""
+
+    content_addressed = True
+
+    def get_available_name(self, name: str, max_length: Optional[int] = None) -> str:
+        # The final name comes from the content in _save(); it never needs a suffix
+        return name
+
+    def _save(self, name: str, content: Any) -> str:
+        digest = file_digest(content)
+        name = hashed_name(name, digest)
+        if not self.exists(name):
+            self._write(name, content)
+        else:
+            # Reused files count as new for the orphan sweep's grace period
+            os.utime(self.path(name))
+        self.retain(name, digest, content.size)
+        return name
+
+    def _write(self, name: str, content: Any) -> None:
+        """Write via a temp file and rename, so concurrent identical uploads are harmless"""
+        full_path = self.path(name)
+        directory = os.path.dirname(full_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.upload')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                content.seek(0)
+                for chunk in content.chunks():
+                    f.write(chunk)
+            if self.file_permissions_mode is not None:
+                os.chmod(temp_path, self.file_permissions_mode)
+            os.replace(temp_path, full_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def retain(self, name: str, digest: str, size: int) -> None:
+        """Record one more reference to ``name``"""
+        from .models import MediaBlob
+
+        if MediaBlob.objects.filter(name=name).update(ref_count=F('ref_count') + 1):
+            return
+        try:
+            with transaction.atomic():
+                MediaBlob.objects.create(name=name, digest=digest, size=size, ref_count=1)
+        except IntegrityError:
+            MediaBlob.objects.filter(name=name).update(ref_count=F('ref_count') + 1)
+
+    def release(self, name: str) -> Optional[int]:
+        """Drop one reference to ``name``; returns the remaining count, or None if untracked"""
+        from .models import MediaBlob
+
+        MediaBlob.objects.filter(name=name, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+        return MediaBlob.objects.filter(name=name).values_list('ref_count', flat=True).first()
+
+    def delete(self, name: str) -> None:
+        """Release a reference, removing the file once nothing uses it
+
+        Files saved before this storage was installed have no MediaBlob row
+        and are left alone.
+        """
+        from .models import MediaBlob
+
+        remaining = self.release(name)
+        if remaining == 0:
+            MediaBlob.objects.filter(name=name, ref_count=0).delete()
+            super().delete(name)
+
+
+def get_image_storage() -> ContentAddressedStorage:
+    """Storage for Tutorial.image (location and URL follow MEDIA_ROOT/MEDIA_URL)"""
+    return ContentAddressedStorage()
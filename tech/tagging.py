@@ -0,0 +1,142 @@
+"""
+Article tags: parsing, assignment and the cached tag cloud.
+
+Tags are typed as free text ("python django, web") and stored as ``Tag``
+rows joined to articles through ``ArticleTag``. Names are lowercased and
+matched by slug, so "Django" and "django" are the same tag and filtering by
+a tag is an exact, indexed lookup rather than a substring match.
+
+``articles_retagged`` brings the search index, ``updated_at``, cached pages
+and related items of retagged articles up to date. The ``m2m_changed``
+receiver in ``tech.signals`` calls it for ``article.tags`` changes; code
+that writes ``ArticleTag`` rows or renames a ``Tag`` directly (the admin)
+must call it too, since no ``m2m_changed`` is sent then.
+"""
+import re
+from typing import Any, Iterable
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.text import slugify
+
+from . import caching, search, tasks
+from .models import Article, ArticleTag, Tag
+
+# Longest tag name kept (Tag.name max_length)
+MAX_TAG_LENGTH = 50
+
+# Most tags shown in the tag cloud
+TAG_CLOUD_SIZE = 30
+
+# Font size steps used by the tag cloud
+TAG_CLOUD_STEPS = 5
+
+
+def parse_tags(text: str) -> list[str]:
+    """Split space- or comma-separated tag text into distinct, normalized names"""
+    names: list[str] = []
+    seen: set[str] = set()
+    for raw in re.split(r'[\s,]+', text or ''):
+        name = raw.strip('#').lower()[:MAX_TAG_LENGTH]
+        slug = slugify(name)
+        if slug and slug not in seen:
+            seen.add(slug)
+            names.append(name)
+    return names
+
+
+def get_or_create_tags(names: Iterable[str]) -> list[Tag]:
+    """Tag rows for ``names`` in order, creating the missing ones in bulk
+
+    An existing tag matches by slug or by name: the admin can give a tag a
+    custom slug, and ``name`` is unique too.
+    """
+    by_slug = {slugify(name): name for name in names}
+    if not by_slug:
+        return []
+
+    def lookup(slugs: Iterable[str]) -> dict[str, Tag]:
+        slugs = list(slugs)
+        names = [by_slug[slug] for slug in slugs]
+        tags = list(Tag.objects.filter(Q(slug__in=slugs) | Q(name__in=names)))
+        by_name = {tag.name: tag for tag in tags}
+        found = {tag.slug: tag for tag in tags}
+        return {
+            slug: found.get(slug) or by_name[by_slug[slug]]
+            for slug in slugs if slug in found or by_slug[slug] in by_name
+        }
+
+    existing = lookup(by_slug)
+    missing = [Tag(name=name, slug=slug) for slug, name in by_slug.items() if slug not in existing]
+    if missing:
+        # A concurrent insert of the same tag is ignored here and found by the lookup
+        Tag.objects.bulk_create(missing, ignore_conflicts=True)
+        existing.update(lookup(tag.slug for tag in missing))
+    return [existing[slug] for slug in by_slug]
+
+
+def set_article_tags(article: Any, names: Iterable[str]) -> None:
+    """Replace an article's tags"""
+    article.tags.set(get_or_create_tags(names))
+
+
+def set_tags_in_bulk(tags_by_article: dict[int, list[str]]) -> None:
+    """Replace the tags of many articles with one delete and one insert"""
+    if not tags_by_article:
+        return
+    requested = list({slugify(name): name for names in tags_by_article.values() for name in names}.values())
+    # Keyed by the slug of the requested name: a matched tag may carry a custom slug
+    tags = {slugify(name): tag for name, tag in zip(requested, get_or_create_tags(requested))}
+    ArticleTag.objects.filter(article_id__in=list(tags_by_article)).delete()
+    ArticleTag.objects.bulk_create([
+        ArticleTag(article_id=article_id, tag=tags[slugify(name)])
+        for article_id, names in tags_by_article.items()
+        for name in names
+    ], ignore_conflicts=True)
+
+
+def articles_retagged(pks: Iterable[int], using: str = DEFAULT_DB_ALIAS) -> None:
+    """Reindex articles whose tags changed and expire pages that show their tags"""
+    pks = set(pks)
+    if pks:
+        # Cached cards and ETags are keyed on updated_at
+        Article.objects.using(using).filter(pk__in=pks).update(updated_at=timezone.now())
+        articles = Article.objects.using(using).filter(pk__in=pks).prefetch_related('tags')
+        search.get_backend(using).index_many(Article, articles)
+        tasks.refresh_related_later(Article, pks)
+    caching.bump_version('article')
+
+
+def tag_text(article: Any) -> str:
+    """An article's tags as space-separated text, using prefetched tags when present"""
+    if article.pk is None:
+        return ''
+    return ' '.join(tag.name for tag in article.tags.all())
+
+
+def tag_cloud(limit: int = TAG_CLOUD_SIZE) -> list[dict[str, Any]]:
+    """The most used tags with their article counts and a 1-5 size step
+
+    Counted with one GROUP BY on the through table and cached until an
+    article or its tags change.
+    """
+    key = f'tech:tag_cloud:{caching.get_versions("article")["article"]}:{limit}'
+    cloud: Any = cache.get(key)
+    if cloud is not None:
+        return cloud
+    rows = list(
+        Tag.objects.annotate(count=Count('article_tags'))
+        .filter(count__gt=0)
+        .order_by('-count', 'name')
+        .values('name', 'slug', 'count')[:limit]
+    )
+    if rows:
+        low, high = rows[-1]['count'], rows[0]['count']
+        for row in rows:
+            spread = (row['count'] - low) / (high - low) if high > low else 0
+            row['step'] = 1 + round(spread * (TAG_CLOUD_STEPS - 1))
+    cloud = sorted(rows, key=lambda row: row['name'])
+    cache.set(key, cloud, caching.stored_timeout(caching.page_cache_timeout()))
+    return cloud
@@ -0,0 +1,72 @@
+"""
+Background tasks run by the job queue in ``tech.jobs``.
+"""
+from datetime import timedelta
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.utils import timezone
+
+from . import caching, images, jobs, related
+from .models import Article, Job, Tutorial
+
+# Model name -> model for tasks that take a ``model`` argument
+RELATED_MODELS: dict[str, Any] = {'tutorial': Tutorial, 'article': Article}
+
+
+def mark_image_failed(tutorial_id: int, image: str) -> None:
+    Tutorial.objects.filter(pk=tutorial_id, image=image).update(image_status=Tutorial.IMAGE_FAILED)
+
+
+@jobs.task('process_tutorial_image', on_failure=mark_image_failed)
+def process_tutorial_image(tutorial_id: int, image: str) -> None:
+    """Generate renditions for an uploaded tutorial image"""
+    tutorial = Tutorial.objects.filter(pk=tutorial_id, image=image).first()
+    if tutorial is None:
+        # Deleted, or the image was replaced and a newer job owns it
+        return
+    Tutorial.objects.filter(pk=tutorial_id).update(image_status=Tutorial.IMAGE_PROCESSING)
+    images.refresh_tutorial_image(tutorial)
+    # Cached pages were rendered with the original image as a fallback
+    caching.bump_version('tutorial')
+
+
+def process_image_later(tutorial: Tutorial) -> None:
+    """Queue rendition generation for a tutorial whose image just changed"""
+    jobs.enqueue('process_tutorial_image', tutorial_id=tutorial.pk, image=tutorial.image.name)
+
+
+@jobs.task('refresh_related')
+def refresh_related(model: str, pks: list[int]) -> None:
+    """Recompute related items after tutorials or articles changed"""
+    related.refresh(RELATED_MODELS[model], pks)
+
+
+@jobs.task('rebuild_related')
+def rebuild_related(model: str) -> None:
+    """Recompute every related item of a model"""
+    related.rebuild(RELATED_MODELS[model])
+
+
+def refresh_related_later(model: Any, pks: Iterable[int]) -> None:
+    """Queue a delayed related items refresh
+
+    Items are merged into a refresh of the same model that is still waiting,
+    so a burst of edits is computed once.
+    """
+    name = model._meta.model_name
+    pks = set(pks)
+    waiting = Job.objects.filter(
+        task='refresh_related', status=Job.PENDING, attempts=0, payload__model=name
+    ).values_list('pk', 'payload').first()
+    if waiting is not None:
+        pk, payload = waiting
+        # Only matches while no worker has claimed the job and no other merge
+        # has rewritten its payload; otherwise queue a job of our own
+        merged = Job.objects.filter(pk=pk, status=Job.PENDING, attempts=0, payload=payload).update(
+            payload={**payload, 'pks': sorted(set(payload['pks']) | pks)}
+        )
+        if merged:
+            return
+    delay = timedelta(seconds=int(getattr(settings, 'TECH_RELATED_DELAY', 10)))
+    jobs.enqueue('refresh_related', run_at=timezone.now() + delay, model=name, pks=sorted(pks))
@@ -0,0 +1,42 @@
+"""
+Template tags for the static bundles in ``tech.assets`` and the vendored
+third-party files in ``tech.vendor``.
+
+    {% load tech_assets %}
+    {% vendor_asset 'vendor/bootstrap/css/bootstrap.min.css' %}
+    {% asset_bundle 'css/site.css' %}
+    {% asset_bundle 'js/site.js' %}
+"""
+from django import template
+from django.utils.html import format_html_join
+from django.utils.safestring import SafeString
+
+from tech import assets, vendor
+
+register = template.Library()
+
+
+def _include(name: str, urls: list[str]) -> SafeString:
+    if name.endswith('.css'):
+        return format_html_join('\n    ', '<link rel="stylesheet" href="{}">', ((url,) for url in urls))
+    if name.endswith('.js'):
+        return format_html_join('\n    ', '<script src="{}"></script>', ((url,) for url in urls))
+    raise template.TemplateSyntaxError(f'Do not know how to include {name!r}')
+
+
+@register.simple_tag
+def asset_bundle(name: str) -> SafeString:
+    """<link> or <script> tags for a bundle, or for its sources before collectstatic"""
+    return _include(name, assets.bundle_urls(name))
+
+
+@register.simple_tag
+def vendor_asset(path: str) -> SafeString:
+    """<link> or <script> tag for a vendored file, or for its CDN release before vendor_assets"""
+    return _include(path, [vendor.vendor_url(path)])
+
+
+@register.simple_tag
+def asset_url(name: str) -> str:
+    """URL of a single bundle, resolved from the in-memory manifest"""
+    return assets.bundle_urls(name)[0]
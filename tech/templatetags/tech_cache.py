@@ -0,0 +1,66 @@
+"""
+Fragment caching for templates.
+
+    {% load tech_cache %}
+    {% fragment 'navbar' user.is_authenticated %}...{% endfragment %}
+    {% fragment 'tutorial_card' tutorial.pk tutorial.updated_at %}...{% endfragment %}
+
+The rendered body is cached under the fragment name, a hash of the
+fragment's template source and the values it varies on, so editing the
+template or the row gives a new key and nothing has to be deleted. Each
+render counts a hit or miss (see ``tech.caching.fragment_stats`` and the
+``fragment_cache_stats`` command).
+"""
+import hashlib
+from typing import Any
+
+from django import template
+from django.core.cache import cache
+from django.template.base import FilterExpression, NodeList, Parser, Token
+from django.utils.safestring import mark_safe
+
+from tech import assets, caching
+
+register = template.Library()
+
+
+class FragmentNode(template.Node):
+    def __init__(self, nodelist: NodeList, name: FilterExpression, vary_on: list[FilterExpression],
+                 source_hash: str) -> None:
+        self.nodelist = nodelist
+        self.name = name
+        self.vary_on = vary_on
+        self.source_hash = source_hash
+
+    def render(self, context: template.Context) -> str:
+        name = str(self.name.resolve(context))
+        # Fragments may embed hashed static URLs, so a new manifest means new keys
+        vary_on = [assets.static_version(), *(value.resolve(context) for value in self.vary_on)]
+        key = caching.fragment_key(name, self.source_hash, vary_on)
+        content = cache.get(key)
+        caching.record_fragment(name, hit=content is not None)
+        if content is None:
+            content = self.nodelist.render(context)
+            cache.set(key, content, caching.fragment_cache_timeout())
+            caching.register_fragment(name)
+        return mark_safe(content)
+
+
+@register.tag('fragment')
+def do_fragment(parser: Parser, token: Token) -> FragmentNode:
+    """Cache the enclosed template output: {% fragment name [vary_on ...] %}"""
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' tag requires a fragment name")
+    remaining = list(parser.tokens)
+    nodelist = parser.parse(('endfragment',))
+    parser.delete_first_token()
+    # parser.tokens is consumed from the end; what was taken is this fragment's source
+    consumed = remaining[len(parser.tokens):]
+    source = '\x00'.join(f'{t.token_type}:{t.contents}' for t in consumed)
+    return FragmentNode(
+        nodelist,
+        parser.compile_filter(bits[1]),
+        [parser.compile_filter(bit) for bit in bits[2:]],
+        hashlib.md5(source.encode()).hexdigest(),
+    )
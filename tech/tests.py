@@ -1,3 +1,1350 @@
-from django.test import TestCase
+import gzip
+import importlib
+import io
+import json
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+from unittest import mock, skipIf
+from wsgiref.util import FileWrapper, setup_testing_defaults
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, connections, transaction
+from django.template import Context, Template, engines
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from . import assets, caching, checks, database, jobs, related, routing, search, serving, stats, tagging, tasks, vendor
+from .fetcher import Fetcher, HTTPClientTransport, Response
+from .rendering import render_content
+from .storage import file_digest, hashed_name
+from .warmup import template_names, warm_templates
+from .models import Article, ArticleTag, AuthorStats, Job, MediaBlob, Snippet, Tag, Tutorial, TutorialTerm
+from .pagination import CursorPaginator
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(username='author', password='secret123')
+        cls.django_article = Article.objects.create(
+            title='Getting started with Django', content='Models, views and templates.', author=cls.user,
+        )
+        tagging.set_article_tags(cls.django_article, ['python', 'web'])
+        cls.go_article = Article.objects.create(
+            title='Concurrency in Go', content='Goroutines and channels.', author=cls.user,
+        )
+        tagging.set_article_tags(cls.go_article, ['go'])
+        cls.tutorial = Tutorial.objects.create(
+            title='CSS Grid', description='Two-dimensional layouts',
+            content='Use grid-template-columns to define tracks.', author=cls.user,
+        )
+
+    def test_title_match_ranks_first(self) -> None:
+        Article.objects.create(
+            title='Deploying apps', content='We deploy our Django project with gunicorn.', author=self.user,
+        )
+        results = list(search.search(Article.objects.all(), 'django'))
+        self.assertEqual(results[0], self.django_article)
+        self.assertEqual(len(results), 2)
+
+    def test_prefix_and_tags_match(self) -> None:
+        self.assertEqual(list(search.search(Article.objects.all(), 'goro')), [self.go_article])
+        self.assertEqual(list(search.search(Article.objects.all(), 'web')), [self.django_article])
+
+    def test_index_follows_updates_and_deletes(self) -> None:
+        self.tutorial.content = 'Flexbox alignment'
+        self.tutorial.save()
+        self.assertFalse(search.search(Tutorial.objects.all(), 'tracks').exists())
+        self.assertTrue(search.search(Tutorial.objects.all(), 'flexbox').exists())
+        self.tutorial.delete()
+        self.assertFalse(search.search(Tutorial.objects.all(), 'flexbox').exists())
+
+    def test_operators_in_query_are_literal(self) -> None:
+        self.assertFalse(search.search(Article.objects.all(), 'NOT "django" OR').exists())
+        self.assertFalse(search.search(Article.objects.all(), '***').exists())
+
+    def test_article_search_view(self) -> None:
+        response = self.client.get(reverse('articles'), {'q': 'channels'})
+        self.assertEqual(list(response.context['articles']), [self.go_article])
+
+
+@override_settings(TECH_CURSOR_PAGINATION=True)
+class CursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(username='author', password='secret123')
+        start = timezone.now()
+        # Two snippets share a timestamp so the id tiebreaker is exercised
+        cls.snippets = [
+            Snippet.objects.create(
+                title=f'Snippet {i}', code='print()', language='python', author=cls.user,
+                created_at=start - timedelta(minutes=i // 2 * 2),
+            )
+            for i in range(25)
+        ]
+
+    def test_walks_forward_and_back_without_gaps(self) -> None:
+        expected = list(Snippet.objects.order_by('-created_at', '-id'))
+        seen = []
+        page = CursorPaginator(Snippet.objects.all(), 10).get_page(None)
+        pages = [page]
+        seen.extend(page)
+        while page.has_next():
+            page = CursorPaginator(Snippet.objects.all(), 10).get_page(page.next_page_number())
+            pages.append(page)
+            seen.extend(page)
+        self.assertEqual(seen, expected)
+        self.assertFalse(pages[0].has_previous())
+
+        back = CursorPaginator(Snippet.objects.all(), 10).get_page(pages[-1].previous_page_number())
+        self.assertEqual(list(back), list(pages[1]))
+        self.assertTrue(back.has_previous())
+        first = CursorPaginator(Snippet.objects.all(), 10).get_page(back.previous_page_number())
+        self.assertEqual(list(first), list(pages[0]))
+        self.assertFalse(first.has_previous())
+
+    def test_bad_token_falls_back_to_first_page(self) -> None:
+        page = CursorPaginator(Snippet.objects.all(), 10).get_page('3')
+        self.assertEqual(page[0], Snippet.objects.order_by('-created_at', '-id').first())
+
+    def test_list_view_renders_cursor_links(self) -> None:
+        response = self.client.get(reverse('snippets'))
+        page = response.context['snippets']
+        self.assertContains(response, f'?page={page.next_page_number()}')
+        self.assertEqual(len(page), 10)
+
+
+class ListQueryCountTests(TestCase):
+    """Listing pages must not issue a query per rendered row"""
+
+    def setUp(self) -> None:
+        self.users = [User.objects.create(username=f'author{i}') for i in range(10)]
+
+    def count_queries(self, url: str) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def create_rows(self, start: int, stop: int) -> None:
+        for i in range(start, stop):
+            user = self.users[i]
+            Tutorial.objects.create(title=f'Tutorial {i}', description='d', content='c' * 5000, author=user)
+            article = Article.objects.create(title=f'Article {i}', content='word ' * 2000, author=user)
+            tagging.set_article_tags(article, ['a', f'tag{i}'])
+            Snippet.objects.create(title=f'Snippet {i}', code='x = 1', language='python', author=user)
+
+    def test_list_pages_use_constant_queries(self) -> None:
+        urls = [reverse('tutorials'), reverse('articles'), reverse('snippets')]
+        self.create_rows(0, 1)
+        single = [self.count_queries(url) for url in urls]
+        self.create_rows(1, 10)
+        full = [self.count_queries(url) for url in urls]
+        self.assertEqual(single, full)
+
+    def test_list_pages_do_not_load_full_bodies(self) -> None:
+        self.create_rows(0, 3)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('articles'))
+        select = next(q['sql'] for q in queries if 'FROM "tech_article"' in q['sql'] and 'COUNT' not in q['sql'])
+        self.assertIn('SUBSTR("tech_article"."content"', select)
+        self.assertNotIn('"tech_article"."content"', re.sub(r'SUBSTR\([^)]*\)', '', select))
+
+    def test_detail_pages_join_author(self) -> None:
+        cache.clear()
+        self.create_rows(0, 1)
+        tutorial = Tutorial.objects.get()
+        article = Article.objects.get()
+        # One lookup for the conditional GET validators, one for the page and
+        # one for its related items
+        with self.assertNumQueries(3):
+            self.client.get(reverse('tutorial_detail', args=[tutorial.id]))
+        # Plus one for the article's tags
+        with self.assertNumQueries(4):
+            self.client.get(reverse('article_detail', args=[article.id]))
+
+
+class DashboardTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username='author', password='secret123')
+        other = User.objects.create(username='other')
+        for i in range(7):
+            Tutorial.objects.create(title=f'Tutorial {i}', description='d', content='c', author=self.user)
+            Article.objects.create(title=f'Article {i}', content='c', author=self.user)
+        Snippet.objects.create(title='Snippet', code='x', language='css', author=self.user)
+        Tutorial.objects.create(title='Not mine', description='d', content='c', author=other)
+        self.client.force_login(self.user)
+
+    def test_counts_and_recent_items(self) -> None:
+        response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.context['tutorial_count'], 7)
+        self.assertEqual(response.context['article_count'], 7)
+        self.assertEqual(response.context['snippet_count'], 1)
+        self.assertEqual(len(response.context['recent_tutorials']), 5)
+        self.assertContains(response, 'View All Tutorials (7)')
+
+    def test_truncated_lists_say_so(self) -> None:
+        with mock.patch.object(stats, 'DASHBOARD_ITEM_LIMIT', 6):
+            response = self.client.get(reverse('dashboard'))
+        self.assertEqual(len(response.context['user_tutorials']), 6)
+        self.assertContains(response, 'View Latest 6 of 7 Tutorials')
+        self.assertContains(response, 'Your Latest 6 of 7 Articles')
+        self.assertNotContains(response, 'View All Tutorials')
+
+    def test_query_budget(self) -> None:
+        # Session and user lookups, the counter row, one bounded list per kind
+        with self.assertNumQueries(6):
+            self.client.get(reverse('dashboard'))
+
+
+class AuthorStatsTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create(username='author')
+
+    def test_counters_follow_saves_and_deletes(self) -> None:
+        tutorial = Tutorial.objects.create(title='T', description='d', content='c', author=self.user)
+        Article.objects.create(title='A', content='c', author=self.user)
+        Article.objects.create(title='B', content='c', author=self.user)
+        tutorial.save()
+        tutorial.delete()
+        row = AuthorStats.objects.get(author=self.user)
+        self.assertEqual((row.tutorial_count, row.article_count, row.snippet_count), (0, 2, 0))
+        self.assertIsNotNone(row.last_activity_at)
+
+    def test_reconcile_repairs_drift(self) -> None:
+        Snippet.objects.create(title='S', code='x', language='css', author=self.user)
+        AuthorStats.objects.filter(author=self.user).update(snippet_count=42, article_count=-3)
+        self.assertEqual(stats.reconcile(), 1)
+        self.assertEqual(stats.author_counts(self.user), {'tutorial_count': 0, 'article_count': 0, 'snippet_count': 1})
+        self.assertEqual(stats.reconcile(), 0)
+
+
+class RenderingTests(TestCase):
+    def test_paragraphs_and_fenced_code(self) -> None:
+        html = render_content('Intro <b>text</b>\nline two\n\n```python\nif a < b:\n    pass\n```\nOutro')
+        self.assertTrue(html.startswith('<p>Intro &lt;b&gt;text&lt;/b&gt;<br>line two</p>\n\n<div class="highlight">'))
+        self.assertIn('<span class="k">if</span>', html)
+        self.assertIn('&lt;', html)
+        self.assertTrue(html.endswith('</div>\n\n<p>Outro</p>'))
+
+    def test_unterminated_fence_is_text(self) -> None:
+        self.assertEqual(render_content('```js\nx'), '<p>```js<br>x</p>')
+
+    def test_detail_page_serves_stored_html(self) -> None:
+        user = User.objects.create(username='author')
+        article = Article.objects.create(title='A', content='```\nprint(1)\n```', author=user)
+        self.assertEqual(article.content_html, '<pre><code>print(1)</code></pre>')
+        response = self.client.get(reverse('article_detail', args=[article.id]))
+        self.assertContains(response, '<pre><code>print(1)</code></pre>', html=True)
+
+    def test_snippet_highlighted_on_save_and_edit(self) -> None:
+        user = User.objects.create(username='author')
+        snippet = Snippet.objects.create(title='S', code='def f(): pass', language='python', author=user)
+        self.assertIn('<span class="k">def</span>', snippet.code_html)
+        snippet.code = 'body { color: red; }'
+        snippet.language = 'css'
+        snippet.save()
+        self.assertNotIn('<span class="k">def</span>', snippet.code_html)
+        self.assertIn('<span class="nt">body</span>', snippet.code_html)
+        self.assertContains(self.client.get(reverse('snippets')), '<span class="nt">body</span>')
+
+
+class PageCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create(username='author')
+        self.snippet = Snippet.objects.create(title='First', code='x', language='css', author=self.user)
+
+    def test_anonymous_pages_are_cached_until_content_changes(self) -> None:
+        url = reverse('snippets')
+        self.assertEqual(self.client.get(url)['X-Page-Cache'], 'miss')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url)['X-Page-Cache'], 'hit')
+        self.assertEqual(self.client.get(url, {'page': '2'})['X-Page-Cache'], 'miss')
+
+        self.snippet.title = 'Renamed'
+        self.snippet.save()
+        response = self.client.get(url)
+        self.assertEqual(response['X-Page-Cache'], 'miss')
+        self.assertContains(response, 'Renamed')
+
+    def test_other_models_do_not_invalidate(self) -> None:
+        url = reverse('snippets')
+        self.client.get(url)
+        Article.objects.create(title='A', content='c', author=self.user)
+        self.assertEqual(self.client.get(url)['X-Page-Cache'], 'hit')
+
+    def test_authenticated_users_bypass_cache(self) -> None:
+        self.client.force_login(self.user)
+        self.client.get(reverse('snippets'))
+        self.assertNotIn('X-Page-Cache', self.client.get(reverse('snippets')))
+
+    def test_production_uses_a_cache_shared_between_processes(self) -> None:
+        self.addCleanup(sys.modules.pop, 'techblog.settings_production', None)
+        with mock.patch.dict(os.environ, {'DJANGO_SECRET_KEY': 'test'}):
+            production = importlib.import_module('techblog.settings_production')
+        self.assertNotIn(production.CACHES['default']['BACKEND'], checks.PROCESS_LOCAL_CACHES)
+        self.assertEqual([e.id for e in checks.check_shared_cache()], ['tech.E001'])
+        with override_settings(TECH_PAGE_CACHE_ENABLED=False):
+            self.assertEqual(checks.check_shared_cache(), [])
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create(username='author')
+        self.tutorial = Tutorial.objects.create(title='T', description='d', content='c', author=self.user)
+        self.url = reverse('tutorial_detail', args=[self.tutorial.id])
+
+    def test_revalidation_returns_304_from_one_query(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_edit_changes_validators(self) -> None:
+        etag = self.client.get(self.url)['ETag']
+        self.tutorial.title = 'Changed'
+        self.tutorial.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_related_items_change_validators(self) -> None:
+        self.tutorial.title = 'Python decorators'
+        self.tutorial.save()
+        other = Tutorial.objects.create(title='Python decorators in depth', description='d', content='c', author=self.user)
+        other_url = reverse('tutorial_detail', args=[other.id])
+        related.rebuild(Tutorial)
+        response = self.client.get(self.url)
+        self.assertContains(response, other_url)
+        other.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, other_url)
+
+    def test_login_state_changes_etag(self) -> None:
+        etag = self.client.get(self.url)['ETag']
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_missing_row_is_404(self) -> None:
+        self.assertEqual(self.client.get(reverse('article_detail', args=[999])).status_code, 404)
+
+
+def make_image(size: tuple[int, int] = (900, 600), color: str = 'teal') -> bytes:
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+
+class MediaTestCase(TestCase):
+    """Runs with MEDIA_ROOT pointed at a throwaway directory"""
+
+    def setUp(self) -> None:
+        cache.clear()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        override = self.settings(MEDIA_ROOT=media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.user = User.objects.create_user(username='author', password='secret123')
+        self.client.force_login(self.user)
+
+    def upload(self, **extra: Any) -> Tutorial:
+        self.client.post(reverse('add_tutorial'), {
+            'title': 'With image', 'description': 'd', 'content': 'c',
+            'image': SimpleUploadedFile('photo.jpg', make_image(), content_type='image/jpeg'),
+            **extra,
+        })
+        jobs.work(burst=True)
+        return Tutorial.objects.get(title='With image')
+
+
+class ImageRenditionTests(MediaTestCase):
+    def test_upload_generates_renditions(self) -> None:
+        tutorial = self.upload()
+        self.assertEqual(set(tutorial.image_renditions), {'thumb', 'card', 'full'})
+        with default_storage.open(tutorial.image_renditions['thumb']['jpg']) as f:
+            self.assertEqual(Image.open(f).size, (80, 80))
+        with default_storage.open(tutorial.image_renditions['full']['webp']) as f:
+            self.assertEqual(Image.open(f).size, (900, 600))
+        self.assertIn('-thumb.jpg', tutorial.thumbnail_url)
+        self.assertIn('600w', tutorial.image_srcset)
+        self.assertEqual(tutorial.image_sources[-1]['type'], 'image/webp')
+        self.assertContains(self.client.get(reverse('dashboard')), tutorial.thumbnail_url)
+
+    def test_properties_fall_back_to_original(self) -> None:
+        tutorial = self.upload()
+        Tutorial.objects.filter(pk=tutorial.pk).update(image_renditions={})
+        tutorial.refresh_from_db()
+        self.assertEqual(tutorial.thumbnail_url, tutorial.image.url)
+        self.assertEqual(tutorial.image_srcset, '')
+
+
+class ContentAddressedStorageTests(MediaTestCase):
+    def test_duplicate_uploads_share_one_file(self) -> None:
+        first = self.upload()
+        first.title = 'First'
+        first.save()
+        second = self.upload()
+        self.assertEqual(first.image.name, second.image.name)
+        self.assertRegex(first.image.name, r'^tutorials/[0-9a-f]{2}/[0-9a-f]{64}\.jpg$')
+        self.assertEqual(MediaBlob.objects.get(name=first.image.name).ref_count, 2)
+        self.assertEqual(first.image_renditions, second.image_renditions)
+
+        storage = first.image.storage
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertTrue(storage.exists(second.image.name))
+        self.assertTrue(default_storage.exists(second.image_renditions['thumb']['jpg']))
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(storage.exists(second.image.name))
+        self.assertFalse(default_storage.exists(second.image_renditions['thumb']['jpg']))
+        self.assertFalse(MediaBlob.objects.exists())
+
+    def test_dedupe_media_merges_legacy_copies(self) -> None:
+        data = make_image()
+        for name in ('tutorials/a.jpg', 'tutorials/b.jpg'):
+            default_storage.save(name, ContentFile(data))
+            Tutorial.objects.create(title=name, description='d', content='c', author=self.user, image=name)
+
+        call_command('dedupe_media', dry_run=True, stdout=io.StringIO())
+        self.assertTrue(default_storage.exists('tutorials/b.jpg'))
+
+        stamps = dict(Tutorial.objects.values_list('pk', 'updated_at'))
+        version = caching.get_versions('tutorial')['tutorial']
+        out = io.StringIO()
+        call_command('dedupe_media', stdout=out)
+        # Cached pages, cards and ETags must not keep naming the removed files
+        self.assertGreater(caching.get_versions('tutorial')['tutorial'], version)
+        for pk, updated_at in Tutorial.objects.values_list('pk', 'updated_at'):
+            self.assertGreater(updated_at, stamps[pk])
+        names = set(Tutorial.objects.values_list('image', flat=True))
+        self.assertEqual(len(names), 1)
+        name = names.pop()
+        self.assertTrue(default_storage.exists(name))
+        self.assertFalse(default_storage.exists('tutorials/a.jpg'))
+        self.assertFalse(default_storage.exists('tutorials/b.jpg'))
+        self.assertEqual(MediaBlob.objects.get(name=name).ref_count, 2)
+        self.assertIn(f'reclaimed {len(data)} bytes', out.getvalue())
+
+
+    def test_dedupe_media_sweeps_files_of_rolled_back_uploads(self) -> None:
+        kept = self.upload()
+        image = ContentFile(make_image(color='blue'), name='blue.jpg')
+        orphan_name = hashed_name('tutorials/blue.jpg', file_digest(image))
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            Tutorial.objects.create(title='Rolled back', description='d', content='c', author=self.user, image=image)
+            raise RuntimeError
+        storage = kept.image.storage
+        self.assertTrue(storage.exists(orphan_name))
+        self.assertFalse(MediaBlob.objects.filter(name=orphan_name).exists())
+
+        # Too recent: its transaction might still be open
+        call_command('dedupe_media', stdout=io.StringIO())
+        self.assertTrue(storage.exists(orphan_name))
+
+        out = io.StringIO()
+        with self.settings(TECH_MEDIA_ORPHAN_AGE=-1):
+            call_command('dedupe_media', stdout=out)
+        self.assertIn(f'Orphaned: {orphan_name}', out.getvalue())
+        self.assertFalse(storage.exists(orphan_name))
+        self.assertTrue(storage.exists(kept.image.name))
+        self.assertEqual(MediaBlob.objects.get(name=kept.image.name).ref_count, 1)
+
+
+class JobQueueTests(MediaTestCase):
+    def test_upload_is_processed_by_the_worker(self) -> None:
+        self.client.post(reverse('add_tutorial'), {
+            'title': 'Queued', 'description': 'd', 'content': 'c',
+            'image': SimpleUploadedFile('photo.jpg', make_image(), content_type='image/jpeg'),
+        })
+        tutorial = Tutorial.objects.get(title='Queued')
+        self.assertEqual(tutorial.image_status, Tutorial.IMAGE_PENDING)
+        self.assertEqual(tutorial.image_renditions, {})
+        self.assertEqual(tutorial.thumbnail_url, tutorial.image.url)
+        job = Job.objects.get(task='process_tutorial_image')
+        self.assertEqual(job.payload, {'tutorial_id': tutorial.pk, 'image': tutorial.image.name})
+
+        out = io.StringIO()
+        call_command('run_jobs', burst=True, stdout=out)
+        self.assertIn('Ran 1 jobs (0 failed)', out.getvalue())
+        tutorial.refresh_from_db()
+        self.assertEqual(tutorial.image_status, Tutorial.IMAGE_READY)
+        self.assertIn('thumb', tutorial.image_renditions)
+        self.assertFalse(Job.objects.filter(task='process_tutorial_image').exists())
+
+    def test_upload_and_its_job_commit_together(self) -> None:
+        with mock.patch.object(tasks, 'process_image_later', side_effect=RuntimeError('queue down')), \
+                self.assertRaises(RuntimeError):
+            self.client.post(reverse('add_tutorial'), {
+                'title': 'Lost', 'description': 'd', 'content': 'c',
+                'image': SimpleUploadedFile('photo.jpg', make_image(), content_type='image/jpeg'),
+            })
+        self.assertFalse(Tutorial.objects.filter(title='Lost').exists())
+
+    def test_failing_job_is_retried_then_marked_failed(self) -> None:
+        tutorial = Tutorial.objects.create(
+            title='Broken', description='d', content='c', author=self.user,
+            image='tutorials/missing.jpg', image_status=Tutorial.IMAGE_PENDING,
+        )
+        job = jobs.enqueue('process_tutorial_image', attempts=2, tutorial_id=tutorial.pk, image=tutorial.image.name)
+
+        self.assertEqual(jobs.work(burst=True), (0, 1))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.PENDING, 1))
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertIn('Traceback', job.last_error)
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        self.assertEqual(jobs.work(burst=True), (0, 1))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.FAILED, 2))
+        tutorial.refresh_from_db()
+        self.assertEqual(tutorial.image_status, Tutorial.IMAGE_FAILED)
+
+    def test_claimed_job_is_not_claimed_twice(self) -> None:
+        jobs.enqueue('process_tutorial_image', tutorial_id=0, image='')
+        self.assertIsNotNone(jobs.claim('one'))
+        self.assertIsNone(jobs.claim('two'))
+        Job.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(jobs.claim('two').locked_by, 'two')
+
+
+class FakeTransport:
+    """Transport that replays canned responses and records requested URLs"""
+
+    def __init__(self, responses: dict[str, list[Any]]) -> None:
+        self.responses = responses
+        self.requested: list[str] = []
+        self.lock = threading.Lock()
+
+    def get(self, url: str, headers: dict[str, str], timeout: float) -> Response:
+        with self.lock:
+            self.requested.append(url)
+            outcome = self.responses[url].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return Response(url, outcome[0], outcome[1])
+
+    def close(self) -> None:
+        pass
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        if self.path == '/redirect':
+            self.send_response(302)
+            self.send_header('Location', '/image/redirected')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class FetcherTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+
+    def test_retries_with_backoff_then_caches(self) -> None:
+        url = 'http://images.test/a.jpg'
+        transport = FakeTransport({url: [OSError('reset'), (503, b''), (200, b'image')]})
+        delays: list[float] = []
+        fetcher = Fetcher(transport, retries=3, backoff=0.5, cache_dir=self.cache_dir, sleep=delays.append)
+        self.assertEqual(fetcher.fetch(url), b'image')
+        self.assertEqual(delays, [0.5, 1.0])
+        # Served from the disk cache by a fresh fetcher, without the transport
+        self.assertEqual(Fetcher(FakeTransport({}), cache_dir=self.cache_dir).fetch(url), b'image')
+
+    def test_client_errors_are_not_retried(self) -> None:
+        url = 'http://images.test/missing.jpg'
+        transport = FakeTransport({url: [(404, b'')]})
+        with self.assertLogs('tech.fetcher', 'WARNING') as logs:
+            self.assertIsNone(Fetcher(transport, cache_dir=self.cache_dir).fetch(url))
+        self.assertEqual(transport.requested, [url])
+        self.assertIn('HTTP 404', logs.output[0])
+
+    def test_fetch_all_reuses_connections_against_local_server(self) -> None:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), ImageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        base = f'http://127.0.0.1:{server.server_port}'
+        urls = [f'{base}/image/{i}' for i in range(12)] + [f'{base}/redirect', f'{base}/image/0']
+
+        transport = HTTPClientTransport()
+        with Fetcher(transport, workers=3, cache_dir=None) as fetcher:
+            results = fetcher.fetch_all(urls)
+        self.assertEqual(len(results), 13)
+        self.assertEqual(results[f'{base}/image/5'], b'/image/5')
+        self.assertEqual(results[f'{base}/redirect'], b'/image/redirected')
+        self.assertLessEqual(transport.connections_opened, 3)
+
+
+class ImportContentTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        User.objects.create_user(username='author', password='secret123')
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_import_is_bulk_and_idempotent(self) -> None:
+        bundle = self.write('bundle.json', json.dumps({
+            'articles': [
+                {'title': f'Article {i}', 'content': f'Body {i}\n\nabout caching', 'tags': 'perf'}
+                for i in range(30)
+            ],
+            'snippets': [{'title': 'Hello', 'code': 'print(1)', 'language': 'python', 'author': 'guest'}],
+        }))
+        with CaptureQueriesContext(connection) as queries:
+            call_command('import_content', bundle, author='author', batch_size=10, stdout=io.StringIO())
+        # Per batch: row and tag lookups plus bulk INSERTs, not a query per row
+        self.assertLess(len(queries), 60)
+        self.assertEqual(Article.objects.count(), 30)
+        article = Article.objects.get(title='Article 3')
+        self.assertEqual(article.author.username, 'author')
+        self.assertIn('<p>about caching</p>', article.content_html)
+        self.assertEqual(Snippet.objects.get().author.username, 'guest')
+        self.assertIn('highlight', Snippet.objects.get().code_html)
+        self.assertEqual(search.search(Article.objects.all(), 'caching').count(), 30)
+        self.assertEqual(stats.author_counts(article.author)['article_count'], 30)
+
+        out = io.StringIO()
+        call_command('import_content', bundle, author='author', stdout=out)
+        self.assertIn('0 created, 0 updated, 30 unchanged', out.getvalue())
+
+        self.write('bundle.json', json.dumps([{'type': 'article', 'title': 'Article 3', 'content': 'Rewritten'}]))
+        call_command('import_content', bundle, stdout=io.StringIO())
+        article.refresh_from_db()
+        self.assertEqual((article.content, tagging.tag_text(article)), ('Rewritten', 'perf'))
+        self.assertEqual(article.content_html, '<p>Rewritten</p>')
+
+    def test_markdown_and_ndjson_bundles(self) -> None:
+        self.write('md/intro.md', '---\ntype: tutorial\ntitle: "Intro: part 1"\ndescription: Basics\n---\nFirst steps\n')
+        self.write('records.ndjson', json.dumps({'type': 'snippet', 'title': 'Flex', 'code': 'a {}', 'language': 'css'}) + '\n')
+        call_command('import_content', self.directory, author='author', stdout=io.StringIO())
+        tutorial = Tutorial.objects.get(title='Intro: part 1')
+        self.assertEqual((tutorial.description, tutorial.content), ('Basics', 'First steps'))
+        self.assertTrue(Snippet.objects.filter(title='Flex', language='css').exists())
+
+    def test_invalid_records_are_rejected(self) -> None:
+        bundle = self.write('bad.json', json.dumps({'snippets': [{'title': 'X', 'code': 'x', 'language': 'cobol'}]}))
+        with self.assertRaisesMessage(CommandError, 'unknown language'):
+            call_command('import_content', bundle, author='author', stdout=io.StringIO())
+        self.assertFalse(Snippet.objects.exists())
+
+    def test_default_author_must_exist_when_needed(self) -> None:
+        named = self.write('named.json', json.dumps({'tutorials': [
+            {'title': 'Owned', 'description': 'd', 'content': 'c', 'author': 'author'},
+        ]}))
+        # Every record names its author: the missing 'admin' fallback is never looked up
+        call_command('import_content', named, stdout=io.StringIO())
+        self.assertTrue(Tutorial.objects.filter(title='Owned', author__username='author').exists())
+
+        unnamed = self.write('unnamed.json', json.dumps({'tutorials': [{'title': 'Orphan', 'description': 'd', 'content': 'c'}]}))
+        with self.assertRaisesMessage(CommandError, "Default author 'admin' does not exist"):
+            call_command('import_content', unnamed, stdout=io.StringIO())
+        self.assertFalse(User.objects.filter(username='admin').exists())
+        self.assertFalse(Tutorial.objects.filter(title='Orphan').exists())
+
+    def test_sample_content_bundle(self) -> None:
+        content_dir = os.path.join(settings.BASE_DIR, 'content')
+        call_command('import_content', content_dir, author='author', stdout=io.StringIO())
+        self.assertEqual(Tutorial.objects.count(), 8)
+        self.assertEqual(Article.objects.count(), 3)
+        self.assertEqual(Snippet.objects.count(), 3)
+
+
+class ExportContentTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.alice = User.objects.create(username='alice')
+        self.bob = User.objects.create(username='bob')
+        old = timezone.now() - timedelta(days=30)
+        Tutorial.objects.create(title='Old tutorial', description='d', content='c', author=self.alice, created_at=old)
+        article = Article.objects.create(title='Fresh article', content='Body', author=self.alice)
+        tagging.set_article_tags(article, ['x', 'y'])
+        Snippet.objects.create(title='Bob snippet', code='a {}', language='css', author=self.bob)
+
+    def export(self, *args: str, **options: Any) -> list[dict[str, Any]]:
+        path = os.path.join(self.directory, 'export.ndjson.gz')
+        call_command('export_content', path, *args, stdout=io.StringIO(), **options)
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_round_trip(self) -> None:
+        path = os.path.join(self.directory, 'backup.ndjson.gz')
+        call_command('export_content', path, chunk_size=1, stdout=io.StringIO())
+        before = sorted(Article.objects.values_list('title', 'content', 'tags__name', 'author__username', 'created_at'))
+        Tutorial.objects.all().delete()
+        Article.objects.all().delete()
+        Snippet.objects.all().delete()
+
+        call_command('import_content', path, stdout=io.StringIO())
+        after = sorted(Article.objects.values_list('title', 'content', 'tags__name', 'author__username', 'created_at'))
+        self.assertEqual(before, after)
+        self.assertEqual(Tutorial.objects.get().created_at.date(), (timezone.now() - timedelta(days=30)).date())
+        self.assertEqual(Snippet.objects.get().author, self.bob)
+
+    def test_round_trip_keeps_rows_that_share_a_title(self) -> None:
+        twin = Snippet.objects.create(title='Bob snippet', code='b {}', language='css', author=self.alice)
+        records = self.export(type=['snippet'])
+        self.assertEqual(len({r['id'] for r in records}), 2)
+        records[1]['title'] = 'Renamed snippet'
+        path = os.path.join(self.directory, 'edited.ndjson')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(r) + '\n' for r in records)
+        call_command('import_content', path, stdout=io.StringIO())
+        self.assertEqual(Snippet.objects.get(pk=twin.pk).title, 'Renamed snippet')
+        self.assertEqual(Snippet.objects.get(title='Bob snippet').code, 'a {}')
+
+        Snippet.objects.all().delete()
+        call_command('import_content', path, stdout=io.StringIO())
+        self.assertEqual(sorted(Snippet.objects.values_list('title', 'code')),
+                         [('Bob snippet', 'a {}'), ('Renamed snippet', 'b {}')])
+
+    def test_titles_repeated_without_an_id_are_reported(self) -> None:
+        path = os.path.join(self.directory, 'twins.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'snippets': [{'title': 'Twin', 'code': code, 'language': 'css'} for code in ('a {}', 'b {}')]}, f)
+        with self.assertRaisesMessage(CommandError, "share a title: snippet 'Twin'"):
+            call_command('import_content', path, author='alice', stdout=io.StringIO())
+        self.assertFalse(Snippet.objects.filter(title='Twin').exists())
+
+    def test_filters(self) -> None:
+        self.assertEqual({r['title'] for r in self.export(author='bob')}, {'Bob snippet'})
+        self.assertEqual({r['title'] for r in self.export(type=['article', 'tutorial'])}, {'Old tutorial', 'Fresh article'})
+        since = (timezone.now() - timedelta(days=1)).date().isoformat()
+        self.assertEqual({r['type'] for r in self.export(since=since)}, {'article', 'snippet'})
+        until = (timezone.now() - timedelta(days=29)).date().isoformat()
+        self.assertEqual([r['title'] for r in self.export(until=until)], ['Old tutorial'])
+
+
+class TagTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(username='author', password='secret123')
+        self.django_article = Article.objects.create(title='Django ORM', content='Querysets', author=self.user)
+        tagging.set_article_tags(self.django_article, ['django', 'python'])
+        self.go_article = Article.objects.create(title='Go channels', content='Goroutines', author=self.user)
+        tagging.set_article_tags(self.go_article, ['go'])
+
+    def test_parse_tags_normalizes_and_dedupes(self) -> None:
+        self.assertEqual(tagging.parse_tags('Python, #django  python\tWeb,,'), ['python', 'django', 'web'])
+        self.assertEqual(tagging.parse_tags(''), [])
+
+    def search_titles(self, query: str) -> list[str]:
+        return [a.title for a in search.search(Article.objects.all(), query)]
+
+    def test_admin_inline_edit_reindexes_article(self) -> None:
+        self.user.is_staff = self.user.is_superuser = True
+        self.user.save()
+        self.client.force_login(self.user)
+        stamp = Article.objects.get(pk=self.go_article.pk).updated_at
+        concurrency = Tag.objects.create(name='concurrency', slug='concurrency')
+        link = ArticleTag.objects.get(article=self.go_article)
+        Job.objects.all().delete()
+        response = self.client.post(reverse('admin:tech_article_change', args=[self.go_article.pk]), {
+            'title': 'Go channels', 'content': 'Goroutines', 'author': self.user.pk,
+            'created_at_0': '2026-01-01', 'created_at_1': '00:00:00',
+            'article_tags-TOTAL_FORMS': '2', 'article_tags-INITIAL_FORMS': '1',
+            'article_tags-0-id': link.pk, 'article_tags-0-article': self.go_article.pk,
+            'article_tags-0-tag': link.tag_id,
+            'article_tags-1-article': self.go_article.pk, 'article_tags-1-tag': concurrency.pk,
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.search_titles('concurrency'), ['Go channels'])
+        self.assertGreater(Article.objects.get(pk=self.go_article.pk).updated_at, stamp)
+        self.assertTrue(Job.objects.filter(task='refresh_related').exists())
+
+    def test_renaming_a_tag_reindexes_its_articles(self) -> None:
+        version = caching.get_versions('article')['article']
+        tag = Tag.objects.get(slug='go')
+        tag.name, tag.slug = 'golang', 'golang'
+        tag.save()
+        self.assertEqual(self.search_titles('golang'), ['Go channels'])
+        self.assertGreater(caching.get_versions('article')['article'], version)
+        self.assertIn('golang', [row['name'] for row in tagging.tag_cloud()])
+
+        tag.delete()
+        self.assertEqual(self.search_titles('golang'), [])
+
+    def test_clearing_a_tag_reindexes_its_articles(self) -> None:
+        self.assertEqual(self.search_titles('python'), ['Django ORM'])
+        Job.objects.all().delete()
+        Tag.objects.get(slug='python').articles.clear()
+        self.assertEqual(self.search_titles('python'), [])
+        job = Job.objects.get(task='refresh_related')
+        self.assertEqual(job.payload['pks'], [self.django_article.pk])
+
+    def test_tag_with_a_custom_slug_is_reused(self) -> None:
+        Tag.objects.filter(name='django').update(slug='django-web')
+        tag = Tag.objects.get(name='django')
+        article = Article.objects.create(title='Django forms', content='Forms', author=self.user)
+        tagging.set_article_tags(article, ['django', 'forms'])
+        self.assertEqual(sorted(t.pk for t in article.tags.all()), sorted([tag.pk, Tag.objects.get(name='forms').pk]))
+        tagging.set_tags_in_bulk({article.pk: ['django']})
+        self.assertEqual(list(article.tags.all()), [tag])
+
+    def test_tag_page_matches_exact_tags(self) -> None:
+        response = self.client.get(reverse('articles_by_tag', args=['go']))
+        self.assertEqual([a.title for a in response.context['articles']], ['Go channels'])
+        self.assertEqual(response.context['active_tag'].name, 'go')
+        self.assertEqual(self.client.get(reverse('articles_by_tag', args=['missing'])).status_code, 404)
+
+    def test_list_prefetches_tags(self) -> None:
+        for i in range(5):
+            article = Article.objects.create(title=f'Extra {i}', content='x', author=self.user)
+            tagging.set_article_tags(article, [f'extra{i}', 'python'])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('articles'))
+        self.assertContains(response, reverse('articles_by_tag', args=['extra4']))
+        self.assertEqual(sum('"tech_articletag"' in q['sql'] and 'COUNT' not in q['sql'] for q in queries), 1)
+
+    def test_form_edits_tags(self) -> None:
+        self.client.login(username='author', password='secret123')
+        self.client.post(reverse('edit_article', args=[self.go_article.id]), {
+            'title': 'Go channels', 'content': 'Goroutines', 'tags': 'Go concurrency',
+        })
+        self.assertEqual(sorted(t.name for t in self.go_article.tags.all()), ['concurrency', 'go'])
+        self.assertEqual(list(search.search(Article.objects.all(), 'concurrency')), [self.go_article])
+
+    def test_tag_cloud_is_cached_until_tags_change(self) -> None:
+        with self.assertNumQueries(1):
+            cloud = tagging.tag_cloud()
+        self.assertEqual([(row['name'], row['count']) for row in cloud], [('django', 1), ('go', 1), ('python', 1)])
+        with self.assertNumQueries(0):
+            tagging.tag_cloud()
+        tagging.set_article_tags(self.go_article, ['go', 'python'])
+        python = next(row for row in tagging.tag_cloud() if row['name'] == 'python')
+        self.assertEqual((python['count'], python['step']), (2, tagging.TAG_CLOUD_STEPS))
+
+    def test_migration_splits_text_tags(self) -> None:
+        migration = importlib.import_module('tech.migrations.0012_article_tags')
+        self.assertEqual(migration.split_tags('Web, web #API'), ['web', 'api'])
+
+
+@override_settings(TECH_RELATED_DELAY=0)
+class RelatedItemsTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(username='author', password='secret123')
+        self.decorators = self.tutorial('Python decorators', 'Wrapping python functions with decorators')
+        self.generators = self.tutorial('Python generators', 'Lazy python functions with yield')
+        self.grid = self.tutorial('CSS grid layout', 'Two-dimensional css layout with grid tracks')
+        self.flexbox = self.tutorial('CSS flexbox layout', 'One-dimensional css layout with flexbox')
+
+    def tutorial(self, title: str, description: str) -> Tutorial:
+        return Tutorial.objects.create(title=title, description=description, content=description, author=self.user)
+
+    def titles(self, tutorial: Tutorial) -> list[str]:
+        return [t.title for t in related.related_items(tutorial)]
+
+    def test_rebuild_ranks_similar_items(self) -> None:
+        call_command('rebuild_related', stdout=io.StringIO())
+        self.assertEqual(self.titles(self.decorators), ['Python generators'])
+        self.assertEqual(self.titles(self.grid), ['CSS flexbox layout'])
+        response = self.client.get(reverse('tutorial_detail', args=[self.grid.id]))
+        self.assertContains(response, reverse('tutorial_detail', args=[self.flexbox.id]))
+        self.assertNotContains(response, 'Python generators')
+
+    def test_saves_refresh_neighbours_in_one_job(self) -> None:
+        related.rebuild(Tutorial)
+        Job.objects.all().delete()
+        newer = self.tutorial('Python generators in depth', 'More python generators and yield')
+        newer.save()
+        self.assertEqual(Job.objects.get().payload, {'model': 'tutorial', 'pks': [newer.pk]})
+        jobs.work(burst=True)
+        self.assertEqual(self.titles(self.generators)[0], 'Python generators in depth')
+        self.assertIn('Python generators', self.titles(newer))
+
+        newer.delete()
+        jobs.work(burst=True)
+        self.assertEqual(self.titles(self.generators), ['Python decorators'])
+
+    def test_refresh_merges_only_into_unclaimed_jobs(self) -> None:
+        Job.objects.all().delete()
+        tasks.refresh_related_later(Tutorial, [self.grid.pk])
+        tasks.refresh_related_later(Tutorial, [self.flexbox.pk, self.grid.pk])
+        self.assertEqual(Job.objects.get().payload['pks'], sorted([self.grid.pk, self.flexbox.pk]))
+
+        # A worker claims the job between the lookup and the merge
+        filter_jobs = Job.objects.filter
+
+        def claim_before_merge(*args: Any, **kwargs: Any) -> Any:
+            if 'pk' in kwargs:
+                filter_jobs(pk=kwargs['pk']).update(status=Job.RUNNING, attempts=1)
+            return filter_jobs(*args, **kwargs)
+        with mock.patch.object(Job.objects, 'filter', side_effect=claim_before_merge):
+            tasks.refresh_related_later(Tutorial, [self.decorators.pk])
+        self.assertEqual(list(Job.objects.order_by('pk').values_list('status', 'payload__pks')), [
+            (Job.RUNNING, sorted([self.grid.pk, self.flexbox.pk])), (Job.PENDING, [self.decorators.pk]),
+        ])
+
+    def test_refresh_only_tokenizes_saved_items(self) -> None:
+        related.rebuild(Tutorial)
+        newer = Tutorial.objects.create(title='CSS grid areas', description='Named css grid areas',
+                                        content='Layout with grid template areas', author=self.user)
+        with mock.patch.object(related, 'terms_for', wraps=related.terms_for) as terms_for:
+            related.refresh(Tutorial, [newer.pk])
+        self.assertEqual([call.args[0].pk for call in terms_for.call_args_list], [newer.pk])
+        self.assertEqual(self.titles(self.grid)[0], 'CSS grid areas')
+        self.assertEqual(TutorialTerm.objects.filter(item=newer).count(), len(related.terms_for(newer)))
+        incremental = {t.pk: self.titles(t) for t in Tutorial.objects.all()}
+        related.rebuild(Tutorial)
+        self.assertEqual({t.pk: self.titles(t) for t in Tutorial.objects.all()}, incremental)
+
+    def test_article_tags_count_towards_similarity(self) -> None:
+        first = Article.objects.create(title='Release notes', content='What changed', author=self.user)
+        second = Article.objects.create(title='Team update', content='Hiring news', author=self.user)
+        related.rebuild(Article)
+        self.assertEqual(list(related.related_items(first)), [])
+        tagging.set_article_tags(first, ['kubernetes'])
+        tagging.set_article_tags(second, ['kubernetes'])
+        jobs.work(burst=True)
+        self.assertEqual(list(related.related_items(first)), [second])
+
+    @skipIf(related.np is None, 'NumPy is not installed')
+    def test_numpy_and_python_sums_agree(self) -> None:
+        with_numpy = related.Corpus.load(Tutorial)
+        with mock.patch.object(related, 'np', None):
+            without_numpy = related.Corpus.load(Tutorial)
+        for pk in with_numpy.ids:
+            self.assertEqual([t for t, _ in with_numpy.top(pk, 3)], [t for t, _ in without_numpy.top(pk, 3)])
+
+
+@override_settings(TECH_PAGE_CACHE_ENABLED=False)
+class FragmentCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(username='author', password='secret123')
+
+    def test_navbar_varies_on_login_state(self) -> None:
+        self.assertContains(self.client.get(reverse('home')), 'Signup')
+        self.client.login(username='author', password='secret123')
+        response = self.client.get(reverse('home'))
+        self.assertContains(response, 'Logout')
+        self.assertNotContains(response, 'Signup')
+        self.assertEqual(caching.fragment_stats()['navbar'], {'hits': 0, 'misses': 2})
+        self.client.get(reverse('home'))
+        self.assertEqual(caching.fragment_stats()['navbar'], {'hits': 1, 'misses': 2})
+
+    def test_cards_are_reused_until_the_row_changes(self) -> None:
+        snippet = Snippet.objects.create(title='Hello', code='print(1)', language='python', author=self.user)
+        self.client.get(reverse('snippets'))
+        self.assertContains(self.client.get(reverse('snippets')), 'Hello')
+        self.assertEqual(caching.fragment_stats()['snippet_card'], {'hits': 1, 'misses': 1})
+        snippet.title = 'Goodbye'
+        snippet.save()
+        self.assertContains(self.client.get(reverse('snippets')), 'Goodbye')
+        self.assertEqual(caching.fragment_stats()['snippet_card'], {'hits': 1, 'misses': 2})
+
+    def test_retagging_refreshes_article_cards(self) -> None:
+        article = Article.objects.create(title='Tagged', content='Body', author=self.user)
+        self.client.get(reverse('articles'))
+        tagging.set_article_tags(article, ['fresh'])
+        self.assertContains(self.client.get(reverse('articles')), 'fresh')
+
+    def test_key_includes_fragment_source(self) -> None:
+        first = Template("{% load tech_cache %}{% fragment 'demo' %}one{% endfragment %}")
+        second = Template("{% load tech_cache %}{% fragment 'demo' %}two{% endfragment %}")
+        self.assertEqual(first.render(Context()), 'one')
+        self.assertEqual(second.render(Context()), 'two')
+        self.assertEqual(first.render(Context()), 'one')
+
+    def test_stats_command(self) -> None:
+        self.client.get(reverse('home'))
+        out = io.StringIO()
+        call_command('fragment_cache_stats', reset=True, stdout=out)
+        self.assertRegex(out.getvalue(), r'footer\s+0 hits\s+1 misses')
+        self.assertEqual(caching.fragment_stats()['footer'], {'hits': 0, 'misses': 0})
+
+
+class WarmTemplatesTests(SimpleTestCase):
+    def test_compiles_tech_templates_and_their_parents(self) -> None:
+        loader = engines['django'].engine.template_loaders[0]
+        loader.reset()
+        timings = warm_templates()
+        self.assertIn('tech/articles.html', template_names())
+        self.assertEqual(set(timings), {*template_names(), 'base.html'})
+        self.assertIn('base.html', loader.get_template_cache)
+        out = io.StringIO()
+        call_command('warm_templates', stdout=out)
+        self.assertIn(f'Compiled {len(timings)} templates', out.getvalue())
+
+    def test_production_profile_uses_cached_loader(self) -> None:
+        self.addCleanup(sys.modules.pop, 'techblog.settings_production', None)
+        with mock.patch.dict(os.environ, {'DJANGO_SECRET_KEY': 'test', 'TECHBLOG_ALLOWED_HOSTS': 'example.com'}):
+            production = importlib.import_module('techblog.settings_production')
+        self.assertFalse(production.DEBUG)
+        self.assertEqual(production.ALLOWED_HOSTS, ['example.com'])
+        options = production.TEMPLATES[0]['OPTIONS']
+        self.assertFalse(production.TEMPLATES[0]['APP_DIRS'])
+        self.assertEqual(options['loaders'][0][0], 'django.template.loaders.cached.Loader')
+        self.assertNotIn('django.template.context_processors.debug', options['context_processors'])
+
+
+class AssetPipelineTests(SimpleTestCase):
+    def test_minify_css(self) -> None:
+        css = '/* header */\na :hover ,\nb > i {\n  content: "a  ;  b";\n  color : red ;\n}\n'
+        self.assertEqual(assets.minify_css(css), 'a :hover,b>i{content:"a  ;  b";color :red}')
+
+    def test_minify_js_keeps_strings_regexes_and_line_breaks(self) -> None:
+        js = (
+            '// comment\n'
+            'const url = "http://x";  /* inline */\n'
+            '\n'
+            '    let re = /[/*]+/g, half = a / 2 / b;\n'
+            'const html = `\n    <p>${url}</p>`\n'
+            'return\n'
+            'x\n'
+        )
+        self.assertEqual(assets.minify_js(js), (
+            'const url = "http://x";\n'
+            'let re = /[/*]+/g, half = a / 2 / b;\n'
+            'const html = `\n    <p>${url}</p>`\n'
+            'return\n'
+            'x\n'
+        ))
+
+    def test_tag_falls_back_to_source_files(self) -> None:
+        html = Template("{% load tech_assets %}{% asset_bundle 'css/site.css' %}{% asset_bundle 'js/site.js' %}").render(Context())
+        self.assertIn('<link rel="stylesheet" href="/static/css/style.css">', html)
+        self.assertIn('<link rel="stylesheet" href="/static/css/highlight.css">', html)
+        self.assertIn('<script src="/static/js/animation-test.js"></script>', html)
+
+    def test_collectstatic_builds_hashed_compressed_bundles(self) -> None:
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        storages = {**settings.STORAGES, 'staticfiles': {'BACKEND': 'tech.assets.AssetStorage'}}
+        with override_settings(STATIC_ROOT=root, STORAGES=storages):
+            call_command('collectstatic', interactive=False, verbosity=0)
+            html = Template("{% load tech_assets %}{% asset_bundle 'css/site.css' %}").render(Context())
+            version = assets.static_version()
+        match = re.search(r'href="/static/(css/site\.[0-9a-f]{12}\.css)"', html)
+        self.assertIsNotNone(match)
+        path = os.path.join(root, match.group(1))
+        with open(path, 'rb') as f:
+            bundle = f.read()
+        with open(os.path.join(settings.BASE_DIR, 'static', 'css', 'style.css'), 'rb') as f:
+            self.assertLess(len(bundle), len(f.read()))
+        with open(path + '.gz', 'rb') as f:
+            self.assertEqual(gzip.decompress(f.read()), bundle)
+        self.assertTrue(version)
+        self.assertEqual(assets.static_version(), '')
+
+
+class VendorAssetsTests(SimpleTestCase):
+    ASSETS = {
+        'vendor/icons/css/icons.css': 'https://cdn.test/icons/1.0/css/icons.min.css',
+        'vendor/lib/lib.min.js': 'https://cdn.test/lib/1.0/lib.min.js',
+    }
+    ICONS_CSS = (
+        b'/*! Icons 1.0 */@font-face{font-family:Icons;src:url(../fonts/icons.woff2) format("woff2")}'
+        b'.fa-book:before{content:"\\f02d"}.fa-unused-icon:before{content:"\\f000"}'
+    )
+
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.addCleanup(vendor.vendored.cache_clear)
+
+    def fetcher(self, js: bytes = b'lib()\n//# sourceMappingURL=lib.min.js.map', css: Optional[bytes] = None) -> Fetcher:
+        return Fetcher(FakeTransport({
+            self.ASSETS['vendor/icons/css/icons.css']: [(200, self.ICONS_CSS if css is None else css)],
+            self.ASSETS['vendor/lib/lib.min.js']: [(200, js)],
+            'https://cdn.test/icons/1.0/fonts/icons.woff2': [(200, b'font')],
+        }), cache_dir=None)
+
+    def test_purge_css(self) -> None:
+        css = (
+            '@charset "UTF-8";/*! License */.btn,.unused{color:red}.card .missing{x:1}a:not(.missing){y:1}'
+            '[href$=".pdf"]{q:1}@media (min-width:1px){.unused{z:1}}@media print{.btn{z:2}}'
+            '@keyframes spin{to{r:1}}@keyframes gone{to{r:1}}.spinner{animation:spin 1s}'
+        )
+        self.assertEqual(vendor.purge_css(css, {'btn', 'spinner'}), (
+            '@charset "UTF-8";/*! License */.btn{color:red}a:not(.missing){y:1}'
+            '[href$=".pdf"]{q:1}@media print{.btn{z:2}}@keyframes spin{to{r:1}}.spinner{animation:spin 1s}'
+        ))
+
+    def test_vendors_trimmed_copies_and_pins_them(self) -> None:
+        lock = os.path.join(self.root, 'vendor.lock.json')
+        with mock.patch.object(vendor, 'VENDOR_ASSETS', self.ASSETS), mock.patch.object(vendor, 'font_subset', None), \
+                override_settings(TECH_VENDOR_ROOT=self.root, TECH_VENDOR_LOCK=lock):
+            report = vendor.vendor_assets(self.fetcher())
+            self.assertEqual([row[0] for row in report], [*self.ASSETS, 'vendor/icons/fonts/icons.woff2'])
+            with open(os.path.join(self.root, 'vendor/icons/css/icons.css')) as f:
+                css = f.read()
+            self.assertIn('.fa-book:before', css)
+            self.assertNotIn('fa-unused-icon', css)
+            self.assertEqual(vendor.icon_codepoints(css), {0xf02d})
+            with open(os.path.join(self.root, 'vendor/lib/lib.min.js')) as f:
+                self.assertEqual(f.read(), 'lib()')
+            with open(lock) as f:
+                self.assertEqual(len(json.load(f)), 3)
+
+            # A changed upstream file is refused until it is accepted explicitly
+            with self.assertRaisesRegex(ValueError, 'does not match vendor.lock.json'):
+                vendor.vendor_assets(self.fetcher(js=b'changed()'))
+            vendor.vendor_assets(self.fetcher(js=b'changed()'), update=True)
+
+    def test_keeps_classes_the_vendored_js_adds(self) -> None:
+        # A clean checkout: nothing vendored yet, and a stale copy must not count either
+        lock = os.path.join(self.root, 'vendor.lock.json')
+        css = b'.btn{color:red}.lib-backdrop{opacity:.5}.lib-open{overflow:hidden}.lib-stale{x:1}'
+        js = b'document.body.classList.add("lib-open");e.className="lib-backdrop"'
+        with mock.patch.object(vendor, 'VENDOR_ASSETS', self.ASSETS), mock.patch.object(vendor, 'font_subset', None), \
+                override_settings(TECH_VENDOR_ROOT=self.root, TECH_VENDOR_LOCK=lock, STATICFILES_DIRS=[self.root],
+                                  TECH_VENDOR_SAFELIST=['btn']):
+            self.assertFalse(os.path.exists(os.path.join(self.root, 'vendor')))
+            vendor.vendor_assets(self.fetcher(js=b'lib("lib-stale")', css=css))
+            vendor.vendor_assets(self.fetcher(js=js, css=css), update=True)
+            with open(os.path.join(self.root, 'vendor/icons/css/icons.css')) as f:
+                self.assertEqual(f.read(), '.btn{color:red}.lib-backdrop{opacity:.5}.lib-open{overflow:hidden}')
+
+    @skipIf(vendor.font_subset is None, 'fontTools is not installed')
+    def test_subset_font_keeps_used_glyphs(self) -> None:
+        from fontTools.fontBuilder import FontBuilder
+        from fontTools.pens.ttGlyphPen import TTGlyphPen
+        from fontTools.ttLib import TTFont
+
+        def glyph() -> Any:
+            pen = TTGlyphPen(None)
+            pen.moveTo((0, 0))
+            pen.lineTo((0, 500))
+            pen.lineTo((500, 0))
+            pen.closePath()
+            return pen.glyph()
+
+        names = ['.notdef', 'book', 'unused']
+        builder = FontBuilder(1000, isTTF=True)
+        builder.setupGlyphOrder(names)
+        builder.setupCharacterMap({0xf02d: 'book', 0xf000: 'unused'})
+        builder.setupGlyf({name: glyph() for name in names})
+        builder.setupHorizontalMetrics({name: (500, 0) for name in names})
+        builder.setupHorizontalHeader(ascent=800, descent=-200)
+        builder.setupNameTable({'familyName': 'Icons', 'styleName': 'Regular'})
+        builder.setupOS2()
+        builder.setupPost()
+        font = io.BytesIO()
+        builder.save(font)
+        subset = vendor.subset_font(font.getvalue(), {0xf02d}, None)
+        self.assertEqual(set(TTFont(io.BytesIO(subset)).getBestCmap()), {0xf02d})
+        self.assertLess(len(subset), len(font.getvalue()))
+
+    def test_tag_uses_local_copy_once_vendored(self) -> None:
+        template = Template("{% load tech_assets %}{% vendor_asset 'vendor/clipboard/clipboard.min.js' %}")
+        self.assertIn('src="https://cdnjs.cloudflare.com/', template.render(Context()))
+        os.makedirs(os.path.join(self.root, 'vendor', 'clipboard'))
+        with open(os.path.join(self.root, 'vendor', 'clipboard', 'clipboard.min.js'), 'w') as f:
+            f.write('clipboard()')
+        with override_settings(STATICFILES_DIRS=[self.root]):
+            vendor.vendored.cache_clear()
+            self.assertIn('src="/static/vendor/clipboard/clipboard.min.js"', template.render(Context()))
+
+
+class FileServerTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.body = b'body { color: red; }\n' * 100
+        os.makedirs(os.path.join(self.root, 'css'))
+        for name, content in (('css/site.0123456789ab.css', self.body),
+                              ('css/site.0123456789ab.css.gz', gzip.compress(self.body)),
+                              ('css/plain.css', self.body)):
+            with open(os.path.join(self.root, name), 'wb') as f:
+                f.write(content)
+        self.server = serving.FileServer(self.django_app, mounts=[('/static/', self.root)])
+
+    @staticmethod
+    def django_app(environ: dict[str, Any], start_response: Any) -> list[bytes]:
+        start_response('404 Not Found', [('Content-Type', 'text/plain')])
+        return [b'django']
+
+    def request(self, path: str, method: str = 'GET', **headers: str) -> tuple[str, dict[str, str], bytes]:
+        environ: dict[str, Any] = {'PATH_INFO': path, 'REQUEST_METHOD': method, 'wsgi.file_wrapper': FileWrapper}
+        setup_testing_defaults(environ)
+        environ.update({f'HTTP_{name.upper()}': value for name, value in headers.items()})
+        started: list[Any] = []
+        body = self.server(environ, lambda status, response_headers: started.extend([status, response_headers]))
+        content = b''.join(body)
+        getattr(body, 'close', lambda: None)()
+        return started[0], dict(started[1]), content
+
+    def test_serves_precompressed_variant_with_immutable_headers(self) -> None:
+        status, headers, content = self.request('/static/css/site.0123456789ab.css', accept_encoding='br, gzip')
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(headers['Cache-Control'], 'public, max-age=31536000, immutable')
+        self.assertEqual(headers['Content-Type'], 'text/css; charset=utf-8')
+        self.assertEqual(gzip.decompress(content), self.body)
+        self.assertEqual(int(headers['Content-Length']), len(content))
+
+        status, headers, content = self.request('/static/css/site.0123456789ab.css', accept_encoding='gzip;q=0')
+        self.assertNotIn('Content-Encoding', headers)
+        self.assertEqual(content, self.body)
+
+    def test_unhashed_files_get_short_cache_lifetime(self) -> None:
+        _, headers, _ = self.request('/static/css/plain.css')
+        self.assertEqual(headers['Cache-Control'], f'public, max-age={serving.file_max_age()}')
+        self.assertNotIn('Vary', headers)
+
+    def test_ranges(self) -> None:
+        path = '/static/css/site.0123456789ab.css'
+        status, headers, content = self.request(path, range='bytes=5-9', accept_encoding='gzip')
+        self.assertEqual(status, '206 Partial Content')
+        self.assertEqual(content, self.body[5:10])
+        self.assertEqual(headers['Content-Range'], f'bytes 5-9/{len(self.body)}')
+        self.assertNotIn('Content-Encoding', headers)
+        self.assertEqual(self.request(path, range='bytes=-4')[2], self.body[-4:])
+        self.assertEqual(self.request(path, range='bytes=2000-')[2], self.body[2000:])
+        status, headers, _ = self.request(path, range=f'bytes={len(self.body)}-')
+        self.assertEqual(status, '416 Range Not Satisfiable')
+        self.assertEqual(headers['Content-Range'], f'bytes */{len(self.body)}')
+        # A stale If-Range gets the whole, current file
+        status, _, content = self.request(path, range='bytes=5-9', if_range='"stale"')
+        self.assertEqual((status, content), ('200 OK', self.body))
+
+    def test_conditional_requests_and_methods(self) -> None:
+        path = '/static/css/plain.css'
+        _, headers, _ = self.request(path)
+        self.assertEqual(self.request(path, if_none_match=headers['ETag'])[0], '304 Not Modified')
+        self.assertEqual(self.request(path, if_modified_since=headers['Last-Modified'])[0], '304 Not Modified')
+        status, headers, content = self.request(path, method='HEAD')
+        self.assertEqual((status, content, headers['Content-Length']), ('200 OK', b'', str(len(self.body))))
+        self.assertEqual(self.request(path, method='POST')[0], '405 Method Not Allowed')
+
+    def test_unknown_and_escaping_paths_fall_through(self) -> None:
+        for path in ('/static/css/missing.css', '/static/../etc/passwd', '/static/css', '/tutorials/'):
+            self.assertEqual(self.request(path)[2], b'django')
+
+
+class SqlitePragmaTests(SimpleTestCase):
+    # Outside a test transaction: some pragmas cannot change inside one
+    databases = {'default'}
+
+    @override_settings(TECH_SQLITE_PRAGMAS={'cache_size': -4000, 'temp_store': 'memory'})
+    def test_pragmas_applied_to_new_connections(self) -> None:
+        database.apply_sqlite_pragmas(sender=type(connection), connection=connection)
+        self.assertEqual(database.current_pragmas(connection, ['cache_size', 'temp_store']),
+                         {'cache_size': -4000, 'temp_store': 2})
+
+    @override_settings(TECH_SQLITE_PRAGMAS={'cache_size; DROP TABLE tech_tutorial': 1})
+    def test_rejects_anything_but_plain_names_and_values(self) -> None:
+        with self.assertRaises(ImproperlyConfigured):
+            database.apply_sqlite_pragmas(sender=type(connection), connection=connection)
+
+    def test_production_profile_tunes_sqlite(self) -> None:
+        self.addCleanup(sys.modules.pop, 'techblog.settings_production', None)
+        with mock.patch.dict(os.environ, {'DJANGO_SECRET_KEY': 'test'}):
+            production = importlib.import_module('techblog.settings_production')
+        default = production.DATABASES['default']
+        self.assertGreater(default['CONN_MAX_AGE'], 0)
+        self.assertEqual(default['OPTIONS']['transaction_mode'], 'IMMEDIATE')
+        self.assertEqual(production.TECH_SQLITE_PRAGMAS['journal_mode'], 'wal')
+
+
+class ReplicaRoutingTests(TransactionTestCase):
+    """Two SQLite databases: the test database as primary and a file snapshot of it as the replica"""
+
+    def setUp(self) -> None:
+        cache.clear()
+        routing._unavailable.clear()
+        self.addCleanup(routing._unavailable.clear)
+        self.author = User.objects.create_user(username='replica-author', password='pw')
+        Tutorial.objects.create(title='Replicated tutorial', description='d', content='c', author=self.author)
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        self.replica_path = os.path.join(directory, 'replica.sqlite3')
+        connection.ensure_connection()
+        target = sqlite3.connect(self.replica_path)
+        connection.connection.backup(target)
+        target.close()
+        # Written after the snapshot, so only the primary has it
+        Tutorial.objects.create(title='Unreplicated tutorial', description='d', content='c', author=self.author)
+
+        # A connection registered at runtime, which the test framework allows without a test database
+        primary = connections['default']
+        replica = type(primary)({**primary.settings_dict, 'NAME': self.replica_path}, alias='replica')
+        connections['replica'] = replica
+        self.addCleanup(connections.__delitem__, 'replica')
+        self.addCleanup(replica.close)
+        replicas = override_settings(TECH_DATABASE_REPLICAS=['replica'])
+        replicas.enable()
+        self.addCleanup(replicas.disable)
+
+    def test_public_views_read_from_replica(self) -> None:
+        response = self.client.get(reverse('tutorials'))
+        self.assertContains(response, 'Replicated tutorial')
+        self.assertNotContains(response, 'Unreplicated tutorial')
+        # Views that are not marked keep reading from the primary
+        self.client.force_login(self.author)
+        self.assertContains(self.client.get(reverse('dashboard')), 'Unreplicated tutorial')
+
+    def test_writes_pin_browser_to_primary(self) -> None:
+        self.client.force_login(self.author)
+        response = self.client.post(reverse('add_tutorial'), {
+            'title': 'Brand new tutorial', 'description': 'd', 'content': 'c',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(routing.pin_cookie_name(), response.cookies)
+        self.assertTrue(Tutorial.objects.filter(title='Brand new tutorial').exists())
+        self.assertContains(self.client.get(reverse('tutorials')), 'Brand new tutorial')
+
+        self.client.cookies.pop(routing.pin_cookie_name())
+        self.assertNotContains(self.client.get(reverse('tutorials')), 'Brand new tutorial')
+
+    def test_falls_back_to_primary_when_replica_is_missing(self) -> None:
+        os.remove(self.replica_path)
+        self.assertContains(self.client.get(reverse('tutorials')), 'Unreplicated tutorial')
+        self.assertFalse(os.path.exists(self.replica_path))
+        self.assertIn('replica', routing._unavailable)
+
+    def test_pages_from_replica_are_cached_briefly(self) -> None:
+        with mock.patch.object(cache, 'set', wraps=cache.set) as cache_set:
+            self.client.get(reverse('snippets'))
+        self.assertEqual(cache_set.call_args_list[-1].args[2], routing.replica_page_cache_timeout())
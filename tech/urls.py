@@ -7,6 +7,7 @@ urlpatterns = [
     path('tutorials/<int:tutorial_id>/', views.tutorial_detail, name='tutorial_detail'),
     path('articles/', views.articles, name='articles'),
     path('articles/<int:article_id>/', views.article_detail, name='article_detail'),
+    path('articles/tag/<slug:slug>/', views.articles_by_tag, name='articles_by_tag'),
     path('snippets/', views.snippets, name='snippets'),
     path('login/', views.login_view, name='login'),
     path('signup/', views.signup_view, name='signup'),
@@ -0,0 +1,340 @@
+"""
+Self-hosted, trimmed copies of the third-party CSS and JavaScript.
+
+``python manage.py vendor_assets`` downloads the pinned releases in
+``VENDOR_ASSETS`` (and the fonts their stylesheets reference) into
+``static/vendor/``. Stylesheets are purged of every rule whose selector
+needs a class that appears nowhere in the templates, the site's JavaScript
+and Python, the vendored JavaScript itself (Bootstrap adds ``show``,
+``modal-backdrop`` and friends at runtime) or ``TECH_VENDOR_SAFELIST``; the
+icon fonts are then cut down
+to the glyphs the remaining ``content`` declarations use (with fontTools,
+when installed). The SHA-256 of every download is recorded in
+``vendor.lock.json`` so a changed upstream file stops the command instead
+of silently shipping.
+
+Templates include the copies with ``{% vendor_asset %}`` from
+``tech_assets``, which falls back to the CDN URL until the command has run.
+"""
+import hashlib
+import io
+import json
+import os
+import posixpath
+import re
+from functools import lru_cache
+from typing import Any, Iterator, Optional
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.template.utils import get_app_template_dirs
+
+try:
+    from fontTools import subset as font_subset
+except ImportError:  # pragma: no cover - optional dependency
+    font_subset = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Static path of each vendored file -> the pinned release it is copied from
+VENDOR_ASSETS: dict[str, str] = {
+    'vendor/bootstrap/css/bootstrap.min.css':
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/css/bootstrap.min.css',
+    'vendor/bootstrap/js/bootstrap.bundle.min.js':
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js',
+    'vendor/fontawesome/css/all.min.css':
+        'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css',
+    'vendor/clipboard/clipboard.min.js':
+        'https://cdnjs.cloudflare.com/ajax/libs/clipboard.js/2.0.8/clipboard.min.js',
+}
+
+# Classes only ever built at runtime, e.g. alert-{{ message.tags }} in base.html
+DEFAULT_SAFELIST = ('alert-debug', 'alert-info', 'alert-success', 'alert-warning', 'alert-error')
+
+# Files scanned for class names, by where they live
+CONTENT_EXTENSIONS = {
+    'templates': ('.html', '.txt'),
+    'static': ('.js',),
+    'app': ('.py',),
+}
+
+FONT_FLAVORS = {'.woff2': 'woff2', '.woff': 'woff', '.ttf': None, '.otf': None}
+
+# At-rules whose blocks hold ordinary rules that can be purged in turn
+NESTED_AT_RULES = ('@media', '@supports', '@container', '@layer', '@document')
+
+TOKEN_RE = re.compile(r'[\w-]+')
+CLASS_RE = re.compile(r'\.((?:\\.|[\w-])+)')
+NOT_RE = re.compile(r':not\([^()]*\)')
+ATTRIBUTE_RE = re.compile(r'\[[^\]]*\]')
+KEYFRAMES_RE = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)')
+CONTENT_RE = re.compile(r'content\s*:\s*"((?:\\.|[^"\\])*)"')
+CSS_ESCAPE_RE = re.compile(r'\\([0-9a-fA-F]{1,6})\s?|\\(.)')
+URL_RE = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+SOURCE_MAP_RE = re.compile(r'\n?(?://# sourceMappingURL=[^\n]*|/\*# sourceMappingURL=.*?\*/)')
+
+
+def vendor_root() -> str:
+    """Directory the vendored files are written to: the project's static/ folder"""
+    return str(getattr(settings, 'TECH_VENDOR_ROOT', settings.STATICFILES_DIRS[0]))
+
+
+def lock_path() -> str:
+    return str(getattr(settings, 'TECH_VENDOR_LOCK', os.path.join(settings.BASE_DIR, 'vendor.lock.json')))
+
+
+def safelist() -> set[str]:
+    return {*DEFAULT_SAFELIST, *getattr(settings, 'TECH_VENDOR_SAFELIST', ())}
+
+
+def content_files() -> list[str]:
+    """Templates, site JavaScript and app code (not its tests) that may name a CSS class
+
+    Earlier vendored copies are left out: the purge reads the freshly
+    downloaded JavaScript instead, so it does not depend on what is on disk.
+    """
+    engine = settings.TEMPLATES[0]
+    directories = {
+        'templates': [*engine.get('DIRS', ()), *get_app_template_dirs('templates')],
+        'static': [str(path) for path in settings.STATICFILES_DIRS],
+        'app': [os.path.dirname(os.path.abspath(__file__))],
+    }
+    vendored_dir = os.path.join(os.path.abspath(vendor_root()), 'vendor')
+    paths = []
+    for kind, roots in directories.items():
+        for root in roots:
+            for path, _, filenames in os.walk(root):
+                if (os.path.abspath(path) + os.sep).startswith(vendored_dir + os.sep):
+                    continue
+                paths.extend(
+                    os.path.join(path, filename) for filename in sorted(filenames)
+                    if filename.endswith(CONTENT_EXTENSIONS[kind]) and not filename.startswith('tests')
+                )
+    return paths
+
+
+def content_tokens(paths: Optional[list[str]] = None) -> set[str]:
+    """Every word in the content files; a class is used if it is one of them"""
+    tokens: set[str] = set()
+    for path in content_files() if paths is None else paths:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            tokens.update(TOKEN_RE.findall(f.read()))
+    return tokens
+
+
+def css_rules(css: str) -> Iterator[tuple[str, Optional[str]]]:
+    """Top-level (prelude, block) pairs of a stylesheet
+
+    The block is None for statements such as ``@charset`` and for ``/*!``
+    license comments, which are yielded as their own prelude.
+    """
+    start = prelude_end = depth = 0
+    i, length = 0, len(css)
+    while i < length:
+        char = css[i]
+        if css.startswith('/*', i):
+            end = css.find('*/', i + 2)
+            end = length if end == -1 else end + 2
+            if depth == 0 and not css[start:i].strip():
+                if css.startswith('/*!', i):
+                    yield css[i:end], None
+                start = end
+            i = end
+            continue
+        if char in '"\'':
+            i += 1
+            while i < length and css[i] != char:
+                i += 2 if css[i] == '\\' else 1
+        elif char == '{':
+            if depth == 0:
+                prelude_end = i
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                yield css[start:prelude_end].strip(), css[prelude_end + 1:i]
+                start = i + 1
+        elif char == ';' and depth == 0:
+            yield css[start:i].strip(), None
+            start = i + 1
+        i += 1
+
+
+def split_selectors(prelude: str) -> list[str]:
+    """Split a selector list on its top-level commas"""
+    selectors, depth, start = [], 0, 0
+    for i, char in enumerate(prelude):
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def selector_used(selector: str, used: set[str]) -> bool:
+    """Whether every class the selector requires appears in ``used``"""
+    selector = ATTRIBUTE_RE.sub('', NOT_RE.sub('', selector))
+    # Escaped class names (".\31 0") are kept rather than unescaped
+    return all(name in used or '\\' in name for name in CLASS_RE.findall(selector))
+
+
+def _purge_rules(css: str, used: set[str]) -> list[tuple[str, str]]:
+    kept = []
+    for prelude, block in css_rules(css):
+        if block is None:
+            kept.append((prelude, prelude if prelude.startswith('/*') else prelude + ';'))
+        elif prelude.startswith('@'):
+            if prelude.lower().startswith(NESTED_AT_RULES):
+                inner = ''.join(text for _, text in _purge_rules(block, used))
+                if inner:
+                    kept.append((prelude, f'{prelude}{{{inner}}}'))
+            else:
+                kept.append((prelude, f'{prelude}{{{block}}}'))
+        else:
+            selectors = [s for s in split_selectors(prelude) if selector_used(s, used)]
+            if selectors:
+                kept.append((prelude, f'{",".join(selectors)}{{{block}}}'))
+    return kept
+
+
+def purge_css(css: str, used: set[str]) -> str:
+    """Drop the rules no used class can match, then the keyframes nothing animates"""
+    kept = _purge_rules(css, used)
+    rest = ''.join(text for prelude, text in kept if not KEYFRAMES_RE.match(prelude))
+    return ''.join(
+        text for prelude, text in kept
+        if not (match := KEYFRAMES_RE.match(prelude)) or match.group(1) in rest
+    )
+
+
+def icon_codepoints(css: str) -> set[int]:
+    """Characters inserted by ``content`` declarations, i.e. the icon glyphs in use"""
+    codepoints: set[int] = set()
+    for value in CONTENT_RE.findall(css):
+        text = CSS_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 16)) if m.group(1) else m.group(2), value)
+        codepoints.update(ord(char) for char in text)
+    return codepoints
+
+
+def css_urls(css: str) -> list[str]:
+    """Relative url() references of a stylesheet, without query or fragment"""
+    urls = []
+    for _, url in URL_RE.findall(css):
+        if not url.startswith(('data:', 'http:', 'https:', '//', '#')):
+            urls.append(re.split(r'[?#]', url)[0])
+    return list(dict.fromkeys(urls))
+
+
+def subset_font(data: bytes, codepoints: set[int], flavor: Optional[str]) -> bytes:
+    """Keep only the glyphs for ``codepoints``; the input comes back unchanged without fontTools"""
+    if font_subset is None or (flavor == 'woff2' and brotli is None):
+        return data
+    options = font_subset.Options()
+    options.flavor = flavor
+    options.layout_features = ['*']
+    font = font_subset.load_font(io.BytesIO(data), options)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    out = io.BytesIO()
+    font_subset.save_font(font, out, options)
+    return out.getvalue()
+
+
+def read_lock() -> dict[str, str]:
+    if not os.path.exists(lock_path()):
+        return {}
+    with open(lock_path(), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_lock(lock: dict[str, str]) -> None:
+    with open(lock_path(), 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(lock.items())), f, indent=2)
+        f.write('\n')
+
+
+def vendor_assets(fetcher: Any, update: bool = False) -> list[tuple[str, int, int]]:
+    """Download, verify, purge and subset every vendored file into ``vendor_root()``
+
+    Returns (static path, downloaded size, written size) for each file.
+    Raises ValueError when a download fails or no longer matches the lock
+    file, unless ``update`` accepts the new contents.
+    """
+    lock = read_lock()
+
+    def download(url: str) -> bytes:
+        content = fetcher.fetch(url)
+        if content is None:
+            raise ValueError(f'Could not download {url}')
+        digest = hashlib.sha256(content).hexdigest()
+        if lock.get(url, digest) != digest and not update:
+            raise ValueError(f'{url} does not match vendor.lock.json; re-run with --update to accept it')
+        lock[url] = digest
+        return content
+
+    sources: dict[str, tuple[int, str]] = {}
+    for path, url in VENDOR_ASSETS.items():
+        content = download(url)
+        sources[path] = (len(content), SOURCE_MAP_RE.sub('', content.decode('utf-8')))
+    # Classes the libraries toggle themselves (.show, .collapsing, .modal-open) are named in their JS
+    used = content_tokens() | safelist()
+    for path, (_, text) in sources.items():
+        if path.endswith('.js'):
+            used.update(TOKEN_RE.findall(text))
+    files: dict[str, tuple[int, bytes]] = {}
+    codepoints: set[int] = set()
+    fonts: dict[str, str] = {}
+    for path, (size, text) in sources.items():
+        url = VENDOR_ASSETS[path]
+        if path.endswith('.css'):
+            text = purge_css(text, used)
+            codepoints |= icon_codepoints(text)
+            for relative in css_urls(text):
+                fonts[posixpath.normpath(posixpath.join(posixpath.dirname(path), relative))] = urljoin(url, relative)
+        files[path] = (size, text.encode('utf-8'))
+    downloads = {path: download(url) for path, url in fonts.items()}
+    for path, content in downloads.items():
+        stem, extension = posixpath.splitext(path)
+        data = content
+        if extension in FONT_FLAVORS:
+            # A face fontTools cannot read in one format is cut from another, e.g. .ttf for .woff2
+            siblings = [other for other in downloads if other != path and posixpath.splitext(other)[0] == stem]
+            for source in [path, *siblings]:
+                try:
+                    data = subset_font(downloads[source], codepoints, FONT_FLAVORS[extension])
+                    break
+                except Exception:  # fontTools and brotli raise their own error types
+                    continue
+        files[path] = (len(content), data)
+
+    report = []
+    for path, (original, data) in files.items():
+        target = os.path.join(vendor_root(), path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(data)
+        report.append((path, original, len(data)))
+    write_lock(lock)
+    vendored.cache_clear()
+    return report
+
+
+@lru_cache(maxsize=None)
+def vendored(path: str) -> bool:
+    """Whether ``path`` has been vendored into the static files"""
+    return path in getattr(staticfiles_storage, 'hashed_files', {}) or finders.find(path) is not None
+
+
+def vendor_url(path: str) -> str:
+    """The local copy of a vendored file, or its CDN release until it is vendored"""
+    return staticfiles_storage.url(path) if vendored(path) else VENDOR_ASSETS[path]
@@ -4,9 +4,14 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib import messages
 from django.http import HttpRequest, HttpResponse
+from django.db import transaction
 from django.db.models import QuerySet
-from .models import Tutorial, Article, Snippet
-from django.db.models import Q
+from django.db.models.functions import Substr
+from .models import Tutorial, Article, Snippet, Tag
+from . import related, search, stats, tagging, tasks
+from .caching import cache_public_page, conditional_on_updated_at
+from .pagination import paginate
+from .routing import read_from_replica
 import os
 from typing import Optional
 
@@ -25,38 +30,52 @@ class TutorialForm(forms.ModelForm):
         }
 
 class ArticleForm(forms.ModelForm):
+    # Typed as free text and stored as Tag rows
+    tags = forms.CharField(required=False, widget=forms.TextInput(attrs={'class': 'form-control'}))
+
     class Meta:
         model = Article
-        fields = ['title', 'content', 'tags']
+        fields = ['title', 'content']
         widgets = {
             'title': forms.TextInput(attrs={'class': 'form-control'}),
             'content': forms.Textarea(attrs={'class': 'form-control', 'rows': 10}),
-            'tags': forms.TextInput(attrs={'class': 'form-control'}),
         }
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if self.instance.pk is not None:
+            self.initial.setdefault('tags', tagging.tag_text(self.instance))
+
+    def clean_tags(self) -> list[str]:
+        return tagging.parse_tags(self.cleaned_data['tags'])
+
+    def _save_m2m(self) -> None:
+        super()._save_m2m()
+        tagging.set_article_tags(self.instance, self.cleaned_data['tags'])
+
+# Number of characters of article content loaded for list page excerpts
+EXCERPT_LENGTH = 400
+
 # Create your views here.
 
 def home(request: HttpRequest) -> HttpResponse:
     """Landing page view with hero section and navigation"""
     return render(request, 'tech/home.html')
 
+@read_from_replica
+@cache_public_page('tutorial')
 def tutorials(request: HttpRequest) -> HttpResponse:
     """Display coding tutorials with filtering options"""
-    tutorials_list = Tutorial.objects.all().order_by('-created_at')
+    # Cards only show the description, so skip loading the full body
+    tutorials_list = Tutorial.objects.select_related('author').defer('content', 'content_html').order_by('-created_at')
     
     # Filter by search query if provided
     query: str = request.GET.get('q', '')
     if query:
-        tutorials_list = tutorials_list.filter(
-            Q(title__icontains=query) | 
-            Q(description__icontains=query)
-        )
+        tutorials_list = search.search(tutorials_list, query)
     
-    # Pagination
-    from django.core.paginator import Paginator
-    paginator = Paginator(tutorials_list, 6)  # Show 6 tutorials per page
-    page_number = request.GET.get('page')
-    tutorials = paginator.get_page(page_number)
+    # Pagination (ranked search results always use numbered pages)
+    tutorials = paginate(request, tutorials_list, 6, keyset=not query)  # Show 6 tutorials per page
     
     context = {
         'tutorials': tutorials,
@@ -64,60 +83,97 @@ def tutorials(request: HttpRequest) -> HttpResponse:
     }
     return render(request, 'tech/tutorials.html', context)
 
+@read_from_replica
+@conditional_on_updated_at(Tutorial, 'tutorial_id', 'related_updated_at')
+@cache_public_page('tutorial')
 def tutorial_detail(request: HttpRequest, tutorial_id: int) -> HttpResponse:
     """Display a single tutorial"""
     try:
-        tutorial: Tutorial = get_object_or_404(Tutorial, id=tutorial_id)
+        tutorial: Tutorial = get_object_or_404(Tutorial.objects.select_related('author').defer('content'), id=tutorial_id)
         
         context = {
             'tutorial': tutorial,
+            'related_tutorials': related.related_items(tutorial),
         }
         return render(request, 'tech/tutorial_detail.html', context)
     except Exception as e:
         print(f"Error in tutorial_detail view: {e}")
         raise
 
+@read_from_replica
+@cache_public_page('article')
 def articles(request: HttpRequest) -> HttpResponse:
     """Display blog articles with search functionality"""
-    articles_list = Article.objects.all().order_by('-created_at')
+    # Load a bounded excerpt instead of the full body for the preview text
+    articles_list = (
+        Article.objects.select_related('author')
+        .prefetch_related('tags')
+        .defer('content', 'content_html')
+        .annotate(excerpt=Substr('content', 1, EXCERPT_LENGTH))
+        .order_by('-created_at')
+    )
     
     # Filter by search query if provided
     query: str = request.GET.get('q', '')
     if query:
-        articles_list = articles_list.filter(
-            Q(title__icontains=query) | 
-            Q(content__icontains=query) |
-            Q(tags__icontains=query)
-        )
+        articles_list = search.search(articles_list, query)
     
-    # Pagination
-    from django.core.paginator import Paginator
-    paginator = Paginator(articles_list, 5)  # Show 5 articles per page
-    page_number = request.GET.get('page')
-    articles = paginator.get_page(page_number)
+    # Pagination (ranked search results always use numbered pages)
+    articles = paginate(request, articles_list, 5, keyset=not query)  # Show 5 articles per page
     
     context = {
         'articles': articles,
         'query': query,
+        'tag_cloud': tagging.tag_cloud(),
     }
     return render(request, 'tech/articles.html', context)
 
+@read_from_replica
+@cache_public_page('article')
+def articles_by_tag(request: HttpRequest, slug: str) -> HttpResponse:
+    """Display the articles with a tag"""
+    tag = get_object_or_404(Tag, slug=slug)
+    articles_list = (
+        Article.objects.filter(tags=tag)
+        .select_related('author')
+        .prefetch_related('tags')
+        .defer('content', 'content_html')
+        .annotate(excerpt=Substr('content', 1, EXCERPT_LENGTH))
+        .order_by('-created_at')
+    )
+    articles = paginate(request, articles_list, 5)
+    
+    context = {
+        'articles': articles,
+        'active_tag': tag,
+        'tag_cloud': tagging.tag_cloud(),
+    }
+    return render(request, 'tech/articles.html', context)
+
+@read_from_replica
+@conditional_on_updated_at(Article, 'article_id', 'related_updated_at')
+@cache_public_page('article')
 def article_detail(request: HttpRequest, article_id: int) -> HttpResponse:
     """Display a single article"""
     try:
-        article: Article = get_object_or_404(Article, id=article_id)
+        article: Article = get_object_or_404(
+            Article.objects.select_related('author').prefetch_related('tags').defer('content'), id=article_id
+        )
         
         context = {
             'article': article,
+            'related_articles': related.related_items(article),
         }
         return render(request, 'tech/article_detail.html', context)
     except Exception as e:
         print(f"Error in article_detail view: {e}")
         raise
 
+@read_from_replica
+@cache_public_page('snippet')
 def snippets(request: HttpRequest) -> HttpResponse:
     """Display code snippets with language filtering"""
-    snippets_list = Snippet.objects.all().order_by('-created_at')
+    snippets_list = Snippet.objects.select_related('author').order_by('-created_at')
     
     # Filter by language if provided
     language: str = request.GET.get('language', '')
@@ -125,10 +181,7 @@ def snippets(request: HttpRequest) -> HttpResponse:
         snippets_list = snippets_list.filter(language=language)
     
     # Pagination
-    from django.core.paginator import Paginator
-    paginator = Paginator(snippets_list, 10)  # Show 10 snippets per page
-    page_number = request.GET.get('page')
-    snippets = paginator.get_page(page_number)
+    snippets = paginate(request, snippets_list, 10)  # Show 10 snippets per page
     
     context = {
         'snippets': snippets,
@@ -186,32 +239,8 @@ def logout_view(request: HttpRequest) -> HttpResponse:
 @login_required
 def dashboard(request: HttpRequest) -> HttpResponse:
     """User dashboard with profile and activity"""
-    # Get user's content
-    user_tutorials = Tutorial.objects.filter(author=request.user).order_by('-created_at')
-    user_articles = Article.objects.filter(author=request.user).order_by('-created_at')
-    user_snippets = Snippet.objects.filter(author=request.user).order_by('-created_at')
-    
-    # Get counts for statistics
-    tutorial_count = user_tutorials.count()
-    article_count = user_articles.count()
-    snippet_count = user_snippets.count()
-    
-    # Get recent items (last 5)
-    recent_tutorials = user_tutorials[:5]
-    recent_articles = user_articles[:5]
-    recent_snippets = user_snippets[:5]
-    
-    context = {
-        'user_tutorials': user_tutorials,
-        'user_articles': user_articles,
-        'user_snippets': user_snippets,
-        'tutorial_count': tutorial_count,
-        'article_count': article_count,
-        'snippet_count': snippet_count,
-        'recent_tutorials': recent_tutorials,
-        'recent_articles': recent_articles,
-        'recent_snippets': recent_snippets,
-    }
+    # Counts come from one aggregate query; item lists are bounded
+    context = stats.dashboard_content(request.user)
     return render(request, 'tech/dashboard.html', context)
 
 @login_required
@@ -222,7 +251,13 @@ def add_tutorial(request: HttpRequest) -> HttpResponse:
         if form.is_valid():
             tutorial = form.save(commit=False)
             tutorial.author = request.user
-            tutorial.save()
+            if tutorial.image:
+                tutorial.image_status = Tutorial.IMAGE_PENDING
+            # The row and its image job commit together or not at all
+            with transaction.atomic():
+                tutorial.save()
+                if tutorial.image:
+                    tasks.process_image_later(tutorial)
             messages.success(request, 'Tutorial created successfully!')
             return redirect('dashboard')
     else:
@@ -241,7 +276,16 @@ def edit_tutorial(request: HttpRequest, tutorial_id: int) -> HttpResponse:
     if request.method == 'POST':
         form = TutorialForm(request.POST, request.FILES, instance=tutorial)
         if form.is_valid():
-            form.save()
+            tutorial = form.save(commit=False)
+            image_changed = 'image' in form.changed_data and bool(tutorial.image)
+            if image_changed:
+                # Pages show the original image until the worker has made renditions
+                tutorial.image_status = Tutorial.IMAGE_PENDING
+                tutorial.image_renditions = {}
+            with transaction.atomic():
+                tutorial.save()
+                if image_changed:
+                    tasks.process_image_later(tutorial)
             messages.success(request, 'Tutorial updated successfully!')
             return redirect('dashboard')
     else:
@@ -274,6 +318,7 @@ def add_article(request: HttpRequest) -> HttpResponse:
             article = form.save(commit=False)
             article.author = request.user
             article.save()
+            form.save_m2m()
             messages.success(request, 'Article created successfully!')
             return redirect('dashboard')
     else:
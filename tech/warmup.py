@@ -0,0 +1,64 @@
+"""
+Compiling templates ahead of the first request.
+
+With the cached template loader each worker parses a template the first
+time it is rendered and reuses the compiled tree afterwards, so the first
+visitor to every page after a deploy pays for parsing it. ``warm_templates``
+compiles every template under ``templates/tech/`` and the templates they
+extend in the current process; ``techblog.wsgi`` calls it at worker start
+when ``TECH_WARM_TEMPLATES`` is on, along with ``tech.assets.load_manifest``,
+and ``manage.py warm_templates`` runs it as a deploy check that every
+template still compiles.
+"""
+import os
+import time
+from typing import Any
+
+from django.conf import settings
+from django.template import engines
+from django.template.loader_tags import ExtendsNode
+from django.template.utils import get_app_template_dirs
+
+
+def warm_on_startup() -> bool:
+    return bool(getattr(settings, 'TECH_WARM_TEMPLATES', False))
+
+
+def template_names(prefix: str = 'tech') -> list[str]:
+    """Names of the templates in every template directory's ``prefix`` folder"""
+    engine = engines['django'].engine  # type: ignore[attr-defined]
+    directories = [*engine.dirs, *(get_app_template_dirs('templates') if engine.app_dirs else ())]
+    names: set[str] = set()
+    for directory in directories:
+        root = os.path.join(directory, prefix)
+        for path, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith(('.html', '.txt')):
+                    names.add(os.path.relpath(os.path.join(path, filename), directory).replace(os.sep, '/'))
+    return sorted(names)
+
+
+def _parent_name(template: Any) -> str:
+    """The literal name a compiled template extends, if any"""
+    for node in template.nodelist:
+        if isinstance(node, ExtendsNode) and node.parent_name.var and isinstance(node.parent_name.var, str):
+            return node.parent_name.var
+    return ''
+
+
+def warm_templates(prefix: str = 'tech') -> dict[str, float]:
+    """Compile the templates under ``prefix`` and their parents; maps each name to seconds taken"""
+    engine = engines['django'].engine  # type: ignore[attr-defined]
+    timings: dict[str, float] = {}
+    pending = template_names(prefix)
+    while pending:
+        name = pending.pop(0)
+        if name in timings:
+            continue
+        started = time.perf_counter()
+        template = engine.get_template(name)
+        timings[name] = time.perf_counter() - started
+        parent = _parent_name(template)
+        if parent and parent not in timings:
+            pending.append(parent)
+    return timings
@@ -14,3 +14,12 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'techblog.settings')
 
 application = get_asgi_application()
+
+# Parse templates and read the static manifest now rather than on the
+# first request each page gets
+from tech.assets import load_manifest  # noqa: E402
+from tech.warmup import warm_on_startup, warm_templates  # noqa: E402
+
+if warm_on_startup():
+    warm_templates()
+    load_manifest()
@@ -47,6 +47,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Outside SessionMiddleware so session writes also pin to the primary
+    'tech.routing.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -86,6 +88,56 @@ DATABASES = {
     }
 }
 
+# Read replicas: TECHBLOG_SQLITE_REPLICAS lists SQLite files (relative to
+# BASE_DIR) that `manage.py sync_sqlite_replicas` copies the primary into, to
+# try replica routing locally. Tests use the default database for them.
+for _number, _name in enumerate(filter(None, os.environ.get('TECHBLOG_SQLITE_REPLICAS', '').split(',')), 1):
+    DATABASES[f'replica{_number}'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / _name.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['tech.routing.ReplicaRouter']
+
+# Aliases in DATABASES that the public list and detail pages read from
+# (see tech.routing); empty sends every query to 'default'
+TECH_DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith('replica')]
+
+# Seconds a browser reads from the primary after a request of theirs wrote
+TECH_REPLICA_PIN_SECONDS = 10
+
+# Seconds before a replica that could not be connected to is tried again
+TECH_REPLICA_RETRY_SECONDS = 30
+
+# Longest a page rendered from a replica stays in the page cache
+TECH_REPLICA_PAGE_CACHE_TIMEOUT = 60
+
+# PRAGMA name -> value run on every new SQLite connection (see tech.database);
+# empty keeps SQLite's defaults, settings_production enables WAL
+TECH_SQLITE_PRAGMAS = {}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# TECHBLOG_CACHE_BACKEND selects local memory (default), file-based or a
+# Redis-compatible server; TECHBLOG_CACHE_LOCATION overrides where it lives.
+
+_CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'techblog'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', '/var/tmp/techblog_cache'),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379/1'),
+}
+_cache_backend, _cache_location = _CACHE_BACKENDS[os.environ.get('TECHBLOG_CACHE_BACKEND', 'locmem')]
+
+CACHES = {
+    'default': {
+        'BACKEND': _cache_backend,
+        'LOCATION': os.environ.get('TECHBLOG_CACHE_LOCATION', _cache_location),
+        'KEY_PREFIX': 'techblog',
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -127,11 +179,68 @@ STATICFILES_DIRS = [
 ]
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# Static files concatenated into one minified file each by collectstatic when
+# the staticfiles storage is tech.assets.AssetStorage; templates include them
+# with {% asset_bundle %}
+TECH_ASSET_BUNDLES = {
+    'css/site.css': ['css/style.css', 'css/highlight.css'],
+    'js/site.js': ['js/script.js', 'js/animation-test.js'],
+}
+
+# Extra class names `manage.py vendor_assets` keeps in the vendored Bootstrap
+# and Font Awesome CSS, for classes only ever built at runtime (see tech.vendor)
+TECH_VENDOR_SAFELIST = []
+
 # Media files (Uploaded files)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Serve STATIC_ROOT and MEDIA_ROOT from the WSGI application itself, with
+# precompressed variants, byte ranges and cache headers (see tech.serving)
+TECH_SERVE_FILES = False
+
+# Cache lifetime in seconds of served files without a content hash in their name
+TECH_FILE_MAX_AGE = 3600
+
+# Age in seconds after which dedupe_media removes content-addressed images that
+# no tutorial references (left behind by uploads whose transaction rolled back)
+TECH_MEDIA_ORPHAN_AGE = 3600
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
-DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
\ No newline at end of file
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# TechBlog app settings
+
+# Maximum number of ranked hits a search query returns
+TECH_SEARCH_MAX_RESULTS = 500
+
+# Use keyset (cursor) pagination on the tutorials, articles and snippets lists
+TECH_CURSOR_PAGINATION = False
+
+# Cache public list and detail pages for anonymous visitors (seconds)
+TECH_PAGE_CACHE_ENABLED = True
+TECH_PAGE_CACHE_TIMEOUT = 600
+
+# Cache template fragments (site chrome, listing cards) for every visitor
+# (seconds) and count hits and misses (python manage.py fragment_cache_stats)
+TECH_FRAGMENT_CACHE_TIMEOUT = 3600
+TECH_FRAGMENT_CACHE_STATS = True
+
+# Background job queue (python manage.py run_jobs): attempts per job, base
+# retry delay in seconds (doubled per attempt) and how long a running job may
+# hold its lock before another worker picks it up again
+TECH_JOBS_MAX_ATTEMPTS = 3
+TECH_JOBS_RETRY_DELAY = 30
+TECH_JOBS_LOCK_TIMEOUT = 600
+
+# Related tutorials and articles (python manage.py rebuild_related): items
+# kept per page and how long a refresh waits for more edits (seconds)
+TECH_RELATED_COUNT = 4
+TECH_RELATED_DELAY = 10
+
+# Compile the tech templates when a WSGI/ASGI worker starts
+# (techblog.settings_production turns this on)
+TECH_WARM_TEMPLATES = False
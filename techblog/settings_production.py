@@ -0,0 +1,109 @@
+"""
+Production settings for techblog.
+
+Select with DJANGO_SETTINGS_MODULE=techblog.settings_production. Everything
+not overridden here comes from ``techblog.settings``.
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+from .settings import _CACHE_BACKENDS, CACHES, DATABASES, TEMPLATES
+
+DEBUG = False
+
+SECRET_KEY = os.environ['DJANGO_SECRET_KEY']
+
+ALLOWED_HOSTS = [host for host in os.environ.get('TECHBLOG_ALLOWED_HOSTS', '').split(',') if host]
+
+
+# Database
+# Keep connections (to the primary and any replicas) open between requests,
+# checked before reuse; wait up to 20s for a lock instead of failing, and
+# take the write lock when a transaction begins: a deferred transaction that
+# reads and then writes cannot wait for the lock and fails with "database is
+# locked" at once.
+
+DATABASES = {
+    alias: {
+        **database,
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            **database.get('OPTIONS', {}),
+            'timeout': 20,
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+    for alias, database in DATABASES.items()
+}
+
+# Write-ahead logging lets readers run alongside the single writer;
+# synchronous=NORMAL is durable under WAL except on power loss, a 64 MB page
+# cache and 256 MB memory map keep hot pages out of read() calls
+TECH_SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'cache_size': -64000,
+    'mmap_size': 268435456,
+    'temp_store': 'memory',
+}
+
+
+# Cache
+# Page-cache version counters, fragments and fragment stats must be shared
+# by every WSGI worker and the run_jobs process, or an edit only expires the
+# pages of the process that saw it. Default to the file-based cache, which
+# suits a single box; use TECHBLOG_CACHE_BACKEND=redis across several.
+# ``manage.py check --deploy`` refuses a per-process backend (tech.checks).
+
+_cache_backend, _cache_location = _CACHE_BACKENDS[os.environ.get('TECHBLOG_CACHE_BACKEND', 'file')]
+
+CACHES = {
+    'default': {
+        **CACHES['default'],
+        'BACKEND': _cache_backend,
+        'LOCATION': os.environ.get('TECHBLOG_CACHE_LOCATION', _cache_location),
+    }
+}
+
+
+# Templates
+# Parse each template once per worker and keep the compiled tree; loaders
+# must be listed explicitly (with APP_DIRS off) to wrap them in the cached
+# loader. The debug context processor is dropped along with DEBUG.
+
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        'APP_DIRS': False,
+        'OPTIONS': {
+            **TEMPLATES[0]['OPTIONS'],
+            'context_processors': [
+                processor for processor in TEMPLATES[0]['OPTIONS']['context_processors']
+                if processor != 'django.template.context_processors.debug'
+            ],
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
+        },
+    },
+]
+
+# Compile every tech template when a worker starts (see tech.warmup)
+TECH_WARM_TEMPLATES = True
+
+
+# Static files
+# collectstatic bundles, minifies, hashes and precompresses (see tech.assets)
+
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'tech.assets.AssetStorage'},
+}
+
+# Serve static and media files from the WSGI workers; no separate web server
+TECH_SERVE_FILES = True
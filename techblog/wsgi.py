@@ -14,3 +14,18 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'techblog.settings')
 
 application = get_wsgi_application()
+
+# Answer static and media requests before they reach Django (see tech.serving)
+from tech.serving import FileServer, serve_files  # noqa: E402
+
+if serve_files():
+    application = FileServer(application)
+
+# Parse templates and read the static manifest now rather than on the
+# first request each page gets
+from tech.assets import load_manifest  # noqa: E402
+from tech.warmup import warm_on_startup, warm_templates  # noqa: E402
+
+if warm_on_startup():
+    warm_templates()
+    load_manifest()
@@ -9,7 +9,7 @@ from tech.models import Article
 
 def test_article_content():
     """Test to check what content is actually stored in articles"""
-    articles = Article.objects.all()
+    articles = Article.objects.select_related('author').prefetch_related('tags')
     print(f"Found {articles.count()} articles")
     
     for article in articles:
@@ -17,7 +17,7 @@ def test_article_content():
         print(f"ID: {article.id}")
         print(f"Content length: {len(article.content) if article.content else 0}")
         print(f"Content preview: {article.content[:200] if article.content else 'None'}")
-        print(f"Tags: {article.tags}")
+        print(f"Tags: {' '.join(tag.name for tag in article.tags.all())}")
         print(f"Author: {article.author.username}")
         print("-" * 40)
 
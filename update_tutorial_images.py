@@ -1,8 +1,6 @@
 import os
 import django
-import requests
-from io import BytesIO
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.base import ContentFile
 from typing import TYPE_CHECKING, Optional, Any
 
 # Add type checking imports
@@ -15,27 +13,8 @@ django.setup()
 
 from django.contrib.auth.models import User
 from tech.models import Tutorial
-from django.utils import timezone
-
-def download_image(url: str) -> Optional[InMemoryUploadedFile]:
-    """Download image from URL and return as InMemoryUploadedFile"""
-    try:
-        # Type ignore for unknown response type
-        response: Any = requests.get(url, timeout=10)  # type: ignore
-        if response.status_code == 200:  # type: ignore
-            image_io = BytesIO(response.content)
-            image_io.seek(0)
-            return InMemoryUploadedFile(
-                image_io,
-                None,
-                f"tutorial_image_{int(timezone.now().timestamp())}.jpg",
-                'image/jpeg',
-                len(response.content),  # type: ignore
-                None
-            )
-    except Exception as e:
-        print(f"Error downloading image: {e}")
-    return None
+from tech.fetcher import Fetcher
+from tech import tasks
 
 def update_tutorial_images() -> None:
     # Image URLs for tutorials
@@ -52,8 +31,14 @@ def update_tutorial_images() -> None:
     
     # Get all tutorials
     # Type ignore for unknown queryset type
-    tutorials = Tutorial.objects.all()  # type: ignore
+    tutorials = list(Tutorial.objects.all())  # type: ignore
     updated_count = 0
+
+    # Download the images for tutorials without one concurrently, before saving
+    with Fetcher() as fetcher:
+        downloads = fetcher.fetch_all(
+            image_urls[i % len(image_urls)] for i, tutorial in enumerate(tutorials) if not tutorial.image
+        )
     
     # Type the tutorial variable for better type checking
     tutorial: Tutorial
@@ -62,12 +47,14 @@ def update_tutorial_images() -> None:
         # Only update tutorials that don't have images
         if not tutorial.image:
             image_url = image_urls[i % len(image_urls)]
-            image = download_image(image_url)
-            if image:
+            content = downloads.get(image_url)
+            if content is not None:
                 # Assign the image directly to the field and save
-                tutorial.image = image
+                tutorial.image = ContentFile(content, name='tutorial_image.jpg')
+                tutorial.image_status = Tutorial.IMAGE_PENDING
                 # Type ignore for unknown save method
                 tutorial.save()  # type: ignore
+                tasks.process_image_later(tutorial)
                 
                 # Type ignore for unknown title attribute
                 print(f"Updated image for tutorial: {tutorial.title}")  # type: ignore